@@ -2,6 +2,8 @@
 
 from src.database.db_user import initialize_db_user
 from src.database.db_product import initialize_db_product
+from src.database.connection_profile import DatabaseMaintenance
+from src import constants
 from src.models.model_product import MiscProductModel, REProductModel, RETemplateModel
 from src.models.model_user import (
     UserModel,
@@ -35,13 +37,19 @@ class Application:
             raise Exception("Initialize product database failed!")
         if not initialize_db_user():
             raise Exception("Initialize user database failed!")
+        self.db_maintenance = DatabaseMaintenance(
+            [constants.CONNECTION_DB_USER, constants.CONNECTION_DB_PRODUCT]
+        )
         self.user_model = UserModel()
         self.user_setting_udd_model = UserSettingUDDModel()
         self.user_setting_proxy_model = UserSettingProxyModel()
         self.listed_product_model = ListedProductModel()
         self.user_action_model = UserActionModel()
 
-        self.user_service = UserService(self.user_model)
+        self.listed_product_service = ListedProductService(self.listed_product_model)
+        self.user_service = UserService(
+            self.user_model, listed_product_service=self.listed_product_service
+        )
         self.user_action_service = UserActionService(self.user_action_model)
         self.user_setting_proxy_service = UserSettingProxyService(
             self.user_setting_proxy_model
@@ -49,7 +57,6 @@ class Application:
         self.user_setting_udd_service = UserSettingUDDService(
             self.user_setting_udd_model
         )
-        self.listed_product_service = ListedProductService(self.listed_product_model)
 
         self.user_controller = UserController(self.user_service)
         self.user_action_controller = UserActionController(self.user_action_service)
@@ -4,6 +4,10 @@ CONNECTION_DB_PRODUCT = "CONNECTION_DB_PRODUCT"
 
 PATH_DB_USER = "./src/repositories/db/db_user.db"
 PATH_DB_PRODUCT = "./src/repositories/db/db_product.db"
+PATH_DB_PROFILE = "./src/repositories/db/db_profile.json"
+
+# Rows the user table loads up front and per scroll-triggered fetchMore().
+USER_MODEL_PAGE_SIZE = 500
 
 TABLE_USER = "TABLE_USER"
 TABLE_RE_PRODUCT = "TABLE_RE_PRODUCT"
@@ -13,3 +17,11 @@ TABLE_ROBOT_ACTION = "TABLE_ROBOT_ACTION"
 TABLE_MISC_PRODUCT = "TABLE_MISC_PRODUCT"
 TABLE_USER_SETTING_UDD = "TABLE_USER_SETTING_UDD"
 TABLE_USER_SETTING_PROXY = "TABLE_USER_SETTING_PROXY"
+TABLE_CHECK_LIVE_CACHE = "TABLE_CHECK_LIVE_CACHE"
+
+# Seconds a check-live result is reused before the uid is checked again.
+CHECK_LIVE_CACHE_TTL_S = 6 * 60 * 60
+# Check-live engine: "curl" (pycurl CurlMulti thread) or "asyncio".
+CHECK_LIVE_ENGINE = "curl"
+# Where browser tasks run: "process" (worker processes) or "thread" (GUI process).
+ROBOT_BACKEND = "process"
@@ -41,21 +41,19 @@ class RobotController(BaseController):
         if not proxies:
             return False
         tasks: List[RobotTaskType] = []
-        for record_id in record_ids:
-            user_info = self.service.read(record_id)
-            if user_info:
-                task = RobotTaskType(
-                    user_info=user_info,
-                    udd=os.path.join(
-                        udd_container,
-                        str(user_info.id),
-                    ),
-                    headless=headless,
-                    is_mobile=is_mobile,
-                    action_name="launch_browser",
-                    action_payload={"url": "http://httpbin.org/ip"},
-                )
-                tasks.append(task)
+        for user_info in self.service.read_many(record_ids):
+            task = RobotTaskType(
+                user_info=user_info,
+                udd=os.path.join(
+                    udd_container,
+                    str(user_info.id),
+                ),
+                headless=headless,
+                is_mobile=is_mobile,
+                action_name="launch_browser",
+                action_payload={"url": "http://httpbin.org/ip"},
+            )
+            tasks.append(task)
         if (
             self._current_task_progress
             and not self._current_task_progress.check_if_done()
@@ -68,21 +66,30 @@ class RobotController(BaseController):
             print(
                 f"[{self.__class__.__name__}.handle_launch_browser] Starting new launch browser tasks."
             )
-            self._current_task_progress = RobotService(self)
+            if self._current_task_progress is None:
+                # Kept across runs so its Playwright drivers stay warm.
+                self._current_task_progress = RobotService(self)
+                self._current_task_progress.task_succeeded_signal.connect(
+                    self.on_task_succeeded
+                )
+                self._current_task_progress.task_failed_signal.connect(
+                    self.on_task_failed
+                )
+                self._current_task_progress.all_task_finished.connect(
+                    self.on_tasks_finished
+                )
             self._current_task_progress.set_max_worker(len(record_ids))
-            self._current_task_progress.task_succeeded_signal.connect(
-                self.on_task_succeeded
-            )
-            self._current_task_progress.task_failed_signal.connect(self.on_task_failed)
-            self._current_task_progress.all_task_finished.connect(
-                self.on_tasks_finished
-            )
 
             self._current_task_progress.add_tasks(
                 tasks,
                 proxies,
             )
 
+    def shutdown(self):
+        """Stops the robot's browser backend; called when the app closes."""
+        if self._current_task_progress is not None:
+            self._current_task_progress.shutdown()
+
     @pyqtSlot(RobotTaskType)
     def on_task_succeeded(self, task: RobotTaskType):
         pass
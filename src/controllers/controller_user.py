@@ -118,12 +118,24 @@ class UserController(BaseController):
         password = "".join(secrets.choice(alphabet) for i in range(30))
         return password
 
-    def handle_check_users(self, selected_ids: List[int]) -> bool:
-        list_uid = self.service.get_uids_by_record_ids(selected_ids)
-        if not list_uid:
+    def handle_check_users(self, selected_ids: List[int], force: bool = False) -> bool:
+        users = self.service.read_many(selected_ids)
+        if not users:
             # TODO emit message
             return True
-        tasks = list(zip(selected_ids, list_uid))
+        cached, tasks = self.service.check_live_cache.split_fresh(
+            [(user.id, user.uid) for user in users], force
+        )
+        for record_id, uid, result in cached:
+            print(f"{record_id} - {uid} : {result.is_live} (cached)")
+            self.service.queue_status(record_id, 1 if result.is_live else 0)
+        if not tasks:
+            self.check_live_all_tasks_finished()
+            return True
+        if cached:
+            print(
+                f"[{self.__class__.__name__}.handleCheckUsersRequest] {len(cached)} user(s) checked recently, skipped."
+            )
 
         if (
             self._current_check_live_process
@@ -151,10 +163,19 @@ class UserController(BaseController):
 
             self._current_check_live_process.add_tasks(tasks)
 
+    def shutdown(self):
+        """Stops the running check-live batch; called when the app closes."""
+        if self._current_check_live_process is not None:
+            self._current_check_live_process.stop()
+
     @pyqtSlot(int, str, bool)
     def _on_check_live_task_succeeded(self, record_id: int, uid: str, is_live: bool):
         print(f"{record_id} - {uid} : {is_live}")
-        self.service.update_status(record_id, 1 if is_live else 0)
+        self.service.queue_status(record_id, 1 if is_live else 0)
+        status_code = None
+        if self._current_check_live_process is not None:
+            status_code = self._current_check_live_process.get_status_code(record_id)
+        self.service.check_live_cache.record(uid, is_live, status_code)
 
     @pyqtSlot(int, str, str)
     def _on_check_live_task_failed(self, record_id: int, uid: str, error_message: str):
@@ -165,6 +186,8 @@ class UserController(BaseController):
 
     @pyqtSlot()
     def check_live_all_tasks_finished(self):
+        self.service.flush_status()
+        self.service.check_live_cache.flush()
         self.operation_success_signal.emit("User active status check completed.")
 
 
@@ -0,0 +1,91 @@
+# src/database/connection_manager.py
+import itertools
+import threading
+from typing import Dict
+
+from PyQt6.QtCore import QCoreApplication, QThread, Qt
+from PyQt6.QtSql import QSqlDatabase
+
+from src.database.connection_profile import apply_connection_profile
+
+_clone_ids = itertools.count()
+_local = threading.local()
+
+
+class _ThreadClones:
+    """The clones opened by one thread, kept in its thread-local storage. Python
+    drops that storage when the thread ends, which closes the clones even on plain
+    `threading` threads that have no QThread.finished signal."""
+
+    def __init__(self):
+        self.clone_names: Dict[str, str] = {}
+
+    def release(self):
+        clone_names = list(self.clone_names.values())
+        self.clone_names.clear()
+        for clone_name in clone_names:
+            db = QSqlDatabase.database(clone_name, open=False)
+            if db.isValid():
+                db.close()
+            del db
+            QSqlDatabase.removeDatabase(clone_name)
+
+    def __del__(self):
+        self.release()
+
+
+def _is_main_thread() -> bool:
+    app = QCoreApplication.instance()
+    if app is None:
+        return threading.current_thread() is threading.main_thread()
+    return QThread.currentThread() == app.thread()
+
+
+def thread_database(connection_name: str) -> QSqlDatabase:
+    """
+    Returns a connection to the same database as `connection_name` that may be used
+    from the calling thread.
+
+    QSqlDatabase connections can only be used by the thread that opened them. The GUI
+    thread gets the named connection itself; any other thread (e.g. a QThreadPool
+    worker) gets its own clone, opened with the active connection profile. Under WAL
+    the clones read and write concurrently with the GUI connection. A thread's clones
+    are closed when the thread finishes (a QThread's `finished`, or the end of a
+    `threading` thread), or explicitly with `release_thread_databases`.
+
+    Raises:
+        Exception: If the clone cannot be opened.
+    """
+    if _is_main_thread():
+        return QSqlDatabase.database(connection_name)
+
+    clones = getattr(_local, "clones", None)
+    if clones is None:
+        clones = _local.clones = _ThreadClones()
+        thread = QThread.currentThread()
+        if thread is not None:
+            thread.finished.connect(
+                release_thread_databases, Qt.ConnectionType.DirectConnection
+            )
+    clone_name = clones.clone_names.get(connection_name)
+    if clone_name is not None and QSqlDatabase.contains(clone_name):
+        return QSqlDatabase.database(clone_name)
+
+    # Unique per clone, so a thread that reuses a finished thread's ident never
+    # picks up that thread's connection.
+    clone_name = f"{connection_name}@{threading.get_ident()}-{next(_clone_ids)}"
+    db = QSqlDatabase.cloneDatabase(connection_name, clone_name)
+    if not db.open():
+        error_msg = f"[{thread_database.__name__}] Cannot open '{clone_name}': {db.lastError().text()}"
+        QSqlDatabase.removeDatabase(clone_name)
+        raise Exception(error_msg)
+    apply_connection_profile(db)
+    clones.clone_names[connection_name] = clone_name
+    return db
+
+
+def release_thread_databases():
+    """Closes and removes every clone opened by the calling thread."""
+    clones = getattr(_local, "clones", None)
+    if clones is not None:
+        clones.release()
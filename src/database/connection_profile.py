@@ -0,0 +1,150 @@
+# src/database/connection_profile.py
+import json
+import os
+from dataclasses import dataclass, fields
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src import constants
+
+
+@dataclass
+class ConnectionProfile:
+    """
+    SQLite settings applied to every connection.
+
+    Override per deployment with a JSON object in `constants.PATH_DB_PROFILE`,
+    e.g. {"cache_size_kib": 131072, "mmap_size_bytes": 1073741824}.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    foreign_keys: bool = True
+    # Lets INSERT OR REPLACE fire DELETE triggers, which keep the FTS indexes in sync.
+    recursive_triggers: bool = True
+    cache_size_kib: int = 65536
+    mmap_size_bytes: int = 268435456
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    # How often wal_checkpoint(TRUNCATE) and optimize run; 0 disables it.
+    maintenance_interval_ms: int = 600000
+
+    def pragmas(self) -> List[str]:
+        return [
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'};",
+            f"PRAGMA recursive_triggers = {'ON' if self.recursive_triggers else 'OFF'};",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)};",
+            f"PRAGMA journal_mode = {self.journal_mode};",
+            f"PRAGMA synchronous = {self.synchronous};",
+            f"PRAGMA cache_size = {-int(self.cache_size_kib)};",
+            f"PRAGMA mmap_size = {int(self.mmap_size_bytes)};",
+            f"PRAGMA temp_store = {self.temp_store};",
+        ]
+
+
+_active_profile: Optional[ConnectionProfile] = None
+
+
+def load_connection_profile(path: Optional[str] = None) -> ConnectionProfile:
+    """Reads the deployment's profile overrides once and returns the active profile."""
+    global _active_profile
+    if _active_profile is not None and path is None:
+        return _active_profile
+    path = path or constants.PATH_DB_PROFILE
+    overrides = {}
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                overrides = json.load(f)
+        except (OSError, ValueError) as e:
+            print(
+                f"[{load_connection_profile.__name__}] Warning: cannot read '{path}': {e}. Using defaults."
+            )
+    known_fields = {f.name for f in fields(ConnectionProfile)}
+    for key in set(overrides) - known_fields:
+        print(
+            f"[{load_connection_profile.__name__}] Warning: unknown profile setting '{key}' ignored."
+        )
+    _active_profile = ConnectionProfile(
+        **{key: value for key, value in overrides.items() if key in known_fields}
+    )
+    return _active_profile
+
+
+def apply_connection_profile(
+    db: QSqlDatabase, profile: Optional[ConnectionProfile] = None
+) -> bool:
+    """Runs the profile's PRAGMAs on an open connection."""
+    profile = profile or load_connection_profile()
+    query = QSqlQuery(db)
+    succeeded = True
+    for pragma in profile.pragmas():
+        if not query.exec(pragma):
+            print(
+                f"[{apply_connection_profile.__name__}] Warning: '{pragma}' failed on '{db.connectionName()}': {query.lastError().text()}"
+            )
+            succeeded = False
+    query.finish()
+    return succeeded
+
+
+def open_database(connection_name: str, path: str) -> QSqlDatabase:
+    """
+    Opens (or reuses) the named QSQLITE connection to `path` and applies the
+    active connection profile.
+
+    Raises:
+        Exception: If the database cannot be opened.
+    """
+    if QSqlDatabase.contains(connection_name):
+        db = QSqlDatabase.database(connection_name)
+    else:
+        db = QSqlDatabase.addDatabase("QSQLITE", connection_name)
+    db.setDatabaseName(path)
+    if not db.open():
+        raise Exception(
+            f"An error occurred while opening the database: {db.lastError().text()}"
+        )
+    apply_connection_profile(db)
+    return db
+
+
+def run_maintenance(db: QSqlDatabase) -> bool:
+    """Truncates the WAL file and lets SQLite refresh its query planner statistics."""
+    query = QSqlQuery(db)
+    succeeded = True
+    for pragma in ["PRAGMA wal_checkpoint(TRUNCATE);", "PRAGMA optimize;"]:
+        if not query.exec(pragma):
+            print(
+                f"[{run_maintenance.__name__}] Warning: '{pragma}' failed on '{db.connectionName()}': {query.lastError().text()}"
+            )
+            succeeded = False
+    query.finish()
+    return succeeded
+
+
+class DatabaseMaintenance(QObject):
+    """Runs `run_maintenance` on the given connections every maintenance interval."""
+
+    def __init__(
+        self,
+        connection_names: List[str],
+        profile: Optional[ConnectionProfile] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.connection_names = connection_names
+        self.profile = profile or load_connection_profile()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.run)
+        if self.profile.maintenance_interval_ms > 0:
+            self.timer.start(self.profile.maintenance_interval_ms)
+
+    @pyqtSlot()
+    def run(self):
+        for connection_name in self.connection_names:
+            db = QSqlDatabase.database(connection_name, open=False)
+            if db.isValid() and db.isOpen():
+                run_maintenance(db)
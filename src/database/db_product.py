@@ -1,7 +1,8 @@
 # db_product.py
-from PyQt6.QtSql import QSqlDatabase, QSqlQuery
-
 from src import constants
+from src.database.connection_profile import open_database
+from src.database.fts import create_fts_statements
+from src.database.migrations import run_migrations
 
 SQL_CREATE_RE_PRODUCT = f"""
 CREATE TABLE IF NOT EXISTS {constants.TABLE_RE_PRODUCT} (
@@ -49,38 +50,32 @@ CREATE TABLE IF NOT EXISTS {constants.TABLE_RE_TEMPLATE} (
 )
 """
 
+SQL_CREATE_PRODUCT_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS idx_re_product_location ON {constants.TABLE_RE_PRODUCT} (province, district, ward)",
+    f"CREATE INDEX IF NOT EXISTS idx_re_product_ward ON {constants.TABLE_RE_PRODUCT} (ward)",
+    f"CREATE INDEX IF NOT EXISTS idx_re_product_category ON {constants.TABLE_RE_PRODUCT} (category)",
+    f"CREATE INDEX IF NOT EXISTS idx_re_product_price ON {constants.TABLE_RE_PRODUCT} (price)",
+]
 
-def initialize_db_product():
-    if QSqlDatabase.contains(constants.CONNECTION_DB_PRODUCT):
-        db = QSqlDatabase.database(constants.CONNECTION_DB_PRODUCT)
-    else:
-        db = QSqlDatabase.addDatabase("QSQLITE", constants.CONNECTION_DB_PRODUCT)
-    db.setDatabaseName(constants.PATH_DB_PRODUCT)
-    if not db.open():
-        raise Exception(
-            f"An error occurred while opening the database: {db.lastError().text()}"
-        )
-    query = QSqlQuery(db)
-    query.exec("PRAGMA foreign_keys = ON;")
-    query.exec("PRAGMA journal_mode = WAL;")
+# Text columns searchable through SearchService.
+RE_PRODUCT_FTS_COLUMNS = ("pid", "street", "function", "furniture", "description")
+MISC_PRODUCT_FTS_COLUMNS = ("pid", "title", "description")
+
+# PRODUCT_MIGRATIONS[i] upgrades the schema from version i to i + 1 (PRAGMA user_version).
+# Version 1 is the original schema; its CREATE TABLE IF NOT EXISTS statements are
+# no-ops on databases created before migrations existed. Only append new steps.
+PRODUCT_MIGRATIONS = [
+    [
+        SQL_CREATE_RE_PRODUCT,
+        SQL_CREATE_RE_TEMPLATE,
+        SQL_CREATE_MISC_PRODUCT,
+    ],
+    SQL_CREATE_PRODUCT_INDEXES,
+    create_fts_statements(constants.TABLE_RE_PRODUCT, RE_PRODUCT_FTS_COLUMNS)
+    + create_fts_statements(constants.TABLE_MISC_PRODUCT, MISC_PRODUCT_FTS_COLUMNS),
+]
 
-    try:
-        if db.transaction():
-            for sql in [
-                SQL_CREATE_RE_PRODUCT,
-                SQL_CREATE_RE_TEMPLATE,
-                SQL_CREATE_MISC_PRODUCT,
-            ]:
-                if not query.exec(sql):
-                    error_msg = f"[initialize_db_product] An error occurred while creating table: {query.lastError().text()}"
-                    db.rollback()
-                    raise Exception(error_msg)
-            if not db.commit():
-                error_msg = f"[initialize_db_product] Cannot commit transaction: {db.lastError().text()}"
-                db.rollback()
-                raise Exception(error_msg)
-            return True
-        else:
-            return False
-    except Exception as e:
-        raise e
+
+def initialize_db_product():
+    db = open_database(constants.CONNECTION_DB_PRODUCT, constants.PATH_DB_PRODUCT)
+    return run_migrations(db, PRODUCT_MIGRATIONS)
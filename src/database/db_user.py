@@ -1,7 +1,8 @@
 # src/database/db_user.py
-from PyQt6.QtSql import QSqlDatabase, QSqlQuery
-
 from src import constants
+from src.database.connection_profile import open_database
+from src.database.fts import create_fts_statements
+from src.database.migrations import run_migrations
 
 SQL_CREATE_USER_TABLE = f"""
 CREATE TABLE IF NOT EXISTS {constants.TABLE_USER} (
@@ -59,41 +60,53 @@ updated_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now')),
 created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now'))
 )
 """
+SQL_CREATE_CHECK_LIVE_CACHE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {constants.TABLE_CHECK_LIVE_CACHE} (
+uid TEXT PRIMARY KEY,
+is_live INTEGER NOT NULL,
+http_status INTEGER,
+checked_at REAL NOT NULL
+)
+"""
 
+SQL_CREATE_USER_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS idx_listed_product_user_id ON {constants.TABLE_LISTED_PRODUCT} (user_id)",
+    f"CREATE INDEX IF NOT EXISTS idx_robot_action_uid ON {constants.TABLE_ROBOT_ACTION} (uid)",
+    f"CREATE INDEX IF NOT EXISTS idx_user_status ON {constants.TABLE_USER} (status)",
+    f"CREATE INDEX IF NOT EXISTS idx_user_user_group ON {constants.TABLE_USER} (user_group)",
+    f"CREATE INDEX IF NOT EXISTS idx_user_type ON {constants.TABLE_USER} (type)",
+]
 
-def initialize_db_user():
-    if QSqlDatabase.contains(constants.CONNECTION_DB_USER):
-        db = QSqlDatabase.database(constants.CONNECTION_DB_USER)
-    else:
-        db = QSqlDatabase.addDatabase("QSQLITE", constants.CONNECTION_DB_USER)
-    db.setDatabaseName(constants.PATH_DB_USER)
-    if not db.open():
-        raise Exception(
-            f"An error occurred while opening the database: {db.lastError().text()}"
-        )
-    query = QSqlQuery(db)
-    query.exec("PRAGMA foreign_keys = ON;")
-    query.exec("PRAGMA journal_mode = WAL;")
+# Text columns of TABLE_USER searchable through SearchService.
+USER_FTS_COLUMNS = (
+    "uid",
+    "username",
+    "password",
+    "two_fa",
+    "email",
+    "email_password",
+    "phone_number",
+    "note",
+    "type",
+)
+
+# USER_MIGRATIONS[i] upgrades the schema from version i to i + 1 (PRAGMA user_version).
+# Version 1 is the original schema; its CREATE TABLE IF NOT EXISTS statements are
+# no-ops on databases created before migrations existed. Only append new steps.
+USER_MIGRATIONS = [
+    [
+        SQL_CREATE_LISTED_PRODUCT_TABLE,
+        SQL_CREATE_USER_TABLE,
+        SQL_CREATE_USER_SETTING_UDD_TABLE,
+        SQL_CREATE_USER_SETTING_PROXY_TABLE,
+        SQL_CREATE_ACTION_TABLE,
+    ],
+    SQL_CREATE_USER_INDEXES,
+    create_fts_statements(constants.TABLE_USER, USER_FTS_COLUMNS),
+    [SQL_CREATE_CHECK_LIVE_CACHE_TABLE],
+]
 
-    try:
-        if db.transaction():
-            for sql in [
-                SQL_CREATE_LISTED_PRODUCT_TABLE,
-                SQL_CREATE_USER_TABLE,
-                SQL_CREATE_USER_SETTING_UDD_TABLE,
-                SQL_CREATE_USER_SETTING_PROXY_TABLE,
-                SQL_CREATE_ACTION_TABLE,
-            ]:
-                if not query.exec(sql):
-                    error_msg = f"[initialize_db_user] An error occurred while creating table: {query.lastError().text()}"
-                    db.rollback()
-                    raise Exception(error_msg)
-            if not db.commit():
-                error_msg = f"[initialize_db_user] Cannot commit transaction: {db.lastError().text()}"
-                db.rollback()
-                raise Exception(error_msg)
-            return True
-        else:
-            return False
-    except Exception as e:
-        raise e
+
+def initialize_db_user():
+    db = open_database(constants.CONNECTION_DB_USER, constants.PATH_DB_USER)
+    return run_migrations(db, USER_MIGRATIONS)
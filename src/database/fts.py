@@ -0,0 +1,50 @@
+# src/database/fts.py
+from typing import List, Sequence
+
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}_FTS"
+
+
+def create_fts_statements(table_name: str, columns: Sequence[str]) -> List[str]:
+    """
+    Returns the statements that add an FTS5 index over `columns` of `table_name`.
+
+    The index is an external-content table (`<table>_FTS`, rowid = the table's id),
+    so the text is not stored twice. Triggers keep it in sync with INSERT, DELETE and
+    UPDATEs of the indexed columns, and the final 'rebuild' indexes existing rows.
+    The trigram tokenizer makes MATCH behave like a case-insensitive substring search.
+    """
+    fts_table = fts_table_name(table_name)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+            {column_list},
+            content='{table_name}',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table_name} BEGIN
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table_name} BEGIN
+            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list})
+            VALUES ('delete', old.id, {old_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {table_name} BEGIN
+            INSERT INTO {fts_table} ({fts_table}, rowid, {column_list})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        """,
+        f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')",
+    ]
@@ -0,0 +1,92 @@
+# src/database/migrations.py
+from typing import Any, List, Sequence
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+
+def get_user_version(db: QSqlDatabase) -> int:
+    query = QSqlQuery(db)
+    version = 0
+    if query.exec("PRAGMA user_version;") and query.next():
+        version = int(query.value(0))
+    query.finish()
+    return version
+
+
+def run_migrations(db: QSqlDatabase, migrations: Sequence[Sequence[str]]) -> bool:
+    """
+    Brings the database schema up to date.
+
+    `migrations[i]` holds the statements that move the schema from version i to
+    version i + 1. The current version is kept in `PRAGMA user_version`; every
+    pending migration runs in its own transaction together with the version bump,
+    so a failed migration leaves the database at the previous version.
+
+    Args:
+        db (QSqlDatabase): An open connection.
+        migrations (Sequence[Sequence[str]]): Ordered migration steps.
+
+    Returns:
+        bool: True when the schema is up to date, False if a transaction could not
+        be started.
+
+    Raises:
+        Exception: If a statement or the commit fails (the step is rolled back).
+    """
+    current_version = get_user_version(db)
+    target_version = len(migrations)
+    if current_version > target_version:
+        print(
+            f"[{run_migrations.__name__}] Warning: database '{db.databaseName()}' is at version {current_version}, newer than this build ({target_version})."
+        )
+        return True
+
+    query = QSqlQuery(db)
+    for version in range(current_version, target_version):
+        if not db.transaction():
+            return False
+        for sql in list(migrations[version]) + [
+            f"PRAGMA user_version = {version + 1};"
+        ]:
+            if not query.exec(sql):
+                error_msg = f"[{run_migrations.__name__}] An error occurred while migrating to version {version + 1}: {query.lastError().text()}"
+                db.rollback()
+                raise Exception(error_msg)
+        query.finish()
+        if not db.commit():
+            error_msg = f"[{run_migrations.__name__}] Cannot commit migration to version {version + 1}: {db.lastError().text()}"
+            db.rollback()
+            raise Exception(error_msg)
+        print(
+            f"[{run_migrations.__name__}] Migrated '{db.databaseName()}' to version {version + 1}."
+        )
+    return True
+
+
+def explain_query_plan(
+    db: QSqlDatabase, sql: str, params: Sequence[Any] = ()
+) -> List[str]:
+    """
+    Returns the `detail` lines of `EXPLAIN QUERY PLAN` for a statement, e.g.
+    "SEARCH TABLE_USER USING INDEX idx_user_status (status=?)".
+    """
+    query = QSqlQuery(db)
+    if not query.prepare(f"EXPLAIN QUERY PLAN {sql}"):
+        raise Exception(
+            f"[{explain_query_plan.__name__}] Cannot prepare '{sql}': {query.lastError().text()}"
+        )
+    for param in params:
+        query.addBindValue(param)
+    if not query.exec():
+        raise Exception(
+            f"[{explain_query_plan.__name__}] Cannot explain '{sql}': {query.lastError().text()}"
+        )
+    details = []
+    while query.next():
+        details.append(str(query.value(3)))
+    return details
+
+
+def is_index_backed(plan: List[str]) -> bool:
+    """True when no step of the plan scans a whole table or index."""
+    return bool(plan) and not any(detail.startswith("SCAN") for detail in plan)
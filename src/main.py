@@ -1,4 +1,5 @@
 # src/main.py
+import multiprocessing
 import sys
 from PyQt6.QtWidgets import QApplication
 from src.app import Application
@@ -12,4 +13,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Browser worker processes are spawned; needed when the app is frozen.
+    multiprocessing.freeze_support()
     main()
@@ -1,18 +1,73 @@
 # src/models/base_model.py
-from typing import List, Any
-from PyQt6.QtSql import QSqlTableModel
+from bisect import insort
+from typing import List, Any, Dict, Optional, Tuple
+from PyQt6.QtSql import QSqlQuery, QSqlQueryModel, QSqlTableModel
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
 from PyQt6.QtGui import QBrush, QColor
 
 
 class BaseModel(QSqlTableModel):
-    def __init__(self, table_name, db, parent=None):
+    # Columns (besides "id") that get a value -> rows hash index. They need not
+    # be unique; see find_rows_by_field.
+    INDEXED_FIELDS: Tuple[str, ...] = ()
+    # Minimum rows loaded by select() and by each fetchMore() in windowed mode,
+    # rounded up to Qt's internal batch (255 rows for SQLite). 0 keeps Qt's default.
+    PAGE_SIZE = 0
+
+    def __init__(self, table_name, db, parent=None, page_size: Optional[int] = None):
         super().__init__(parent, db=db)
+        self.page_size = self.PAGE_SIZE if page_size is None else page_size
         self.setTable(table_name)
         self.setEditStrategy(QSqlTableModel.EditStrategy.OnManualSubmit)
         self.status_col = self.fieldIndex("status")
+
+        self._row_indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._indexes_dirty = True
+        self.modelReset.connect(self._invalidate_indexes)
+        self.layoutChanged.connect(self._invalidate_indexes)
+        self.rowsInserted.connect(self._on_rows_inserted)
+        self.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        self.dataChanged.connect(self._on_data_changed)
+
         self.select()
 
+    def select(self) -> bool:
+        if not super().select():
+            return False
+        if self.page_size > 0:
+            self._fetch_until(self.page_size)
+        return True
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if self.page_size <= 0 or parent.isValid():
+            return super().fetchMore(parent)
+        self._fetch_until(self.rowCount() + self.page_size)
+
+    def _fetch_until(self, row_count: int):
+        while self.rowCount() < row_count and super().canFetchMore():
+            super().fetchMore()
+        if not super().canFetchMore() and not self._row_count_matches():
+            # Fetched to the end but holding a different number of rows than
+            # the table: some were loaded twice (or missed). Start over rather
+            # than show them and point the row indexes at the wrong rows.
+            print(
+                f"[{self.__class__.__name__}._fetch_until] Loaded rows do not match the table, reselecting."
+            )
+            if super().select():
+                while self.rowCount() < row_count and super().canFetchMore():
+                    super().fetchMore()
+
+    def is_fully_loaded(self) -> bool:
+        return not self.canFetchMore() and self._row_count_matches()
+
+    def _row_count_matches(self) -> bool:
+        """Whether the fetched rows (without unsubmitted inserts) are as many as
+        the select statement returns."""
+        query = QSqlQuery(self.database())
+        if not query.exec(f"SELECT COUNT(*) FROM ({self.selectStatement()})"):
+            return True
+        return query.next() and QSqlQueryModel.rowCount(self) == query.value(0)
+
     def flags(self, index):
         return (
             Qt.ItemFlag.ItemIsSelectable
@@ -50,13 +105,152 @@ class BaseModel(QSqlTableModel):
         return ids
 
     def get_row_by_id(self, db_id: Any) -> int:
-        id_col_index = self.fieldIndex("id")
-        if id_col_index == -1:
+        if self.fieldIndex("id") == -1:
             print("[BaseModel] 'id' field not found for search.")
             return -1
+        return self._lookup_row("id", db_id)
+
+    def find_row_by_field(self, field_name: str, value: Any) -> int:
+        """
+        Get the row holding `value` in an indexed column.
+
+        Args:
+            field_name (str): Column name, must be "id" or listed in INDEXED_FIELDS.
+            value (Any): The value to search for.
+
+        Returns:
+            int: The row index, or -1 if no loaded row matches.
+        """
+        if self.fieldIndex(field_name) == -1:
+            print(
+                f"[{self.__class__.__name__}.find_row_by_field] '{field_name}' field not found for search."
+            )
+            return -1
+        if field_name != "id" and field_name not in self.INDEXED_FIELDS:
+            print(
+                f"[{self.__class__.__name__}.find_row_by_field] '{field_name}' is not an indexed field."
+            )
+            return -1
+        return self._lookup_row(field_name, value)
+
+    def find_rows_by_field(self, field_name: str, value: Any) -> List[int]:
+        """
+        Get every row holding `value` in an indexed column.
+
+        Args:
+            field_name (str): Column name, must be "id" or listed in INDEXED_FIELDS.
+            value (Any): The value to search for.
+
+        Returns:
+            List[int]: The row indices in ascending order, [] if no loaded row matches.
+        """
+        if self.fieldIndex(field_name) == -1:
+            print(
+                f"[{self.__class__.__name__}.find_rows_by_field] '{field_name}' field not found for search."
+            )
+            return []
+        if field_name != "id" and field_name not in self.INDEXED_FIELDS:
+            print(
+                f"[{self.__class__.__name__}.find_rows_by_field] '{field_name}' is not an indexed field."
+            )
+            return []
+        return self._lookup_rows(field_name, value)
+
+    # ========================================================================
+    # Row index maintenance
+    # ========================================================================
+    def _indexed_columns(self) -> Dict[str, int]:
+        columns = {}
+        for field_name in ("id",) + tuple(self.INDEXED_FIELDS):
+            col = self.fieldIndex(field_name)
+            if col != -1:
+                columns[field_name] = col
+        return columns
+
+    def _lookup_row(self, field_name: str, value: Any) -> int:
+        rows = self._lookup_rows(field_name, value)
+        return rows[0] if rows else -1
+
+    def _lookup_rows(self, field_name: str, value: Any) -> List[int]:
+        if value is None:
+            return []
+        if self._indexes_dirty:
+            self._rebuild_indexes()
+        index = self._row_indexes.get(field_name)
+        if index is None:
+            return []
+        rows = index.get(value)
+        if not rows:
+            return []
+        # Guard against stale entries left behind by in-place edits.
+        col = self.fieldIndex(field_name)
+        row_count = self.rowCount()
+        valid_rows = []
+        for row in rows:
+            if row < row_count and super().data(self.index(row, col)) == value:
+                valid_rows.append(row)
+        if len(valid_rows) != len(rows):
+            if valid_rows:
+                index[value] = valid_rows
+            else:
+                index.pop(value, None)
+        return valid_rows
+
+    def _rebuild_indexes(self):
+        self._row_indexes = {name: {} for name in self._indexed_columns()}
+        self._indexes_dirty = False
+        self._index_rows(0, self.rowCount() - 1)
+
+    def _index_rows(self, first: int, last: int):
+        # Rows come in ascending order after every row already indexed, so
+        # appending keeps each list sorted.
+        for field_name, col in self._indexed_columns().items():
+            index = self._row_indexes.setdefault(field_name, {})
+            for row in range(first, last + 1):
+                value = super().data(self.index(row, col))
+                if value is not None:
+                    index.setdefault(value, []).append(row)
+
+    def _invalidate_indexes(self):
+        self._indexes_dirty = True
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        if self._indexes_dirty:
+            return
+        if last == self.rowCount() - 1:
+            # Appended rows (insertRow at the end or fetchMore) don't shift
+            # existing rows, so only the new ones need indexing.
+            self._index_rows(first, last)
+        else:
+            self._invalidate_indexes()
+
+    def _on_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int):
+        if self._indexes_dirty:
+            return
+        if last == self.rowCount() - 1:
+            for field_name, col in self._indexed_columns().items():
+                index = self._row_indexes.get(field_name, {})
+                for row in range(first, last + 1):
+                    value = super().data(self.index(row, col))
+                    rows = index.get(value)
+                    if rows and row in rows:
+                        rows.remove(row)
+                        if not rows:
+                            del index[value]
+        else:
+            self._invalidate_indexes()
 
-        for row in range(self.rowCount()):
-            index = self.index(row, id_col_index)
-            if self.data(index) == db_id:
-                return row
-        return -1
+    def _on_data_changed(
+        self, top_left: QModelIndex, bottom_right: QModelIndex, roles=None
+    ):
+        if self._indexes_dirty:
+            return
+        for field_name, col in self._indexed_columns().items():
+            if top_left.column() <= col <= bottom_right.column():
+                index = self._row_indexes.setdefault(field_name, {})
+                for row in range(top_left.row(), bottom_right.row() + 1):
+                    value = super().data(self.index(row, col))
+                    if value is not None:
+                        rows = index.setdefault(value, [])
+                        if row not in rows:
+                            insort(rows, row)
@@ -6,6 +6,7 @@ from src.models.base_model import BaseModel
 
 
 class REProductModel(BaseModel):
+    INDEXED_FIELDS = ("pid",)
 
     def __init__(self, parent=None):
         db = QSqlDatabase.database(constants.CONNECTION_DB_PRODUCT)
@@ -15,19 +16,11 @@ class REProductModel(BaseModel):
         super().__init__(constants.TABLE_RE_PRODUCT, db, parent)
 
     def find_row_by_pid(self, pid: str) -> int:
-        pid_col_index = self.fieldIndex("pid")
-        if pid_col_index == -1:
-            print("[BaseModel] 'pid' field not found for search.")
-            return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, pid_col_index)
-            if self.data(index) == pid:
-                return row
-        return -1
+        return self.find_row_by_field("pid", pid)
 
 
 class MiscProductModel(BaseModel):
+    INDEXED_FIELDS = ("pid",)
 
     def __init__(self, parent=None):
         db = QSqlDatabase.database(constants.CONNECTION_DB_PRODUCT)
@@ -37,19 +30,11 @@ class MiscProductModel(BaseModel):
         super().__init__(constants.TABLE_MISC_PRODUCT, db, parent)
 
     def find_row_by_pid(self, pid: str) -> int:
-        pid_col_index = self.fieldIndex("pid")
-        if pid_col_index == -1:
-            print("[BaseModel] 'pid' field not found for search.")
-            return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, pid_col_index)
-            if self.data(index) == pid:
-                return row
-        return -1
+        return self.find_row_by_field("pid", pid)
 
 
 class RETemplateModel(BaseModel):
+    INDEXED_FIELDS = ("tid",)
 
     def __init__(self, parent=None):
         db = QSqlDatabase.database(constants.CONNECTION_DB_PRODUCT)
@@ -59,13 +44,4 @@ class RETemplateModel(BaseModel):
         super().__init__(constants.TABLE_RE_TEMPLATE, db, parent)
 
     def find_row_by_tid(self, tid: str) -> int:
-        tid_col_index = self.fieldIndex("tid")
-        if tid_col_index == -1:
-            print("[BaseModel] 'tid' field not found for search.")
-            return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, tid_col_index)
-            if self.data(index) == tid:
-                return row
-        return -1
+        return self.find_row_by_field("tid", tid)
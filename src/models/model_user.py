@@ -7,31 +7,22 @@ from typing import List, Optional
 
 
 class UserModel(BaseModel):
+    INDEXED_FIELDS = ("uid",)
+    PAGE_SIZE = constants.USER_MODEL_PAGE_SIZE
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, page_size: Optional[int] = None):
         db = QSqlDatabase.database(constants.CONNECTION_DB_USER)
         if not db.isValid() or not db.isOpen():
             warning_msg = f"Warning: Database connection '{constants.CONNECTION_DB_USER}' is not valid or not open."
             print(warning_msg)
-        super().__init__(constants.TABLE_USER, db, parent)
+        super().__init__(constants.TABLE_USER, db, parent, page_size)
 
     def find_row_by_uid(self, uid: str) -> int:
-        uid_col_index = self.fieldIndex("uid")
-        if uid_col_index == -1:
-            print(
-                f"[{self.__class__.__name__}.find_row_by_uid] 'uid' field not found for search."
-            )
-            return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, uid_col_index)
-            if self.data(index) == uid:
-                return row
-        return -1
+        return self.find_row_by_field("uid", uid)
 
     def get_uids_by_record_ids(self, record_ids: List[int]) -> List[str]:
         """
-        Get the 'uid' values for the given list of record IDs.
+        Get the 'uid' values for the given list of record IDs among the loaded rows.
 
         Args:
             record_ids (List[int]): List of record IDs.
@@ -48,15 +39,15 @@ class UserModel(BaseModel):
             return []
 
         uids = []
-        for row in range(self.rowCount()):
-            id_index = self.index(row, id_col_index)
-            uid_index = self.index(row, uid_col_index)
-            if self.data(id_index) in record_ids:
-                uids.append(self.data(uid_index))
+        for record_id in dict.fromkeys(record_ids):
+            row = self.get_row_by_id(record_id)
+            if row != -1:
+                uids.append(self.data(self.index(row, uid_col_index)))
         return uids
 
 
 class ListedProductModel(BaseModel):
+    INDEXED_FIELDS = ("user_id",)
 
     def __init__(self, parent=None):
         db = QSqlDatabase.database(constants.CONNECTION_DB_USER)
@@ -65,29 +56,18 @@ class ListedProductModel(BaseModel):
             print(warning_msg)
         super().__init__(constants.TABLE_LISTED_PRODUCT, db, parent)
 
-    def get_rows_by_user_id(self, user_id: int) -> Optional[int]:
+    def get_rows_by_user_id(self, user_id: int) -> List[int]:
         """
         Get all rows in the model where the "user_id" field matches the given user_id.
 
         Args:
-            user_id (str): The user ID to search for.
+            user_id (int): The user ID to search for.
 
         Returns:
-            Optional[int]: A list of row indices where the "user_id" matches the given value.
-                           Returns [] if the "user_id" field is not found in the model.
+            List[int]: A list of row indices where the "user_id" matches the given value.
+                       Returns [] if the "user_id" field is not found in the model.
         """
-        user_id_col_index = self.fieldIndex("user_id")
-        if user_id_col_index == -1:
-            print(
-                f"[{self.__class__.__name__}.get_rows_by_user_id] 'user_id' field not found for search."
-            )
-            return -1
-        rows = []
-        for row in range(self.rowCount()):
-            index = self.index(row, user_id_col_index)
-            if self.data(index) == user_id:
-                rows.append(row)
-        return rows
+        return self.find_rows_by_field("user_id", user_id)
 
 
 class UserSettingProxyModel(BaseModel):
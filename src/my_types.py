@@ -120,7 +120,8 @@ class BrowserWorkerSignals(QObject):
     error_signal = pyqtSignal(RobotTaskType, str)
     succeeded_signal = pyqtSignal(RobotTaskType, str, str)
     proxy_unavailable_signal = pyqtSignal(RobotTaskType, str)
-    proxy_not_ready_signal = pyqtSignal(RobotTaskType, str)
+    # (task, proxy_url, seconds until the proxy is ready)
+    proxy_not_ready_signal = pyqtSignal(RobotTaskType, str, int)
     progress_signal = pyqtSignal(RobotTaskType, str, int, int)
 
 
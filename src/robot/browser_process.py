@@ -0,0 +1,268 @@
+# src/robot/browser_process.py
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from src.robot.browser_runtime import BrowserRuntimePool
+from src.robot.browser_worker import BrowserWorker
+
+# BrowserWorkerSignals a worker process streams back; all take the task first.
+RELAYED_SIGNALS = (
+    "failed_signal",
+    "error_signal",
+    "succeeded_signal",
+    "proxy_unavailable_signal",
+    "proxy_not_ready_signal",
+    "progress_signal",
+)
+
+
+class _RelayedSignal:
+    """Stands in for a pyqtSignal inside a worker process; `emit` sends the
+    arguments (without the task, which the parent already has) to the parent."""
+
+    def __init__(self, events, job_id: int, name: str):
+        self._events = events
+        self._job_id = job_id
+        self._name = name
+
+    def emit(self, task, *args):
+        self._events.put(("signal", self._job_id, self._name, args))
+
+
+class _RelayedSignals:
+    def __init__(self, events, job_id: int):
+        for name in RELAYED_SIGNALS:
+            setattr(self, name, _RelayedSignal(events, job_id, name))
+
+
+def _job_done(events, job_id: int, slots: threading.Semaphore):
+    events.put(("done", job_id))
+    slots.release()
+
+
+def _process_main(
+    jobs,
+    events,
+    claim,
+    threads_per_process: int,
+    recycle_after_tasks: int,
+    max_driver_rss_mb: int,
+    idle_timeout_s: float,
+):
+    """Worker process: runs jobs from `jobs` on its own BrowserRuntimePool and
+    exits after `idle_timeout_s` without work, or on a None job. The id of the
+    last job it took is written to `claim`."""
+    pool = BrowserRuntimePool(
+        threads_per_process, recycle_after_tasks, max_driver_rss_mb, idle_timeout_s
+    )
+    slots = threading.Semaphore(threads_per_process)
+    try:
+        while True:
+            slots.acquire()
+            try:
+                job = jobs.get(timeout=idle_timeout_s)
+            except queue.Empty:
+                slots.release()
+                if pool.active_count() == 0:
+                    return
+                continue
+            if job is None:
+                slots.release()
+                return
+            job_id, worker_class, task, raw_proxy, lease = job
+            # Shared memory, so the parent sees the claim even if this process
+            # dies before its "started" event is flushed.
+            claim.value = job_id
+            events.put(("started", job_id, os.getpid()))
+            worker = worker_class(task, raw_proxy, lease)
+            worker.signals = _RelayedSignals(events, job_id)
+            pool.submit(worker, on_done=partial(_job_done, events, job_id, slots))
+    finally:
+        pool.shutdown(wait=True)
+        events.put(("exit", os.getpid()))
+
+
+class ProcessBrowserBackend:
+    """
+    Runs BrowserWorkers in up to `max_processes` worker processes, each with
+    `threads_per_process` Playwright runtimes (see BrowserRuntimePool), so browser
+    automation does not compete with the GUI for its interpreter's GIL.
+
+    Only the task, its proxy and lease travel to the worker process; the worker
+    is rebuilt there and its signals are streamed back over a queue. A listener
+    thread re-emits them on the original worker's BrowserWorkerSignals, so Qt
+    queues them to their slots as before. Processes start on demand and exit
+    after `idle_timeout_s` idle; the jobs of a process that crashes are failed.
+    """
+
+    # Seconds between checks for processes that died without an "exit" event.
+    REAP_INTERVAL_S = 1.0
+
+    def __init__(
+        self,
+        max_processes: int,
+        threads_per_process: int,
+        recycle_after_tasks: int = 50,
+        max_driver_rss_mb: int = 512,
+        idle_timeout_s: float = 300.0,
+    ):
+        self.max_processes = max_processes
+        self.threads_per_process = threads_per_process
+        self.max_runtimes = max_processes * threads_per_process
+        self.recycle_after_tasks = recycle_after_tasks
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.idle_timeout_s = idle_timeout_s
+
+        # spawn: a forked child would inherit the GUI's Qt and Playwright state.
+        self._context = multiprocessing.get_context("spawn")
+        self._jobs = self._context.Queue()
+        self._events = self._context.Queue()
+        self._lock = threading.Lock()
+        self._next_job_id = 0
+        self._workers: Dict[int, BrowserWorker] = {}
+        self._on_done: Dict[int, Optional[Callable[[], None]]] = {}
+        self._job_pids: Dict[int, int] = {}
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        # pid -> shared id of the last job that process took (see _process_main).
+        self._claims: Dict[int, "multiprocessing.sharedctypes.Synchronized"] = {}
+        self._listener: Optional[threading.Thread] = None
+
+    def submit(
+        self, worker: BrowserWorker, on_done: Optional[Callable[[], None]] = None
+    ):
+        with self._lock:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            self._workers[job_id] = worker
+            self._on_done[job_id] = on_done
+            self._jobs.put(
+                (job_id, type(worker), worker.task, worker.raw_proxy, worker.lease)
+            )
+            self._start_processes()
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="browser-process-listener", daemon=True
+                )
+                self._listener.start()
+
+    def active_count(self) -> int:
+        """Workers submitted and not finished yet."""
+        return len(self._workers)
+
+    def shutdown(self, wait: bool = False):
+        """Stops every process once the queued workers are done."""
+        with self._lock:
+            processes = list(self._processes.values())
+            for _ in processes:
+                self._jobs.put(None)
+        if wait:
+            for process in processes:
+                process.join()
+
+    def _start_processes(self):
+        # Called with self._lock held.
+        needed = min(
+            self.max_processes,
+            math.ceil(len(self._workers) / self.threads_per_process),
+        )
+        while len(self._processes) < needed:
+            claim = self._context.Value("q", -1)
+            process = self._context.Process(
+                target=_process_main,
+                args=(
+                    self._jobs,
+                    self._events,
+                    claim,
+                    self.threads_per_process,
+                    self.recycle_after_tasks,
+                    self.max_driver_rss_mb,
+                    self.idle_timeout_s,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes[process.pid] = process
+            self._claims[process.pid] = claim
+
+    def _listen(self):
+        last_reap = time.monotonic()
+        while True:
+            try:
+                event = self._events.get(timeout=self.REAP_INTERVAL_S)
+            except queue.Empty:
+                pass
+            else:
+                try:
+                    self._handle_event(event)
+                except Exception as e:
+                    print(f"[{self.__class__.__name__}._listen] Bad event {event}: {e}")
+            # On a clock, so a steady stream of events cannot hold it off.
+            now = time.monotonic()
+            if now - last_reap >= self.REAP_INTERVAL_S:
+                last_reap = now
+                self._reap_dead_processes()
+
+    def _handle_event(self, event: tuple):
+        kind = event[0]
+        if kind == "signal":
+            _, job_id, name, args = event
+            worker = self._workers.get(job_id)
+            if worker is not None:
+                getattr(worker.signals, name).emit(worker.task, *args)
+        elif kind == "started":
+            _, job_id, pid = event
+            with self._lock:
+                self._job_pids[job_id] = pid
+        elif kind == "done":
+            self._finish_job(event[1])
+        elif kind == "exit":
+            self._on_process_exit(event[1])
+
+    def _finish_job(self, job_id: int):
+        with self._lock:
+            self._workers.pop(job_id, None)
+            self._job_pids.pop(job_id, None)
+            on_done = self._on_done.pop(job_id, None)
+        if on_done is not None:
+            on_done()
+
+    def _on_process_exit(self, pid: int):
+        with self._lock:
+            process = self._processes.pop(pid, None)
+            self._claims.pop(pid, None)
+            # Jobs queued while this process was going idle still need one.
+            self._start_processes()
+        if process is not None:
+            process.join()
+
+    def _reap_dead_processes(self):
+        """Fails the jobs of processes that died without saying so (crashes)."""
+        with self._lock:
+            dead_pids = [
+                pid
+                for pid, process in self._processes.items()
+                if not process.is_alive()
+            ]
+            lost_jobs = {
+                job_id for job_id, pid in self._job_pids.items() if pid in dead_pids
+            }
+            # A job taken right before the crash may have no "started" event.
+            for pid in dead_pids:
+                claimed = self._claims[pid].value
+                if claimed in self._workers:
+                    lost_jobs.add(claimed)
+        for job_id in lost_jobs:
+            worker = self._workers.get(job_id)
+            if worker is not None:
+                worker.signals.error_signal.emit(
+                    worker.task, "The browser worker process exited unexpectedly."
+                )
+            self._finish_job(job_id)
+        for pid in dead_pids:
+            self._on_process_exit(pid)
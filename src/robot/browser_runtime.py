@@ -0,0 +1,229 @@
+# src/robot/browser_runtime.py
+import os
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from playwright.sync_api import Playwright, sync_playwright
+
+# Marks a thread's wait for work that timed out.
+_IDLE = object()
+
+
+class PlaywrightRuntime:
+    """
+    A started Playwright driver (one Node process), reused across tasks.
+
+    Playwright's sync API is bound to the thread that started it, so a runtime
+    must be started, used and stopped on one thread. It is restarted when the
+    driver died, after `recycle_after_tasks` tasks, or once the driver's resident
+    memory exceeds `max_driver_rss_mb`.
+    """
+
+    def __init__(self, recycle_after_tasks: int = 50, max_driver_rss_mb: int = 512):
+        self.recycle_after_tasks = recycle_after_tasks
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.task_count = 0
+        self._manager = None
+        self._playwright: Optional[Playwright] = None
+
+    @property
+    def playwright(self) -> Playwright:
+        return self.ensure_ready()
+
+    def start(self):
+        self._manager = sync_playwright()
+        self._playwright = self._manager.start()
+        self.task_count = 0
+
+    def stop(self):
+        if self._playwright is None:
+            return
+        try:
+            self._playwright.stop()
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.stop] Failed to stop the driver: {e}")
+        self._manager = None
+        self._playwright = None
+
+    def ensure_ready(self) -> Playwright:
+        """The running driver, (re)started first if it is missing, dead or due
+        for recycling."""
+        if self._playwright is not None:
+            reason = self._recycle_reason()
+            if reason:
+                print(
+                    f"[{self.__class__.__name__}.ensure_ready] Recycling the Playwright driver: {reason}."
+                )
+                self.stop()
+        if self._playwright is None:
+            self.start()
+        return self._playwright
+
+    def task_done(self):
+        self.task_count += 1
+
+    def is_healthy(self) -> bool:
+        return self._playwright is not None and self._driver_pid() is not None
+
+    def _recycle_reason(self) -> Optional[str]:
+        if not self.is_healthy():
+            return "the driver is not running"
+        if self.task_count >= self.recycle_after_tasks:
+            return f"{self.task_count} tasks done"
+        rss_mb = _rss_mb(self._driver_pid())
+        if rss_mb is not None and rss_mb > self.max_driver_rss_mb:
+            return f"driver memory at {rss_mb:.0f} MB"
+        return None
+
+    def _driver_pid(self) -> Optional[int]:
+        # Playwright does not expose its driver process; look it up best-effort.
+        try:
+            process = self._playwright._impl_obj._connection._transport._proc
+        except AttributeError:
+            return None
+        if (
+            process is None
+            or process.returncode is not None
+            or not _is_alive(process.pid)
+        ):
+            return None
+        return process.pid
+
+
+def _is_alive(pid: int) -> bool:
+    # The driver's returncode only updates while Playwright is dispatching, so
+    # ask /proc where there is one; an exited, unreaped driver is a zombie there.
+    # Elsewhere trust returncode (os.kill(pid, 0) would terminate it on Windows).
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return not os.path.isdir("/proc")
+    except (OSError, IndexError):
+        return True
+
+
+def _rss_mb(pid: Optional[int]) -> Optional[float]:
+    """Resident memory of a process in MB, where /proc is available."""
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class BrowserRuntimePool:
+    """
+    Up to `max_runtimes` threads, each owning a PlaywrightRuntime and running
+    submitted BrowserWorkers one after another, so tasks start on a warm driver.
+
+    Threads are started on demand and stop (with their driver) after
+    `idle_timeout_s` without work, or on `shutdown`.
+    """
+
+    def __init__(
+        self,
+        max_runtimes: int,
+        recycle_after_tasks: int = 50,
+        max_driver_rss_mb: int = 512,
+        idle_timeout_s: float = 300.0,
+    ):
+        self.max_runtimes = max_runtimes
+        self.recycle_after_tasks = recycle_after_tasks
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.idle_timeout_s = idle_timeout_s
+
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread_count = 0
+        self._waiting_count = 0
+        self._active_count = 0
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, worker, on_done: Optional[Callable[[], None]] = None):
+        """Queues a BrowserWorker; it runs via `worker.execute(playwright)`, then
+        `on_done` is called on the runtime thread."""
+        with self._lock:
+            self._active_count += 1
+            self._jobs.put((worker, on_done))
+            if (
+                self._waiting_count < self._jobs.qsize()
+                and self._thread_count < self.max_runtimes
+            ):
+                self._thread_count += 1
+                thread = threading.Thread(
+                    target=self._run_thread,
+                    name=f"browser-runtime-{self._thread_count}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def active_count(self) -> int:
+        """Workers submitted and not finished yet."""
+        return self._active_count
+
+    def shutdown(self, wait: bool = False):
+        """Stops every thread once the queued workers are done."""
+        with self._lock:
+            for _ in range(self._thread_count):
+                self._jobs.put(None)
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _run_thread(self):
+        runtime = PlaywrightRuntime(self.recycle_after_tasks, self.max_driver_rss_mb)
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    return
+                worker, on_done = job
+                try:
+                    try:
+                        playwright = runtime.ensure_ready()
+                    except Exception as e:
+                        runtime.stop()
+                        worker.signals.error_signal.emit(
+                            worker.task, f"Failed to start Playwright: {e}"
+                        )
+                        continue
+                    worker.execute(playwright)
+                except Exception as e:
+                    print(f"[{self.__class__.__name__}._run_thread] Task failed: {e}")
+                finally:
+                    runtime.task_done()
+                    with self._lock:
+                        self._active_count -= 1
+                    if on_done is not None:
+                        on_done()
+        finally:
+            runtime.stop()
+            with self._lock:
+                self._threads.remove(threading.current_thread())
+
+    def _next_job(self):
+        """The next (worker, on_done), or None when this thread should stop."""
+        while True:
+            with self._lock:
+                self._waiting_count += 1
+            try:
+                job = self._jobs.get(timeout=self.idle_timeout_s)
+            except queue.Empty:
+                job = _IDLE
+            with self._lock:
+                self._waiting_count -= 1
+                if job is not None and job is not _IDLE:
+                    return job
+                if job is _IDLE and not self._jobs.empty():
+                    continue
+                self._thread_count -= 1
+                return None
@@ -1,11 +1,11 @@
-from time import sleep
+import re
 from typing import Optional
 from PyQt6.QtCore import QRunnable
 
 import io, pycurl, json
 from urllib.parse import urlparse
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Playwright, sync_playwright
 from undetected_playwright import Tarnished
 
 from src.my_types import RobotTaskType, BrowserWorkerSignals
@@ -18,66 +18,108 @@ class BrowserWorker(QRunnable):
         self,
         task: Optional[RobotTaskType],
         proxy: str,
+        lease: Optional[dict] = None,
     ):
         super().__init__()
         self.task = task
         self.raw_proxy = proxy
+        # Credentials resolved ahead of time (see ProxyLeaseManager).
+        self.lease = lease
         self.signals = BrowserWorkerSignals()
         self.setAutoDelete(True)
 
     def run(self):
+        self.execute()
+
+    def execute(self, playwright: Optional[Playwright] = None):
+        """
+        Runs the task. With `playwright` (a shared, already started driver) the
+        browser is launched on it; otherwise a driver is started for this task.
+        """
         try:
-            proxy = None
+            proxy = self.lease
 
             try:
-                res = get_proxy(self.raw_proxy)
-                if int(res.get("status")) == 100:
+                if proxy is None:
+                    res = get_proxy(self.raw_proxy)
+                else:
+                    res = {"status": 100, "data": proxy}
+                if int(res.get("status")) == 100 and res.get("data"):
                     proxy = res.get("data")
                 elif int(res.get("status")) == 101:
                     proxy = None
                     print(
                         f"[{self.task.user_info.uid}] Not ready proxy ({self.raw_proxy})"
                     )
-                    sleep(60)
-                    self.signals.proxy_not_ready_signal.emit(self.task, self.raw_proxy)
+                    self.signals.proxy_not_ready_signal.emit(
+                        self.task,
+                        self.raw_proxy,
+                        parse_ready_in_s(res.get("message")),
+                    )
                 elif int(res.get("status")) == 102:
                     proxy = None
                     self.signals.proxy_unavailable_signal.emit(
                         self.task, self.raw_proxy
                     )
+                else:
+                    proxy = None
+                    self.signals.error_signal.emit(
+                        self.task,
+                        f"Unexpected answer for proxy ({self.raw_proxy}): {res}",
+                    )
             except Exception as e:
+                proxy = None
                 self.signals.error_signal.emit(
                     self.task,
                     f"An error occurred while fetching proxy: {e}",
                 )
 
-            if proxy and self.task.action_name in ACTION_MAP.keys():
-                action_func = ACTION_MAP[self.task.action_name]
+            # Every outcome ends in one signal, which frees the task's slot in
+            # RobotService; without a proxy it was emitted above.
+            if proxy is None:
+                return
+            if self.task.action_name not in ACTION_MAP.keys():
+                self.signals.error_signal.emit(
+                    self.task, f"Unknown action <{self.task.action_name}>."
+                )
+                return
+
+            if playwright is None:
                 with sync_playwright() as p:
-                    context = p.chromium.launch_persistent_context(
-                        user_data_dir=self.task.udd,
-                        user_agent=(
-                            self.task.user_info.mobile_ua
-                            if self.task.is_mobile
-                            else self.task.user_info.desktop_ua
-                        ),
-                        headless=self.task.headless,
-                        args=["--disable-blink-features=AutomationControlled"],
-                        ignore_default_args=["--enable-automation"],
-                        proxy=proxy,
-                    )
-                    Tarnished.apply_stealth(context)
-                    page = context.new_page()
-                    if self.task.action_name == "launch_browser":
-                        action_func(page, self.task, self.signals)
+                    self._run_action(p, proxy)
+            else:
+                self._run_action(playwright, proxy)
 
-                self.signals.succeeded_signal.emit(
-                    self.task,
-                    self.raw_proxy,
-                    "Succeeded.",
-                )
+            self.signals.succeeded_signal.emit(
+                self.task,
+                self.raw_proxy,
+                "Succeeded.",
+            )
         except Exception as e:
-            self.signals.error_signal.emit(self.task, "message")
+            self.signals.error_signal.emit(self.task, f"An error occurred: {e}")
+
+    def _run_action(self, playwright: Playwright, proxy: dict):
+        action_func = ACTION_MAP[self.task.action_name]
+        context = playwright.chromium.launch_persistent_context(
+            user_data_dir=self.task.udd,
+            user_agent=(
+                self.task.user_info.mobile_ua
+                if self.task.is_mobile
+                else self.task.user_info.desktop_ua
+            ),
+            headless=self.task.headless,
+            args=["--disable-blink-features=AutomationControlled"],
+            ignore_default_args=["--enable-automation"],
+            proxy=proxy,
+        )
+        try:
+            Tarnished.apply_stealth(context)
+            page = context.new_page()
+            if self.task.action_name == "launch_browser":
+                action_func(page, self.task, self.signals)
+        finally:
+            # The driver outlives the task, so the browser must be closed here.
+            context.close()
 
 
 def get_proxy(proxy_url: str) -> dict:
@@ -122,3 +164,10 @@ def get_proxy(proxy_url: str) -> dict:
         }
     except Exception as e:
         raise Exception(e)
+
+
+def parse_ready_in_s(message: Optional[str], default: int = 60) -> int:
+    """Seconds until a rotating proxy can be used again, read from the first
+    number in the provider's "not ready" message."""
+    match = re.search(r"\d+", message or "")
+    return int(match.group()) if match else default
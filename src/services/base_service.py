@@ -1,12 +1,41 @@
 # src/services/base_service.py
+import time
 from datetime import datetime
-from typing import List, Any, Dict, Optional, Type
+from typing import (
+    List,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
 from contextlib import contextmanager
 from PyQt6.QtCore import Qt
-from PyQt6.QtSql import QSqlDatabase, QSqlRecord
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlRecord, QSqlTableModel
 from dataclasses import fields
+from operator import attrgetter
+from src.database.connection_manager import thread_database
 from src.models.base_model import BaseModel
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds.
+SQLITE_MAX_VARIABLES = 999
+IMPORT_CONFLICT_MODES = ("abort", "skip", "replace", "upsert")
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+
+class ColumnBinding(NamedTuple):
+    """How one DATA_TYPE field is written to its model column."""
+
+    column: int
+    field_name: str
+    getter: Callable[[Any], Any]
+    # created_at/updated_at: a None value is replaced with the current time.
+    is_timestamp: bool
+
 
 @contextmanager
 def transaction(db: QSqlDatabase):
@@ -26,7 +55,7 @@ def transaction(db: QSqlDatabase):
                 if db.isOpen()
                 else f"[{transaction.__name__}] db not open"
             )
-            if db.isOpen() and db.transaction():
+            if db.isOpen():
                 db.rollback()
                 print(
                     f"[{transaction.__name__}] Attempted rollback after commit failure."
@@ -34,7 +63,7 @@ def transaction(db: QSqlDatabase):
             raise RuntimeError(error_msg)
     except Exception as e:
         print(f"[{transaction.__name__}] Exception during transaction: {e}")
-        if db.isOpen() and db.transaction():
+        if db.isOpen():
             if db.rollback():
                 print(f"[{transaction.__name__}] Transaction rolled back.")
             else:
@@ -44,6 +73,10 @@ def transaction(db: QSqlDatabase):
 
 class BaseService:
     DATA_TYPE: Optional[Type[Any]] = None
+    # UNIQUE column that import_data resolves conflicts on.
+    IMPORT_CONFLICT_KEY: Optional[str] = None
+    IMPORT_CHUNK_SIZE = 5000
+    ITER_CHUNK_SIZE = 1000
 
     def __init__(self, model: BaseModel):
         if not isinstance(model, BaseModel):
@@ -55,18 +88,6 @@ class BaseService:
             warning_msg = f"[{self.__class__.__name__}.__init__] Warning: db connection '{self._db.connectionName()}' is not valid or not open."
             print(warning_msg)
 
-        self._column_names: List[str] = []
-        for i in range(self.model.columnCount()):
-            col_name = self.model.headerData(
-                i,
-                Qt.Orientation.Horizontal,
-                Qt.ItemDataRole.DisplayRole,
-            )
-            if isinstance(col_name, str):
-                self._column_names.append(col_name)
-            else:
-                warning_msg = f"[{self.__class__.__name__}.__init__] Warning: Column header at index {i} is not a string: {col_name}."
-                print(warning_msg)
         if self.model.fieldIndex("id") == -1:
             warning_msg = f"[{self.__class__.__name__}.__init__] Warning: Table '{self.model.tableName()}' must have an 'id' column for some operations."
             print(warning_msg)
@@ -77,77 +98,107 @@ class BaseService:
                     warning_msg = f"[{self.__class__.__name__}.__init__] Warning: Field '{field_name}' from DATA_TYPE '{self.DATA_TYPE.__name__}' not found as a column in table '{self.model.tableName()}'."
                     print(warning_msg)
 
+        self._schema: Tuple[str, ...] = ()
+        self._record_plan: Tuple[int, ...] = ()
+        self._write_plan: Tuple[ColumnBinding, ...] = ()
+        self._build_schema_plans()
+        self.model.modelReset.connect(self._on_model_reset)
+
     # ========================================================================
     # Helper method
     # ========================================================================
+    def _connection(self) -> QSqlDatabase:
+        """The model's connection on the GUI thread, a per-thread clone elsewhere.
+        Use it for raw SQL that does not touch the model."""
+        return thread_database(self._db.connectionName())
+
+    def _build_schema_plans(self):
+        """Resolves, once per table schema, where each DATA_TYPE field sits in a
+        record of the table (-1 when the table has no such column), and the
+        column bindings used to write a payload into a model row."""
+        record = self.model.record()
+        self._schema = tuple(record.fieldName(i) for i in range(record.count()))
+        if self.DATA_TYPE is not None:
+            self._record_plan = tuple(
+                record.indexOf(f.name) for f in fields(self.DATA_TYPE)
+            )
+            self._write_plan = tuple(
+                ColumnBinding(
+                    column=column,
+                    field_name=f.name,
+                    getter=attrgetter(f.name),
+                    is_timestamp=f.name in TIMESTAMP_FIELDS,
+                )
+                for f, column in zip(fields(self.DATA_TYPE), self._record_plan)
+                if f.name != "id" and column != -1
+            )
+
+    def _on_model_reset(self):
+        record = self.model.record()
+        schema = tuple(record.fieldName(i) for i in range(record.count()))
+        if schema != self._schema:
+            self._build_schema_plans()
+
     def _map_record_to_datatype(self, record: QSqlRecord) -> Optional[Any]:
         """Helper to map a QSqlRecord to an instance of the specific DATA_TYPE dataclass."""
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}._map_record_to_datatype] DATA_TYPE is not set. Cannot map record. => return None"
             print(info_msg)
             return None
-        data: Dict[str, Any] = {}
-        for i in range(record.count()):
-            field_name = record.fieldName(i)
-            data[field_name] = record.value(i)
+        plan = self._record_plan
+        if record.count() != len(self._schema):
+            # Not a full table row (e.g. a query selecting other columns).
+            plan = tuple(record.indexOf(f.name) for f in fields(self.DATA_TYPE))
         try:
-            dataclass_field_names = {f.name for f in fields(self.DATA_TYPE)}
-            valid_data = {field: data.get(field) for field in dataclass_field_names}
-            return self.DATA_TYPE(**valid_data)
+            return self.DATA_TYPE(*[record.value(i) if i != -1 else None for i in plan])
         except Exception as e:
+            data = {record.fieldName(i): record.value(i) for i in range(record.count())}
             error_msg = f"[{self.__class__.__name__}._map_record_to_datatype] Error: converting dict to {self.DATA_TYPE.__name__}: {e} -- Data: {data}"
             print(error_msg)
             return None
 
-    def _fill_row_from_payload(self, row: int, payload: Any):
-        """Helper to set data in a model row from a DATA_TYPE payload."""
+    def _map_row_to_datatype(self, row: int) -> Optional[Any]:
+        """Helper to map a model row to an instance of DATA_TYPE. Reads only the planned
+        columns instead of building a QSqlRecord of the whole row."""
         if self.DATA_TYPE is None:
-            info_msg = f"[{self.__class__.__name__}._fill_row_from_payload] DATA_TYPE is not set. Cannot fill row. => return False"
+            info_msg = f"[{self.__class__.__name__}._map_row_to_datatype] DATA_TYPE is not set. Cannot map row. => return None"
             print(info_msg)
-            return False
-        if not isinstance(payload, self.DATA_TYPE):
-            info_msg = f"[{self.__class__.__name__}._fill_row_from_payload] Invalid payload type. Expected {self.DATA_TYPE.__name__}, got {type(payload).__name__}. => return False"
-            print(info_msg)
-            return False
-        fields_set_count = 0
-        for col_index in range(self.model.columnCount()):
-            field_name = self.model.headerData(
-                col_index,
-                Qt.Orientation.Horizontal,
-                Qt.ItemDataRole.DisplayRole,
-            )
-            if not isinstance(field_name, str):
-                continue
-            if hasattr(payload, field_name):
-                value = getattr(payload, field_name)
-                if (
-                    field_name == "created_at" or field_name == "updated_at"
-                ) and value is None:
-                    value = str(datetime.now())
-            if field_name != "id":
-                index = self.model.index(row, col_index)
-                if index.isValid():
-                    set_success = self.model.setData(
-                        index,
-                        value,
-                        Qt.ItemDataRole.EditRole,
+            return None
+        model = self.model
+        # Model columns follow the table record, so plan positions are column indexes.
+        # QSqlTableModel.data skips BaseModel's role dispatch for plain DisplayRole reads.
+        try:
+            return self.DATA_TYPE(
+                *[
+                    (
+                        QSqlTableModel.data(model, model.index(row, col))
+                        if col != -1
+                        else None
                     )
-                    if set_success:
-                        fields_set_count += 1
-                    else:
-                        warning_msg = f"[{self.__class__.__name__}._fill_row_from_payload] Warning: setData returned False for col '{field_name}' (index {col_index}) at row {row}."
-                        print(warning_msg)
-                else:
-                    warning_msg = f"[{self.__class__.__name__}._fill_row_from_payload] Warning: Invalid index for field '{field_name}' (col index {col_index}) at row {row}. Data not set."
-                    print(warning_msg)
-        return fields_set_count > 0
+                    for col in self._record_plan
+                ]
+            )
+        except Exception as e:
+            error_msg = f"[{self.__class__.__name__}._map_row_to_datatype] Error: converting row {row} to {self.DATA_TYPE.__name__}: {e}"
+            print(error_msg)
+            return None
+
+    def _reselect(self) -> bool:
+        """Reloads the model after a write whose row it cannot patch in place.
+        select() drops unsubmitted edits, so those are submitted first."""
+        if self.model.isDirty() and not self.model.submitAll():
+            error_msg = f"[{self.__class__.__name__}._reselect] Failed to submit pending edits. Error: {self.model.lastError().text()}"
+            print(error_msg)
+            return False
+        return self.refresh()
 
     # ========================================================================
     # CRUD method
     # ========================================================================
     def create(self, payload: Any) -> bool:
         """
-        Creates a new record from a DATA_TYPE payload using the model.
+        Creates a new record from a DATA_TYPE payload with an INSERT statement,
+        then reloads the model.
         Returns True on success, False on failure.
         Automatically sets created_at and updated_at if they are None in payload
         and exist as columns.
@@ -165,25 +216,33 @@ class BaseService:
             print(info_msg)
             return False
 
-        row = self.model.rowCount()
-        if not self.model.insertRow(row):
-            error_msg = f"[{self.__class__.__name__}.create] Failed to insert row into model buffer. Error: {self.model.lastError().text()}. => return False"
-            print(error_msg)
-            return False
-        # --- Handle created_at and updated_at if None in payload ---
-        self._fill_row_from_payload(row, payload=payload)
-
-        if self.model.submitAll():
-            self.model.select()
-            return True
-        else:
-            error_msg = f"[{self.__class__.__name__}.create] Failed to submit changes to database. Error: {self.model.lastError().text()}. => return False"
+        # Written with SQL, not through the model buffer: a setData()/submit()
+        # on a model that has not fetched the whole table makes later
+        # fetchMore() calls load rows it already holds. Where the new row lands
+        # depends on the model's sort and window, so the model is reselected.
+        now = str(datetime.now())
+        values = []
+        for binding in self._write_plan:
+            value = binding.getter(payload)
+            values.append(now if binding.is_timestamp and value is None else value)
+        columns = ", ".join(binding.field_name for binding in self._write_plan)
+        placeholders = ", ".join("?" for _ in values)
+        query = QSqlQuery(self._connection())
+        query.prepare(
+            f"INSERT INTO {self.model.tableName()} ({columns}) VALUES ({placeholders})"
+        )
+        for value in values:
+            query.addBindValue(value)
+        if not query.exec():
+            error_msg = f"[{self.__class__.__name__}.create] Failed to insert record. Error: {query.lastError().text()}. => return False"
             print(error_msg)
-            self.model.revertAll()
             return False
+        self._reselect()
+        return True
 
     def read(self, record_id: int) -> Optional[Any]:
-        """Reads a record by ID using the model's find method.
+        """Reads a record by ID from the model, or from the database when the row
+        has not been loaded into the model yet.
         Returns an instance of DATA_TYPE or None if not found."""
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}.read] DATA_TYPE is not set. Cannot read. => return None"
@@ -197,34 +256,113 @@ class BaseService:
             return None
         row = self.model.get_row_by_id(record_id)
         if row != -1:
-            record = self.model.record(row)
-            return self._map_record_to_datatype(record)
+            return self._map_row_to_datatype(row)
+        return self._read_where("id", record_id)
+
+    def _read_where(self, column: str, value: Any) -> Optional[Any]:
+        """Reads the first record whose `column` equals `value` straight from the database.
+        Returns an instance of DATA_TYPE or None if not found."""
+        query = QSqlQuery(self._connection())
+        query.setForwardOnly(True)
+        query.prepare(
+            f"SELECT * FROM {self.model.tableName()} WHERE {column} = ? LIMIT 1"
+        )
+        query.addBindValue(value)
+        if not query.exec():
+            error_msg = f"[{self.__class__.__name__}._read_where] Query failed. Error: {query.lastError().text()}. => return None"
+            print(error_msg)
+            return None
+        if query.next():
+            return self._map_record_to_datatype(query.record())
         return None
 
-    def read_all(self) -> List[Any]:
-        """Reads all records currently loaded in the model.
-        Returns a list of DATA_TYPE instances."""
+    def read_many(self, record_ids: Iterable[Any]) -> List[Any]:
+        """Reads the records with the given IDs straight from the database using
+        `WHERE id IN (...)` queries, independent of what the model has loaded.
+        Safe to call from worker threads (they use their own connection).
+        Returns DATA_TYPE instances in the order of record_ids; unknown IDs are skipped.
+        """
         if self.DATA_TYPE is None:
-            info_msg = f"[{self.__class__.__name__}.read] DATA_TYPE is not set. Cannot read. => return []"
+            info_msg = f"[{self.__class__.__name__}.read_many] DATA_TYPE is not set. Cannot read. => return []"
             print(info_msg)
             return []
         if not self._db.isOpen():
-            info_msg = (
-                f"[{self.__class__.__name__}.read] Database is not open. => return []"
-            )
+            info_msg = f"[{self.__class__.__name__}.read_many] Database is not open. => return []"
             print(info_msg)
             return []
 
-        results: List[Any] = []
-        for row in range(self.model.rowCount()):
-            record = self.model.record(row)
-            data_instance = self._map_record_to_datatype(record)
-            if data_instance is not None:
-                results.append(data_instance)
-        return results
+        unique_ids = list(dict.fromkeys(record_ids))
+        found: Dict[Any, Any] = {}
+        query = QSqlQuery(self._connection())
+        query.setForwardOnly(True)
+        for start in range(0, len(unique_ids), SQLITE_MAX_VARIABLES):
+            chunk = unique_ids[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" for _ in chunk)
+            query.prepare(
+                f"SELECT * FROM {self.model.tableName()} WHERE id IN ({placeholders})"
+            )
+            for record_id in chunk:
+                query.addBindValue(record_id)
+            if not query.exec():
+                error_msg = f"[{self.__class__.__name__}.read_many] Query failed. Error: {query.lastError().text()}. => return []"
+                print(error_msg)
+                return []
+            while query.next():
+                data_instance = self._map_record_to_datatype(query.record())
+                if data_instance is not None:
+                    found[data_instance.id] = data_instance
+        return [found[record_id] for record_id in unique_ids if record_id in found]
+
+    def read_all(self) -> List[Any]:
+        """Reads all records straight from the database, whether or not the model
+        has loaded them. Prefer `iter_all` for large tables.
+        Returns a list of DATA_TYPE instances."""
+        return list(self.iter_all())
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[Any]:
+        """Yields every record of the table as a DATA_TYPE instance, streamed from a
+        forward-only query so memory stays flat however large the table is.
+        Safe to call from worker threads (they use their own connection)."""
+        for chunk in self.iter_chunks(chunk_size):
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[List[Any]]:
+        """Yields the table's records in lists of at most `chunk_size`
+        (ITER_CHUNK_SIZE by default) DATA_TYPE instances."""
+        if self.DATA_TYPE is None:
+            info_msg = f"[{self.__class__.__name__}.iter_chunks] DATA_TYPE is not set. Cannot read."
+            print(info_msg)
+            return
+        if not self._db.isOpen():
+            info_msg = f"[{self.__class__.__name__}.iter_chunks] Database is not open."
+            print(info_msg)
+            return
+
+        chunk_size = chunk_size or self.ITER_CHUNK_SIZE
+        query = QSqlQuery(self._connection())
+        query.setForwardOnly(True)
+        if not query.exec(f"SELECT * FROM {self.model.tableName()}"):
+            error_msg = f"[{self.__class__.__name__}.iter_chunks] Query failed. Error: {query.lastError().text()}"
+            print(error_msg)
+            return
+        try:
+            chunk: List[Any] = []
+            while query.next():
+                data_instance = self._map_record_to_datatype(query.record())
+                if data_instance is not None:
+                    chunk.append(data_instance)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            # Release the read cursor even when the caller stops early.
+            query.finish()
 
     def update(self, record_id: Any, payload: Any) -> bool:
-        """Updates an existing record by ID from a DATA_TYPE payload using the model.
+        """Updates an existing record by ID from a DATA_TYPE payload with an UPDATE
+        statement, then re-reads the row if the model has loaded it.
         Updates only the fields present (not None) in the payload.
         Automatically sets updated_at if it's None in payload and exists as a column.
         Returns True on success, False on failure."""
@@ -240,55 +378,46 @@ class BaseService:
             info_msg = f"[{self.__class__.__name__}.update] Database is not open. => return False"
             print(info_msg)
             return False
-        row = self.model.get_row_by_id(record_id)
-        if row == -1:
-            info_msg = f"[{self.__class__.__name__}.update] Record with id {record_id} not found in model. => return False"
-            print(info_msg)
+        payload.updated_at = str(datetime.now())
+        if not self._update_in_table(record_id, payload):
             return False
+        # The row is written with SQL (see create()) and, when loaded, re-read.
+        row = self.model.get_row_by_id(record_id)
+        if row != -1:
+            self.model.selectRow(row)
+        return True
 
-        payload.updated_at = str(datetime.now())
-        fields_updated_count = 0
-        for col_index in range(self.model.columnCount()):
-            field_name = self.model.headerData(
-                col_index,
-                Qt.Orientation.Horizontal,
-                Qt.ItemDataRole.DisplayRole,
-            )
-            if not isinstance(field_name, str):
-                continue
-            if hasattr(payload, field_name):
-                value = getattr(payload, field_name)
-                if value is not None:
-                    index = self.model.index(row, col_index)
-                    if index.isValid():
-                        set_success = self.model.setData(
-                            index,
-                            value,
-                            Qt.ItemDataRole.EditRole,
-                        )
-                        if set_success:
-                            fields_updated_count += 1
-                        else:
-                            warning_msg = f"[{self.__class__.__name__}.update] WARNING: setData returned False for col '{field_name}' (index {col_index}) at row {row}."
-                            print(warning_msg)
-                    else:
-                        warning_msg = f"[{self.__class__.__name__}.update] WARNING: Invalid index for field '{field_name}' (col index {col_index}) at row {row}. Data not set."
-                        print(warning_msg)
-
-        if fields_updated_count > 0 and self.model.submitAll():
-            self.model.select()
-            return True
-        elif fields_updated_count == 0:
+    def _update_in_table(self, record_id: Any, payload: Any) -> bool:
+        """Writes the payload's non-None fields with one UPDATE statement; the
+        model is not touched."""
+        bindings = [
+            binding
+            for binding in self._write_plan
+            if binding.getter(payload) is not None
+        ]
+        if not bindings:
             info_msg = f"[{self.__class__.__name__}.update] No fields provided in payload to update for id: {record_id}."
             print(info_msg)
             return True
-        else:
-            info_msg = f"[{self.__class__.__name__}.update] Failed to submit update. Error: {self.model.lastError().text()}"
-            self.model.revertAll()
+        assignments = ", ".join(f"{binding.field_name} = ?" for binding in bindings)
+        query = QSqlQuery(self._connection())
+        query.prepare(f"UPDATE {self.model.tableName()} SET {assignments} WHERE id = ?")
+        for binding in bindings:
+            query.addBindValue(binding.getter(payload))
+        query.addBindValue(record_id)
+        if not query.exec():
+            info_msg = f"[{self.__class__.__name__}.update] Failed to update record {record_id}. Error: {query.lastError().text()}"
+            print(info_msg)
             return False
+        if query.numRowsAffected() == 0:
+            info_msg = f"[{self.__class__.__name__}.update] Record with id {record_id} not found. => return False"
+            print(info_msg)
+            return False
+        return True
 
     def delete(self, record_id: Any) -> bool:
-        """Deletes a single record by ID using the model.
+        """Deletes a single record by ID using the model, or with a DELETE statement
+        when the row has not been loaded into the model.
         Returns True on success, False on failure."""
         if not self._db.isOpen():
             info_msg = f"[{self.__class__.__name__}.delete] Database is not open. => return False"
@@ -296,9 +425,11 @@ class BaseService:
             return False
         row = self.model.get_row_by_id(record_id)
         if row == -1:
-            info_msg = f"[{self.__class__.__name__}.delete] Record with id {record_id} not found in model for deletion."
-            print(info_msg)
-            return False
+            deleted_count = self._delete_where_in("id", [record_id])
+            if deleted_count == 0:
+                info_msg = f"[{self.__class__.__name__}.delete] Record with id {record_id} not found for deletion."
+                print(info_msg)
+            return deleted_count > 0
         if not self.model.removeRow(row):
             info_msg = f"[{self.__class__.__name__}.delete] Failed to remove row {row} from model buffer. Error: {self.model.lastError().text()}"
             print(info_msg)
@@ -312,10 +443,12 @@ class BaseService:
             return False
 
     def delete_multiple(self, record_ids: List[Any]) -> bool:
-        """Deletes multiple records by IDs using the model within a transaction.
+        """Deletes multiple records by IDs with `DELETE ... WHERE id IN (...)` statements
+        (chunked under SQLite's parameter limit) within a transaction, then reloads
+        the model once.
         Returns True on success, False on failure (any failure causes rollback)."""
         if not self._db.isOpen():
-            info_msg = f"[{self.__class__.__name__}.update] Database is not open. => return False"
+            info_msg = f"[{self.__class__.__name__}.delete_multiple] Database is not open. => return False"
             print(info_msg)
             return False
         if not record_ids:
@@ -324,44 +457,49 @@ class BaseService:
             )
             print(info_msg)
             return False
-        rows_to_delete = sorted(
-            [
-                self.model.get_row_by_id(db_id)
-                for db_id in record_ids
-                if self.model.get_row_by_id(db_id) != -1
-            ],
-            reverse=True,
-        )
-        if not rows_to_delete:
-            info_msg = f"[{self.__class__.__name__}.delete_multiple] None of the provided IDs were found in the model."
+        deleted_count = self._delete_where_in("id", record_ids)
+        if deleted_count == -1:
+            return False
+        if deleted_count == 0:
+            info_msg = f"[{self.__class__.__name__}.delete_multiple] None of the provided IDs were found in the table."
             print(info_msg)
             return False
-        try:
-            with transaction(self._db):
-                for row in rows_to_delete:
-                    if not self.model.removeRow(row):
-                        error_msg = f"[{self.__class__.__name__}.delete_multiple] Failed to remove row {row} from model buffer. Error: {self.model.lastError().text()}"
-                        print(error_msg)
-                        raise RuntimeError(error_msg)
-                if not self.model.submitAll():
-                    error_msg = f"[{self.__class__.__name__}.delete_multiple] Failed to submit deletions. Error: {self.model.lastError().text()}"
-                    print(error_msg)
+        self.model.select()
+        return True
+
+    def _delete_where_in(self, column: str, values: Iterable[Any]) -> int:
+        """Deletes every row whose `column` is in `values` within one transaction.
+        Returns the number of deleted rows, or -1 on failure (rollback).
+        Does not touch the model; callers refresh it."""
+        unique_values = list(dict.fromkeys(values))
+        db = self._connection()
+        query = QSqlQuery(db)
+        deleted_count = 0
+        succeeded = False
+        with transaction(db):
+            for start in range(0, len(unique_values), SQLITE_MAX_VARIABLES):
+                chunk = unique_values[start : start + SQLITE_MAX_VARIABLES]
+                placeholders = ", ".join("?" for _ in chunk)
+                query.prepare(
+                    f"DELETE FROM {self.model.tableName()} WHERE {column} IN ({placeholders})"
+                )
+                for value in chunk:
+                    query.addBindValue(value)
+                if not query.exec():
+                    error_msg = f"[{self.__class__.__name__}._delete_where_in] Failed to delete rows. Error: {query.lastError().text()}"
                     raise RuntimeError(error_msg)
-            self.model.select()
-            return True
-        except Exception as e:
-            exception_msg = (
-                f"[{self.__class__.__name__}.delete_multiple] Transaction failed: {e}"
-            )
-            print(exception_msg)
-            self.model.revertAll()
-            self.model.select()
-            return False
+                deleted_count += max(query.numRowsAffected(), 0)
+            succeeded = True
+        return deleted_count if succeeded else -1
 
-    def import_data(self, payload: List[Any]) -> bool:
-        """Imports multiple records from a list of DATA_TYPE payloads using the model
-        within a transaction.
-        Returns True on success (all imported), False on failure (rollback).
+    def import_data(self, payload: List[Any], on_conflict: str = "abort") -> bool:
+        """Imports multiple records from a list of DATA_TYPE payloads with a prepared
+        INSERT executed per row, IMPORT_CHUNK_SIZE rows at a time, all within one transaction.
+        on_conflict decides what happens when a row clashes with an existing
+        IMPORT_CONFLICT_KEY value: "abort" (rollback everything), "skip" (keep the
+        existing row), "replace" (delete it and insert the new one) or "upsert"
+        (update the existing row in place, keeping its id and created_at).
+        Returns True on success, False on failure (rollback).
         Automatically sets created_at and updated_at if they are None in payload
         and exist as columns."""
         if self.DATA_TYPE is None:
@@ -380,38 +518,97 @@ class BaseService:
             info_msg = f"[{self.__class__.__name__}.import_data] Database is not open."
             print(info_msg)
             return False
-        try:
-            with transaction(self._db):
-                for record_instance in payload:
-                    if hasattr(record_instance, "updated_at"):
-                        record_instance.updated_at = str(datetime.now())
-                    row = self.model.rowCount()
-                    if row < 0:
-                        error_msg = f"[{self.__class__.__name__}.import_data] Failed to insert row into model buffer. Error: {self.model.lastError().text()}"
-                        raise RuntimeError(error_msg)
-                    if not self.model.insertRow(row):
-                        error_msg = f"[{self.__class__.__name__}.import_data] Failed to insert row into model buffer. Error: {self.model.lastError().text()}"
+        if on_conflict not in IMPORT_CONFLICT_MODES:
+            info_msg = f"[{self.__class__.__name__}.import_data] Invalid on_conflict '{on_conflict}'. Expected one of {IMPORT_CONFLICT_MODES}. => return False"
+            print(info_msg)
+            return False
+        if on_conflict == "upsert" and self.IMPORT_CONFLICT_KEY is None:
+            info_msg = f"[{self.__class__.__name__}.import_data] IMPORT_CONFLICT_KEY is not set. Cannot upsert. => return False"
+            print(info_msg)
+            return False
+
+        columns = [binding.field_name for binding in self._write_plan]
+        query = QSqlQuery(self._db)
+        if not query.prepare(self._build_import_sql(columns, on_conflict)):
+            error_msg = f"[{self.__class__.__name__}.import_data] Failed to prepare insert. Error: {query.lastError().text()}"
+            print(error_msg)
+            return False
+
+        started = time.perf_counter()
+        written = 0
+        imported = False
+        with transaction(self._db):
+            for start in range(0, len(payload), self.IMPORT_CHUNK_SIZE):
+                chunk = payload[start : start + self.IMPORT_CHUNK_SIZE]
+                now = str(datetime.now())
+                for offset, record_instance in enumerate(chunk):
+                    for binding in self._write_plan:
+                        if binding.field_name == "updated_at":
+                            value = now
+                        else:
+                            value = binding.getter(record_instance)
+                            if binding.is_timestamp and value is None:
+                                value = now
+                        query.addBindValue(value)
+                    if not query.exec():
+                        error_msg = f"[{self.__class__.__name__}.import_data] Failed to insert row {start + offset}. Error: {query.lastError().text()}"
                         raise RuntimeError(error_msg)
-                    self._fill_row_from_payload(row, record_instance)
-                if not self.model.submitAll():
-                    error_msg = f"[{self.__class__.__name__}.import_data] Failed to submit insertions. Error: {self.model.lastError().text()}"
-                    raise RuntimeError(error_msg)
-            self.model.select()
-            return True
-        except Exception as e:
-            exception_msg = (
-                f"[{self.__class__.__name__}.import_data] Transaction failed: {e}"
+                    # Rows this statement wrote; total_changes() would also
+                    # count the search-index triggers.
+                    written += max(query.numRowsAffected(), 0)
+            imported = True
+        elapsed = time.perf_counter() - started
+        if not imported:
+            info_msg = f"[{self.__class__.__name__}.import_data] Transaction failed. Nothing imported."
+            print(info_msg)
+            return False
+
+        rate = len(payload) / elapsed if elapsed > 0 else float("inf")
+        print(
+            f"[{self.__class__.__name__}.import_data] Imported {len(payload)} row(s) ({on_conflict}, {written} written) in {elapsed:.2f}s ({rate:.0f} rows/s)."
+        )
+        self.model.select()
+        return True
+
+    def _build_import_sql(self, columns: List[str], on_conflict: str) -> str:
+        table_name = self.model.tableName()
+        placeholders = ", ".join("?" for _ in columns)
+        verb = {
+            "abort": "INSERT",
+            "skip": "INSERT OR IGNORE",
+            "replace": "INSERT OR REPLACE",
+            "upsert": "INSERT",
+        }[on_conflict]
+        sql = f"{verb} INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        if on_conflict == "upsert":
+            assignments = ", ".join(
+                f"{column} = excluded.{column}"
+                for column in columns
+                if column not in (self.IMPORT_CONFLICT_KEY, "created_at")
             )
-            print(exception_msg)
-            self.model.revertAll()
-            self.model.select()
+            sql += (
+                f" ON CONFLICT({self.IMPORT_CONFLICT_KEY}) DO UPDATE SET {assignments}"
+            )
+        return sql
+
+    def refresh(self) -> bool:
+        """Reloads the whole table into the model. Updates only re-read the rows
+        they touch, so call this when the table was changed outside this service."""
+        if not self.model.select():
+            error_msg = f"[{self.__class__.__name__}.refresh] Failed to select table. Error: {self.model.lastError().text()}"
+            print(error_msg)
             return False
+        return True
 
-    def _find_by_model_index(self, find_method_name: str, value: Any) -> Optional[Any]:
+    def _find_by_model_index(
+        self, find_method_name: str, value: Any, field_name: Optional[str] = None
+    ) -> Optional[Any]:
         """Helper to find a single record based on a custom find method in the model.
         Intended for use by subclasses to implement methods like find_by_uid, find_by_email.
         find_method_name: The name of the method in the model (e.g., 'find_row_by_uid').
-        value: The value to pass to the model's find method."""
+        value: The value to pass to the model's find method.
+        field_name: The column searched; when given, rows the model has not loaded
+        are looked up in the database."""
 
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}._find_one_by_model_index] DATA_TYPE is not set. Cannot find record."
@@ -424,6 +621,7 @@ class BaseService:
             return None
         row = find_method(value)
         if row != -1:
-            record = self.model.record(row)
-            return self._map_record_to_datatype(record)
+            return self._map_row_to_datatype(row)
+        if field_name is not None:
+            return self._read_where(field_name, value)
         return None
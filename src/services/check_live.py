@@ -1,10 +1,58 @@
 import pycurl
+import heapq
 import io
 import json
-from typing import List, Tuple, Dict
+import queue
+import random
+import threading
+import time
 from collections import deque
+from typing import List, Tuple, Dict, Optional, Set
+from urllib.parse import urlsplit
 
-from PyQt6.QtCore import QThreadPool, QRunnable, QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QThreadPool, QRunnable, QObject, QTimer, pyqtSignal, pyqtSlot
+
+from src import constants
+from src.services.rate_limit import AimdController, TokenBucket
+
+CHECK_LIVE_URL = "https://graph.facebook.com/{uid}/picture?redirect=false"
+CHECK_LIVE_HEADERS = [
+    "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept: application/json",
+    "Accept-Language: en-US,en;q=0.9",
+    "Connection: keep-alive",
+]
+# Responses and curl errors that mean the upstream is overloaded or throttling.
+CONGESTION_STATUS_CODES = {429, 500, 502, 503, 504}
+CONGESTION_CURL_ERRORS = {
+    pycurl.E_OPERATION_TIMEDOUT,
+    pycurl.E_COULDNT_CONNECT,
+    pycurl.E_RECV_ERROR,
+    pycurl.E_SEND_ERROR,
+}
+# Failures that say nothing about the account, so the check is retried.
+RETRYABLE_STATUS_CODES = CONGESTION_STATUS_CODES | {408}
+RETRYABLE_CURL_ERRORS = CONGESTION_CURL_ERRORS | {
+    pycurl.E_COULDNT_RESOLVE_HOST,
+    pycurl.E_GOT_NOTHING,
+    pycurl.E_PARTIAL_FILE,
+    pycurl.E_SSL_CONNECT_ERROR,
+}
+
+_threadpool: Optional[QThreadPool] = None
+# Workers with a run in progress; keeps them alive if their CheckLive goes away.
+_running_workers: Set["CheckLiveMultiWorker"] = set()
+_running_workers_lock = threading.Lock()
+
+
+def check_live_threadpool() -> QThreadPool:
+    """The pool check-live workers run on, so they never take threads from (or
+    resize) QThreadPool.globalInstance()."""
+    global _threadpool
+    if _threadpool is None:
+        _threadpool = QThreadPool()
+        _threadpool.setMaxThreadCount(4)
+    return _threadpool
 
 
 class WorkerSignals(QObject):
@@ -13,22 +61,62 @@ class WorkerSignals(QObject):
 
     success_signal: Emits (uid, is_live) on successful check.
     error_signal: Emits (uid, error_message) on failure.
+    retry_signal: Emits (uid, error_message) on a transient failure worth retrying.
+    response_signal: Emits (uid, http_status) when a response arrives, before the result.
     finished: Emits uid when the worker finishes (success or error).
     """
 
+    response_signal = pyqtSignal(str, int)
     success_signal = pyqtSignal(str, bool)
     error_signal = pyqtSignal(str, str)
+    retry_signal = pyqtSignal(str, str)
     finished = pyqtSignal(str)
 
 
+def _configure_handle(curl: pycurl.Curl):
+    curl.setopt(pycurl.CONNECTTIMEOUT, 10)
+    curl.setopt(pycurl.TIMEOUT, 20)
+    curl.setopt(pycurl.FOLLOWLOCATION, 1)
+    curl.setopt(pycurl.HTTPHEADER, CHECK_LIVE_HEADERS)
+
+
+def _emit_response(signals: WorkerSignals, uid: str, status_code: int, body: str):
+    """Emits the check result for a completed transfer."""
+    signals.response_signal.emit(uid, status_code)
+    if status_code in RETRYABLE_STATUS_CODES:
+        error_msg = f"HTTP Error {status_code} for UID {uid}. Response: {body[:200]}..."
+        signals.retry_signal.emit(uid, error_msg)
+        return
+    if status_code != 200:
+        error_msg = f"HTTP Error {status_code} for UID {uid}. Response: {body[:200]}..."
+        signals.error_signal.emit(uid, error_msg)
+        signals.success_signal.emit(uid, False)
+        return
+    try:
+        data = json.loads(body)
+        is_live = bool(data.get("data", {}).get("height", False))
+        signals.success_signal.emit(uid, is_live)
+    except json.JSONDecodeError as e:
+        # A 200 with a broken body is a truncated or garbled transfer.
+        error_msg = f"JSON Decode Error for UID {uid}: {e}. Response: {body[:200]}..."
+        signals.retry_signal.emit(uid, error_msg)
+    except (TypeError, AttributeError, ValueError) as e:
+        # Valid JSON in an unexpected shape (a list, "data": null, ...).
+        error_msg = f"Unexpected response for UID {uid}: {e}. Response: {body[:200]}..."
+        signals.error_signal.emit(uid, error_msg)
+        signals.success_signal.emit(uid, False)
+
+
 class CheckLiveWorker(QRunnable):
     """
     Worker to perform a single check for a UID using pycurl.
+    Opens a new connection per UID; CheckLive uses CheckLiveMultiWorker instead.
     """
 
-    def __init__(self, uid: str):
+    def __init__(self, uid: str, url_template: str = CHECK_LIVE_URL):
         super().__init__()
         self.uid = uid
+        self.url_template = url_template
         self.signals = WorkerSignals()
         self.setAutoDelete(True)
 
@@ -36,43 +124,23 @@ class CheckLiveWorker(QRunnable):
     def run(self):
         buffer = io.BytesIO()
         curl = pycurl.Curl()
-        url = f"https://graph.facebook.com/{self.uid}/picture?redirect=false"
-        headers = [
-            "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-            "Accept: application/json",
-            "Accept-Language: en-US,en;q=0.9",
-            "Connection: keep-alive",
-        ]
-
         try:
-            curl.setopt(pycurl.URL, url)
+            _configure_handle(curl)
+            curl.setopt(pycurl.URL, self.url_template.format(uid=self.uid))
             curl.setopt(pycurl.WRITEFUNCTION, buffer.write)
-            curl.setopt(pycurl.CONNECTTIMEOUT, 10)
-            curl.setopt(pycurl.TIMEOUT, 20)
-            curl.setopt(pycurl.FOLLOWLOCATION, 1)
-            curl.setopt(pycurl.HTTPHEADER, headers)
             curl.perform()
 
             status_code = curl.getinfo(pycurl.RESPONSE_CODE)
             body = buffer.getvalue().decode("utf-8", errors="ignore")
-
-            if status_code != 200:
-                error_msg = f"HTTP Error {status_code} for UID {self.uid}. Response: {body[:200]}..."
-                self.signals.error_signal.emit(self.uid, error_msg)
-                self.signals.success_signal.emit(self.uid, False)
-            else:
-                try:
-                    data = json.loads(body)
-                    is_live = bool(data.get("data", {}).get("height", False))
-                    self.signals.success_signal.emit(self.uid, is_live)
-                except json.JSONDecodeError as e:
-                    error_msg = f"JSON Decode Error for UID {self.uid}: {e}. Response: {body[:200]}..."
-                    self.signals.error_signal.emit(self.uid, error_msg)
+            _emit_response(self.signals, self.uid, status_code, body)
 
         except pycurl.error as e:
             errno, errstr = e.args
             error_msg = f"PyCurl error {errno}: {errstr} for UID {self.uid}"
-            self.signals.error_signal.emit(self.uid, error_msg)
+            if errno in RETRYABLE_CURL_ERRORS:
+                self.signals.retry_signal.emit(self.uid, error_msg)
+            else:
+                self.signals.error_signal.emit(self.uid, error_msg)
 
         except Exception as e:
             error_msg = f"Unexpected error for UID {self.uid}: {e}"
@@ -84,89 +152,414 @@ class CheckLiveWorker(QRunnable):
             self.signals.finished.emit(self.uid)
 
 
+class CheckLiveMultiWorker(QRunnable):
+    """
+    Runs many checks concurrently on one thread with a pycurl.CurlMulti.
+
+    Easy handles are recycled, so their connections stay alive between checks
+    (HTTP/2 streams are multiplexed over them where the server allows it), and a
+    CurlShare keeps DNS answers and TLS sessions across runs. UIDs are fed through
+    `submit`; the worker returns once its queue is drained and is restarted by the
+    next `submit`.
+
+    The number of transfers in flight follows `concurrency` (an AIMD controller fed
+    with every response), and each upstream host gets a token bucket of
+    `host_rate_per_s` requests per second.
+    """
+
+    SELECT_TIMEOUT_S = 0.1
+
+    def __init__(
+        self,
+        threadpool: QThreadPool,
+        concurrency: AimdController,
+        host_rate_per_s: float,
+        url_template: str = CHECK_LIVE_URL,
+    ):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.threadpool = threadpool
+        self.concurrency = concurrency
+        self.host_rate_per_s = host_rate_per_s
+        self.url_template = url_template
+        self.signals = WorkerSignals()
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        # UIDs taken from the queue while their host had no token left.
+        self._deferred: deque[str] = deque()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._running = False
+        self._stopped = False
+
+        self._share = pycurl.CurlShare()
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+        self._multi = pycurl.CurlMulti()
+        self._multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+        self._free_handles: List[pycurl.Curl] = []
+
+    def submit(self, uid: str):
+        with self._lock:
+            self._queue.put(uid)
+            if self._running or self._stopped:
+                return
+            self._running = True
+        with _running_workers_lock:
+            _running_workers.add(self)
+        self.threadpool.start(self)
+
+    def stop(self) -> List[str]:
+        """Abandons queued checks; transfers in flight finish first.
+        Returns the UIDs that were dropped from the queue."""
+        with self._lock:
+            self._stopped = True
+        return self._take_queued()
+
+    def resume(self):
+        """Accepts checks again after `stop`."""
+        with self._lock:
+            self._stopped = False
+
+    def _take_queued(self) -> List[str]:
+        """Removes and returns the UIDs waiting for a transfer."""
+        queued = list(self._deferred)
+        self._deferred.clear()
+        while True:
+            try:
+                queued.append(self._queue.get_nowait())
+            except queue.Empty:
+                return queued
+
+    @pyqtSlot()
+    def run(self):
+        active: Dict[pycurl.Curl, Tuple[str, io.BytesIO]] = {}
+        try:
+            while True:
+                wait_s = self._start_transfers(active)
+                if not active:
+                    if wait_s > 0:
+                        time.sleep(wait_s)
+                        continue
+                    with self._lock:
+                        if self._stopped or (
+                            self._queue.empty() and not self._deferred
+                        ):
+                            self._finish_run()
+                            return
+                    continue
+                self._perform()
+                self._collect_finished(active)
+                if active:
+                    self._multi.select(
+                        min(wait_s or self.SELECT_TIMEOUT_S, self.SELECT_TIMEOUT_S)
+                    )
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.run] Unexpected error: {e}")
+            for curl, (uid, buffer) in active.items():
+                self._multi.remove_handle(curl)
+                self._release(curl, buffer)
+                self.signals.error_signal.emit(
+                    uid, f"Unexpected error for UID {uid}: {e}"
+                )
+                self.signals.finished.emit(uid)
+            # Queued checks would otherwise never report back.
+            with self._lock:
+                queued = self._take_queued()
+                self._finish_run()
+            for uid in queued:
+                self.signals.error_signal.emit(
+                    uid, f"Check abandoned for UID {uid} after an unexpected error: {e}"
+                )
+                self.signals.finished.emit(uid)
+
+    def _finish_run(self):
+        # Called with self._lock held, so a concurrent submit() either lands before
+        # (and is drained by this run) or sees _running False and starts a new one.
+        self._running = False
+        with _running_workers_lock:
+            _running_workers.discard(self)
+
+    def _start_transfers(
+        self, active: Dict[pycurl.Curl, Tuple[str, io.BytesIO]]
+    ) -> float:
+        """Starts transfers up to the concurrency limit. Returns the seconds until
+        a rate-limited host has a token again, or 0."""
+        while len(active) < self.concurrency.limit and not self._stopped:
+            if self._deferred:
+                uid = self._deferred.popleft()
+            else:
+                try:
+                    uid = self._queue.get_nowait()
+                except queue.Empty:
+                    return 0.0
+            url = self.url_template.format(uid=uid)
+            wait_s = self._bucket(url).try_acquire()
+            if wait_s > 0:
+                self._deferred.appendleft(uid)
+                return wait_s
+            curl = (
+                self._free_handles.pop() if self._free_handles else self._new_handle()
+            )
+            buffer = io.BytesIO()
+            curl.setopt(pycurl.URL, url)
+            curl.setopt(pycurl.WRITEFUNCTION, buffer.write)
+            self._multi.add_handle(curl)
+            active[curl] = (uid, buffer)
+        return 0.0
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.host_rate_per_s)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _on_congestion(self, url: str):
+        self._bucket(url).drain()
+        if self.concurrency.on_congestion():
+            print(
+                f"[{self.__class__.__name__}] Upstream is throttling, concurrency lowered to {self.concurrency.limit}."
+            )
+
+    def _perform(self):
+        while True:
+            ret, _ = self._multi.perform()
+            if ret != pycurl.E_CALL_MULTI_PERFORM:
+                return
+
+    def _collect_finished(self, active: Dict[pycurl.Curl, Tuple[str, io.BytesIO]]):
+        while True:
+            num_queued, succeeded, failed = self._multi.info_read()
+            for curl in succeeded:
+                uid, buffer = active.pop(curl)
+                status_code = curl.getinfo(pycurl.RESPONSE_CODE)
+                body = buffer.getvalue().decode("utf-8", errors="ignore")
+                if status_code in CONGESTION_STATUS_CODES:
+                    self._on_congestion(curl.getinfo(pycurl.EFFECTIVE_URL))
+                else:
+                    self.concurrency.on_success(curl.getinfo(pycurl.TOTAL_TIME))
+                self._multi.remove_handle(curl)
+                self._release(curl, buffer)
+                _emit_response(self.signals, uid, status_code, body)
+                self.signals.finished.emit(uid)
+            for curl, errno, errstr in failed:
+                uid, buffer = active.pop(curl)
+                if errno in CONGESTION_CURL_ERRORS:
+                    self._on_congestion(curl.getinfo(pycurl.EFFECTIVE_URL))
+                self._multi.remove_handle(curl)
+                self._release(curl, buffer)
+                error_msg = f"PyCurl error {errno}: {errstr} for UID {uid}"
+                if errno in RETRYABLE_CURL_ERRORS:
+                    self.signals.retry_signal.emit(uid, error_msg)
+                else:
+                    self.signals.error_signal.emit(uid, error_msg)
+                self.signals.finished.emit(uid)
+            if num_queued == 0:
+                return
+
+    def _new_handle(self) -> pycurl.Curl:
+        curl = pycurl.Curl()
+        _configure_handle(curl)
+        curl.setopt(pycurl.SHARE, self._share)
+        curl.setopt(pycurl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+        curl.setopt(pycurl.PIPEWAIT, 1)
+        return curl
+
+    def _release(self, curl: pycurl.Curl, buffer: io.BytesIO):
+        buffer.close()
+        self._free_handles.append(curl)
+
+
 class CheckLive(QObject):
     """
-    Manages a queue of CheckLiveWorker tasks using a QThreadPool,
-    handling concurrency and progress reporting.
+    Manages check-live tasks on a CheckLiveMultiWorker, handling progress reporting.
     Now accepts list of (id, uid) tuples and emits id in success signal.
+
+    Transient failures (timeouts, connection errors, 408/429/5xx) are not results:
+    the uid is re-submitted after an exponential backoff with full jitter, up to
+    MAX_RETRIES times, and only then reported through task_failed. Retries wait in
+    a heap served by one single-shot QTimer, so no thread sleeps on them.
+
+    `engine` picks the worker: "curl" (CheckLiveMultiWorker) or "asyncio"
+    (AsyncCheckLiveWorker, which also takes a `transport`).
     """
 
     task_succeeded = pyqtSignal(int, str, bool)
     task_failed = pyqtSignal(int, str, str)
     all_tasks_finished = pyqtSignal()
 
-    def __init__(self, parent=None):
+    # Concurrent transfers start at INITIAL_CONCURRENCY and adapt between
+    # MIN_CONCURRENCY and MAX_CONCURRENCY to the endpoint's latency and errors.
+    INITIAL_CONCURRENCY = 20
+    MIN_CONCURRENCY = 2
+    MAX_CONCURRENCY = 200
+    LATENCY_TARGET_S = 2.0
+    # Requests per second sent to any one upstream host.
+    HOST_RATE_PER_S = 300.0
+    # Retry n waits a random time in [0, min(RETRY_MAX_DELAY_S, RETRY_BASE_DELAY_S * 2**n)].
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY_S = 1.0
+    RETRY_MAX_DELAY_S = 60.0
+
+    def __init__(
+        self,
+        parent=None,
+        url_template: str = CHECK_LIVE_URL,
+        engine: str = constants.CHECK_LIVE_ENGINE,
+        transport=None,
+    ):
         super().__init__(parent)
-        self._pending_tasks: deque[Tuple[int, str]] = deque()
-        self._in_progress: Dict[str, Tuple[int, CheckLiveWorker]] = {}
+        self._in_progress: Dict[str, int] = {}
         self._failed: Dict[int, str] = {}
         self._succeeded: Dict[int, bool] = {}
+        self._status_codes: Dict[int, int] = {}
         self._total_tasks = 0
+        self._attempts: Dict[str, int] = {}
+        # (due time, uid) of checks waiting for a retry.
+        self._retry_queue: List[Tuple[float, str]] = []
+        self._retrying: Set[str] = set()
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._submit_due_retries)
+        self._stopped = False
 
-        self.threadpool = QThreadPool.globalInstance()
-        max_workers = min(5, self.threadpool.maxThreadCount())
-        self.threadpool.setMaxThreadCount(max_workers)
+        self.threadpool = check_live_threadpool()
+        self.concurrency = AimdController(
+            self.INITIAL_CONCURRENCY,
+            self.MIN_CONCURRENCY,
+            self.MAX_CONCURRENCY,
+            latency_target_s=self.LATENCY_TARGET_S,
+        )
+        if engine == "asyncio":
+            # Imported here: check_live_async builds on this module.
+            from src.services.check_live_async import AsyncCheckLiveWorker
+
+            self.worker = AsyncCheckLiveWorker(
+                self.concurrency, self.HOST_RATE_PER_S, url_template, transport
+            )
+        elif engine == "curl":
+            self.worker = CheckLiveMultiWorker(
+                self.threadpool, self.concurrency, self.HOST_RATE_PER_S, url_template
+            )
+        else:
+            raise ValueError(
+                f"[{self.__class__.__name__}.__init__] Unknown check-live engine: {engine}"
+            )
+        self.worker.signals.response_signal.connect(self._on_response)
+        self.worker.signals.success_signal.connect(self._on_success)
+        self.worker.signals.error_signal.connect(self._on_error)
+        self.worker.signals.retry_signal.connect(self._on_retry)
+        self.worker.signals.finished.connect(self._on_finished)
 
     @pyqtSlot(list)
     def add_tasks(self, tasks: List[Tuple[int, str]]):
         """
-        Accepts list of (id, uid) tuples.
+        Accepts list of (id, uid) tuples. Starts a new batch after `stop`.
         """
-        seen_uids = set(uid for _, uid in self._pending_tasks) | set(
-            self._in_progress.keys()
-        )
+        if self._stopped:
+            self._stopped = False
+            self.worker.resume()
         for record_id, uid in tasks:
-            if uid not in seen_uids:
-                self._pending_tasks.append((record_id, uid))
+            if uid not in self._in_progress:
+                self._in_progress[uid] = record_id
                 self._total_tasks += 1
-                seen_uids.add(uid)
+                self.worker.submit(uid)
 
-        self._try_start_tasks()
-
-    def _try_start_tasks(self):
+    def stop(self):
         """
-        Start queued tasks up to max concurrency.
+        Abandons queued checks and pending retries, reporting them through
+        task_failed; checks in flight finish and are not retried. The next
+        `add_tasks` starts a new batch.
         """
-        available = (
-            self.threadpool.maxThreadCount() - self.threadpool.activeThreadCount()
+        self._stopped = True
+        self._retry_timer.stop()
+        dropped = [uid for _, uid in self._retry_queue]
+        self._retry_queue.clear()
+        self._retrying.clear()
+        for uid in dropped + self.worker.stop():
+            self._on_error(uid, f"Check stopped before it ran for UID {uid}")
+            self._on_finished(uid)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (1-based)."""
+        return random.uniform(
+            0, min(self.RETRY_MAX_DELAY_S, self.RETRY_BASE_DELAY_S * 2**attempt)
         )
-        while available > 0 and self._pending_tasks:
-            record_id, uid = self._pending_tasks.popleft()
-            worker = CheckLiveWorker(uid)
-            worker.signals.success_signal.connect(self._on_success)
-            worker.signals.error_signal.connect(self._on_error)
-            worker.signals.finished.connect(self._on_finished)
 
-            self._in_progress[uid] = (record_id, worker)
-            self.threadpool.start(worker)
-            available -= 1
+    @pyqtSlot(str, str)
+    def _on_retry(self, uid: str, error_msg: str):
+        record_id = self._in_progress.get(uid)
+        if record_id is None:
+            return
+        if self._stopped:
+            self._on_error(uid, f"{error_msg} (not retried, the check was stopped)")
+            return
+        attempt = self._attempts.get(uid, 0) + 1
+        if attempt > self.MAX_RETRIES:
+            # Still unknown: report it, but leave the account's status alone.
+            self._on_error(
+                uid, f"{error_msg} (gave up after {self.MAX_RETRIES} retries)"
+            )
+            return
+        self._attempts[uid] = attempt
+        self._retrying.add(uid)
+        heapq.heappush(
+            self._retry_queue, (time.monotonic() + self.retry_delay(attempt), uid)
+        )
+        self._schedule_retry_timer()
+
+    def _schedule_retry_timer(self):
+        if not self._retry_queue:
+            return
+        wait_s = max(0.0, self._retry_queue[0][0] - time.monotonic())
+        self._retry_timer.start(int(wait_s * 1000) + 1)
+
+    @pyqtSlot()
+    def _submit_due_retries(self):
+        now = time.monotonic()
+        while self._retry_queue and self._retry_queue[0][0] <= now:
+            _, uid = heapq.heappop(self._retry_queue)
+            self._retrying.discard(uid)
+            self.worker.submit(uid)
+        self._schedule_retry_timer()
+
+    @pyqtSlot(str, int)
+    def _on_response(self, uid: str, status_code: int):
+        record_id = self._in_progress.get(uid)
+        if record_id is not None:
+            self._status_codes[record_id] = status_code
 
     @pyqtSlot(str, bool)
     def _on_success(self, uid: str, is_live: bool):
-        record_id, _ = self._in_progress.get(uid, (None, None))
+        record_id = self._in_progress.get(uid)
         if record_id is not None:
             self._succeeded[record_id] = is_live
             self.task_succeeded.emit(record_id, uid, is_live)
 
     @pyqtSlot(str, str)
     def _on_error(self, uid: str, error_msg: str):
-        record_id, _ = self._in_progress.get(uid, (None, None))
+        record_id = self._in_progress.get(uid)
         if record_id is not None:
             self._failed[record_id] = error_msg
             self.task_failed.emit(record_id, uid, error_msg)
 
     @pyqtSlot(str)
     def _on_finished(self, uid: str):
+        if uid in self._retrying:
+            return
+        self._attempts.pop(uid, None)
         if uid in self._in_progress:
             del self._in_progress[uid]
-        if not self._pending_tasks and not self._in_progress:
+        if not self._in_progress:
             self.all_tasks_finished.emit()
 
     def _check_if_done(self) -> bool:
         """
         Checks if all tasks have been completed (succeeded or failed).
         """
-        is_done = not self._pending_tasks and not self._in_progress
+        is_done = not self._in_progress
         processed_count = len(self._succeeded) + len(self._failed)
         if self._total_tasks > 0 and processed_count != self._total_tasks:
             print(
@@ -180,3 +573,6 @@ class CheckLive(QObject):
 
     def get_failed(self) -> Dict[int, str]:
         return self._failed
+
+    def get_status_code(self, record_id: int) -> Optional[int]:
+        return self._status_codes.get(record_id)
@@ -0,0 +1,342 @@
+# src/services/check_live_async.py
+import asyncio
+import ssl
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from src.services.check_live import (
+    CHECK_LIVE_HEADERS,
+    CHECK_LIVE_URL,
+    CONGESTION_STATUS_CODES,
+    WorkerSignals,
+    _emit_response,
+)
+from src.services.rate_limit import AimdController, TokenBucket
+
+
+class CheckLiveTransport(Protocol):
+    """
+    Fetches check-live URLs for AsyncCheckLiveWorker.
+
+    `fetch` returns (status_code, body). Timeouts and connection failures are
+    raised as asyncio.TimeoutError / OSError and are retried; anything else is
+    reported as an error. `aclose` is awaited when the worker's event loop ends.
+    """
+
+    async def fetch(self, url: str) -> Tuple[int, str]: ...
+
+    async def aclose(self): ...
+
+
+class HttpStreamTransport:
+    """
+    Minimal HTTP/1.1 client on asyncio streams, with keep-alive connections
+    reused per host. Enough for the check-live endpoint; not a general client.
+    """
+
+    CONNECT_TIMEOUT_S = 10
+    TIMEOUT_S = 20
+    MAX_REDIRECTS = 5
+    MAX_IDLE_PER_HOST = 256
+
+    def __init__(self, headers: List[str] = CHECK_LIVE_HEADERS):
+        self._headers = "".join(f"{header}\r\n" for header in headers)
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._idle: Dict[
+            Tuple[str, str, int],
+            List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]],
+        ] = {}
+
+    async def fetch(self, url: str) -> Tuple[int, str]:
+        return await asyncio.wait_for(self._fetch(url), self.TIMEOUT_S)
+
+    async def aclose(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def _fetch(self, url: str) -> Tuple[int, str]:
+        for _ in range(self.MAX_REDIRECTS + 1):
+            status_code, headers, body = await self._request(url)
+            location = headers.get("location")
+            if status_code not in (301, 302, 303, 307, 308) or not location:
+                return status_code, body.decode("utf-8", errors="ignore")
+            url = urljoin(url, location)
+        raise OSError(f"Too many redirects for {url}")
+
+    async def _request(self, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        parts = urlsplit(url)
+        is_https = parts.scheme == "https"
+        key = (
+            parts.scheme,
+            parts.hostname or "",
+            parts.port or (443 if is_https else 80),
+        )
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request = (
+            f"GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\n{self._headers}\r\n"
+        ).encode()
+
+        idle = self._idle.get(key)
+        if idle:
+            reader, writer = idle.pop()
+            try:
+                return await self._exchange(key, reader, writer, request)
+            except (OSError, asyncio.IncompleteReadError):
+                # The server closed the idle connection; retry on a new one.
+                pass
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                key[1], key[2], ssl=self._ssl() if is_https else None
+            ),
+            self.CONNECT_TIMEOUT_S,
+        )
+        return await self._exchange(key, reader, writer, request)
+
+    async def _exchange(
+        self,
+        key: Tuple[str, str, int],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: bytes,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        try:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("Connection closed before the response")
+            status_code = int(status_line.split()[1])
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                body = await self._read_chunked(reader)
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                body = await reader.read()
+                headers["connection"] = "close"
+        except BaseException:
+            writer.close()
+            raise
+
+        idle = self._idle.setdefault(key, [])
+        if (
+            headers.get("connection", "").lower() == "close"
+            or len(idle) >= self.MAX_IDLE_PER_HOST
+        ):
+            writer.close()
+        else:
+            idle.append((reader, writer))
+        return status_code, headers, body
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Trailers end with an empty line.
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    def _ssl(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+
+class AsyncCheckLiveWorker:
+    """
+    Runs checks as coroutines on an asyncio event loop in its own thread.
+
+    A drop-in for CheckLiveMultiWorker behind CheckLive: same `submit`, `stop`
+    and `resume`, same WorkerSignals, the same AIMD concurrency limit and
+    per-host token buckets. The loop runs while there is work and is restarted
+    by the next `submit`. The transport is injectable, so the engine can run against a stub
+    without any network (see src/test/load_check_live.py).
+    """
+
+    def __init__(
+        self,
+        concurrency: AimdController,
+        host_rate_per_s: float,
+        url_template: str = CHECK_LIVE_URL,
+        transport: Optional[CheckLiveTransport] = None,
+    ):
+        self.concurrency = concurrency
+        self.host_rate_per_s = host_rate_per_s
+        self.url_template = url_template
+        self.transport = transport if transport is not None else HttpStreamTransport()
+        self.signals = WorkerSignals()
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._pending: Deque[str] = deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self._stopped = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def submit(self, uid: str):
+        with self._lock:
+            if self._stopped:
+                return
+            self._pending.append(uid)
+            if self._running:
+                if self._loop is not None:
+                    self._loop.call_soon_threadsafe(self._wake.set)
+                return
+            self._running = True
+        threading.Thread(
+            target=asyncio.run, args=(self._run(),), name="check-live", daemon=True
+        ).start()
+
+    def stop(self) -> List[str]:
+        """Abandons queued checks; checks in flight finish first.
+        Returns the UIDs that were dropped from the queue."""
+        with self._lock:
+            self._stopped = True
+            dropped = list(self._pending)
+            self._pending.clear()
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._wake.set)
+        return dropped
+
+    def resume(self):
+        """Accepts checks again after `stop`."""
+        with self._lock:
+            self._stopped = False
+
+    async def _run(self):
+        # Checks in flight, with their UIDs.
+        active: Dict[asyncio.Task, str] = {}
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+        try:
+            while True:
+                wait_s = self._start_checks(active)
+                with self._lock:
+                    is_idle = not active and (self._stopped or not self._pending)
+                    self._wake.clear()
+                if is_idle:
+                    # Connections belong to this loop; close them before a
+                    # later submit() can start another one.
+                    await self.transport.aclose()
+                    if self._finish_run():
+                        return
+                    continue
+                try:
+                    await asyncio.wait_for(self._wake.wait(), wait_s or None)
+                except asyncio.TimeoutError:
+                    pass
+        except Exception as e:
+            print(f"[{self.__class__.__name__}._run] Unexpected error: {e}")
+            in_flight = dict(active)
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            await self.transport.aclose()
+            # Cancelled and queued checks would otherwise never report back.
+            # Under the lock, so a later submit() starts a new run instead of
+            # waking this one.
+            with self._lock:
+                queued = [uid for task, uid in in_flight.items() if task.cancelled()]
+                queued.extend(self._pending)
+                self._pending.clear()
+                self._running = False
+                self._loop = None
+            for uid in queued:
+                self.signals.error_signal.emit(
+                    uid, f"Check abandoned for UID {uid} after an unexpected error: {e}"
+                )
+                self.signals.finished.emit(uid)
+
+    def _finish_run(self) -> bool:
+        """Ends the run unless a submit() arrived meanwhile."""
+        with self._lock:
+            if self._pending and not self._stopped:
+                return False
+            self._running = False
+            self._loop = None
+            return True
+
+    def _start_checks(self, active: Dict[asyncio.Task, str]) -> float:
+        """Starts checks up to the concurrency limit. Returns the seconds until
+        a rate-limited host has a token again, or 0."""
+        while len(active) < self.concurrency.limit:
+            with self._lock:
+                if self._stopped or not self._pending:
+                    return 0.0
+                uid = self._pending.popleft()
+            try:
+                url = self.url_template.format(uid=uid)
+                wait_s = self._bucket(url).try_acquire()
+            except Exception:
+                # Leave it queued, so _run reports it.
+                with self._lock:
+                    self._pending.appendleft(uid)
+                raise
+            if wait_s > 0:
+                with self._lock:
+                    self._pending.appendleft(uid)
+                return wait_s
+            task = asyncio.create_task(self._check(uid, url))
+            active[task] = uid
+            task.add_done_callback(self._on_check_done(active))
+        return 0.0
+
+    def _on_check_done(self, active: Dict[asyncio.Task, str]):
+        def callback(task: asyncio.Task):
+            active.pop(task, None)
+            self._wake.set()
+
+        return callback
+
+    async def _check(self, uid: str, url: str):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            status_code, body = await self.transport.fetch(url)
+        except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError) as e:
+            self._on_congestion(url)
+            error_msg = f"Transport error {type(e).__name__}: {e} for UID {uid}"
+            self.signals.retry_signal.emit(uid, error_msg)
+        except Exception as e:
+            error_msg = f"Unexpected error for UID {uid}: {e}"
+            self.signals.error_signal.emit(uid, error_msg)
+        else:
+            if status_code in CONGESTION_STATUS_CODES:
+                self._on_congestion(url)
+            else:
+                self.concurrency.on_success(loop.time() - started)
+            _emit_response(self.signals, uid, status_code, body)
+        # A cancelled check skips this; _run reports it.
+        self.signals.finished.emit(uid)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.host_rate_per_s)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _on_congestion(self, url: str):
+        self._bucket(url).drain()
+        if self.concurrency.on_congestion():
+            print(
+                f"[{self.__class__.__name__}] Upstream is throttling, concurrency lowered to {self.concurrency.limit}."
+            )
@@ -0,0 +1,147 @@
+# src/services/check_live_cache.py
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src import constants
+from src.services.base_service import transaction
+
+
+class CheckLiveResult(NamedTuple):
+    is_live: bool
+    http_status: Optional[int]
+    checked_at: float
+
+
+class CheckLiveCache:
+    """
+    Last check-live result per uid, persisted in TABLE_CHECK_LIVE_CACHE.
+
+    The whole table is loaded into memory once, after rows older than the TTL
+    are deleted; lookups never hit the database. New results are kept in
+    memory right away and written in batches by `flush` (automatically every
+    FLUSH_BATCH_SIZE results).
+    """
+
+    FLUSH_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        db: QSqlDatabase,
+        ttl_s: float = constants.CHECK_LIVE_CACHE_TTL_S,
+    ):
+        self._db = db
+        self.ttl_s = ttl_s
+        self._results: Dict[str, CheckLiveResult] = {}
+        self._pending: Dict[str, CheckLiveResult] = {}
+
+    def load(self) -> bool:
+        """Deletes expired rows, then reads every cached result into memory."""
+        self.prune()
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        if not query.exec(
+            f"SELECT uid, is_live, http_status, checked_at FROM {constants.TABLE_CHECK_LIVE_CACHE}"
+        ):
+            error_msg = f"[{self.__class__.__name__}.load] Query failed. Error: {query.lastError().text()}"
+            print(error_msg)
+            return False
+        results = {}
+        while query.next():
+            http_status = query.value(2)
+            results[query.value(0)] = CheckLiveResult(
+                bool(query.value(1)),
+                int(http_status) if http_status not in (None, "") else None,
+                float(query.value(3)),
+            )
+        self._results = results
+        return True
+
+    def prune(self, now: Optional[float] = None) -> bool:
+        """Deletes the rows whose result is older than the TTL."""
+        now = time.time() if now is None else now
+        query = QSqlQuery(self._db)
+        query.prepare(
+            f"DELETE FROM {constants.TABLE_CHECK_LIVE_CACHE} WHERE checked_at < ?"
+        )
+        query.addBindValue(now - self.ttl_s)
+        if not query.exec():
+            error_msg = f"[{self.__class__.__name__}.prune] Failed to delete expired results. Error: {query.lastError().text()}"
+            print(error_msg)
+            return False
+        return True
+
+    def get_fresh(
+        self, uid: str, now: Optional[float] = None
+    ) -> Optional[CheckLiveResult]:
+        """The cached result for `uid` if it is younger than the TTL."""
+        result = self._results.get(uid)
+        now = time.time() if now is None else now
+        if result is None or now - result.checked_at > self.ttl_s:
+            return None
+        return result
+
+    def split_fresh(
+        self, tasks: Iterable[Tuple[int, str]], force: bool = False
+    ) -> Tuple[List[Tuple[int, str, CheckLiveResult]], List[Tuple[int, str]]]:
+        """
+        Splits (id, uid) tasks into those with a fresh cached result and those that
+        need a check. With `force`, every task needs a check.
+
+        Returns:
+            ([(id, uid, result)], [(id, uid)])
+        """
+        if force:
+            return [], list(tasks)
+        now = time.time()
+        fresh = []
+        stale = []
+        for record_id, uid in tasks:
+            result = self.get_fresh(uid, now)
+            if result is None:
+                stale.append((record_id, uid))
+            else:
+                fresh.append((record_id, uid, result))
+        return fresh, stale
+
+    def record(self, uid: str, is_live: bool, http_status: Optional[int] = None):
+        result = CheckLiveResult(is_live, http_status, time.time())
+        self._results[uid] = result
+        self._pending[uid] = result
+        if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+            self.flush()
+
+    def invalidate(self, uids: Iterable[str]):
+        """Forgets the results of `uids` (in memory; the rows are pruned once expired)."""
+        for uid in uids:
+            self._results.pop(uid, None)
+            self._pending.pop(uid, None)
+
+    def flush(self) -> bool:
+        """Writes pending results with one batched statement in a transaction."""
+        if not self._pending:
+            return True
+        pending = self._pending
+        self._pending = {}
+
+        query = QSqlQuery(self._db)
+        query.prepare(
+            f"INSERT OR REPLACE INTO {constants.TABLE_CHECK_LIVE_CACHE} "
+            f"(uid, is_live, http_status, checked_at) VALUES (?, ?, ?, ?)"
+        )
+        query.addBindValue(list(pending.keys()))
+        query.addBindValue([int(result.is_live) for result in pending.values()])
+        query.addBindValue([result.http_status for result in pending.values()])
+        query.addBindValue([result.checked_at for result in pending.values()])
+
+        flushed = False
+        with transaction(self._db):
+            if not query.execBatch():
+                error_msg = f"[{self.__class__.__name__}.flush] Failed to write results. Error: {query.lastError().text()}"
+                raise RuntimeError(error_msg)
+            flushed = True
+        if not flushed:
+            for uid, result in pending.items():
+                self._pending.setdefault(uid, result)
+        return flushed
@@ -0,0 +1,134 @@
+# src/services/proxy_lease.py
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from src.robot.browser_worker import get_proxy, parse_ready_in_s
+from src.services.timer_wheel import TimerWheel
+
+
+class ProxyLeaseManager(QObject):
+    """
+    Resolves rotating-proxy credentials ahead of time, so workers start with a
+    ready {server, username, password} lease instead of calling the proxy API
+    right before launching a browser.
+
+    `prefetch` queues a proxy URL for one of PREFETCH_THREADS background threads.
+    A resolved lease is kept for LEASE_TTL_S and handed out once by `take`;
+    one that expired unused is fetched again the next time it is asked for. A
+    proxy that is not ready yet is fetched again when the provider says it will
+    be (on a TimerWheel), a failed fetch after RETRY_DELAY_S, and an unavailable
+    proxy is reported through `proxy_unavailable`.
+
+    State lives on the GUI thread; the threads only run `get_proxy`.
+    """
+
+    lease_ready = pyqtSignal(str)
+    proxy_unavailable = pyqtSignal(str)
+    # (proxy_url, result or exception) from a fetch thread.
+    _fetched = pyqtSignal(str, object)
+
+    PREFETCH_THREADS = 4
+    LEASE_TTL_S = 120.0
+    RETRY_DELAY_S = 30.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._leases: Dict[str, Tuple[dict, float]] = {}
+        self._fetching: Set[str] = set()
+        self._waiting: Set[str] = set()
+        self._requests: "queue.Queue[str]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._wait_wheel = TimerWheel(parent=self)
+        self._wait_wheel.expired.connect(self._on_wait_expired)
+        self._fetched.connect(self._on_fetched)
+
+    def prefetch(self, proxy_url: str):
+        """Starts resolving `proxy_url` unless it has a lease or is on its way."""
+        if (
+            self.has_lease(proxy_url)
+            or proxy_url in self._fetching
+            or proxy_url in self._waiting
+        ):
+            return
+        self._fetching.add(proxy_url)
+        self._requests.put(proxy_url)
+        if len(self._threads) < self.PREFETCH_THREADS:
+            thread = threading.Thread(
+                target=self._run_thread, name="proxy-prefetch", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def has_lease(self, proxy_url: str) -> bool:
+        """Whether a lease for `proxy_url` is ready. An expired one is dropped
+        and fetched again."""
+        lease = self._leases.get(proxy_url)
+        if lease is None:
+            return False
+        if lease[1] <= time.monotonic():
+            del self._leases[proxy_url]
+            self.prefetch(proxy_url)
+            return False
+        return True
+
+    def take(self, proxy_url: str) -> Optional[dict]:
+        """The lease for `proxy_url` if one is ready; it is handed out once.
+        Without one the caller fetches the proxy itself, so none is started."""
+        lease = self._leases.pop(proxy_url, None)
+        if lease is None or lease[1] <= time.monotonic():
+            return None
+        return lease[0]
+
+    def forget(self, proxy_url: str):
+        self._leases.pop(proxy_url, None)
+        self._waiting.discard(proxy_url)
+
+    def _run_thread(self):
+        while True:
+            proxy_url = self._requests.get()
+            try:
+                result = get_proxy(proxy_url)
+            except Exception as e:
+                result = e
+            self._fetched.emit(proxy_url, result)
+
+    @pyqtSlot(str, object)
+    def _on_fetched(self, proxy_url: str, result):
+        self._fetching.discard(proxy_url)
+        if isinstance(result, Exception):
+            print(
+                f"[{self.__class__.__name__}._on_fetched] Failed to fetch proxy ({proxy_url}): {result}"
+            )
+            self._wait(proxy_url, self.RETRY_DELAY_S)
+            return
+        status = int(result.get("status") or 0)
+        if status == 100 and result.get("data"):
+            self._leases[proxy_url] = (
+                result["data"],
+                time.monotonic() + self.LEASE_TTL_S,
+            )
+            self.lease_ready.emit(proxy_url)
+        elif status == 101:
+            self._wait(proxy_url, parse_ready_in_s(result.get("message")))
+        elif status == 102:
+            self.proxy_unavailable.emit(proxy_url)
+        else:
+            print(
+                f"[{self.__class__.__name__}._on_fetched] Unexpected answer for proxy ({proxy_url}): {result}"
+            )
+            self._wait(proxy_url, self.RETRY_DELAY_S)
+
+    def _wait(self, proxy_url: str, delay_s: float):
+        self._waiting.add(proxy_url)
+        self._wait_wheel.schedule(delay_s, proxy_url)
+
+    @pyqtSlot(list)
+    def _on_wait_expired(self, proxy_urls: List[str]):
+        for proxy_url in proxy_urls:
+            if proxy_url in self._waiting:
+                self._waiting.discard(proxy_url)
+                self.prefetch(proxy_url)
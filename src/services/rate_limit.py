@@ -0,0 +1,100 @@
+# src/services/rate_limit.py
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Allows `rate_per_s` operations per second on average, with bursts of up to
+    `burst`. Not thread-safe; use one bucket per thread.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_per_s = rate_per_s
+        self.burst = burst if burst is not None else max(rate_per_s, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated_at = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate_per_s
+        )
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """Takes a token. Returns 0 on success, otherwise the seconds to wait
+        before one is available."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate_per_s
+
+    def drain(self):
+        """Drops the saved-up burst, e.g. after the upstream asked to slow down."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+class AimdController:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit, as in TCP
+    congestion control.
+
+    Until the first congestion signal the limit grows by `increase` per healthy
+    completion (slow start: it doubles every window of requests). After that every
+    healthy completion grows it by `increase / limit`, i.e. about `increase` per
+    window. A congestion signal (429, 5xx, timeout or latency above
+    `latency_target_s`) multiplies it by `decrease_factor`, at most once per
+    `cooldown_s` so one burst of failures counts once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_target_s: float = 2.0,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target_s = latency_target_s
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown_s = cooldown_s
+        self._clock = clock
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._last_decrease_at = float("-inf")
+        self._slow_start = True
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_success(self, latency_s: float):
+        if latency_s > self.latency_target_s:
+            self.on_congestion()
+            return
+        step = self.increase if self._slow_start else self.increase / self._limit
+        self._limit = min(self.maximum, self._limit + step)
+
+    def on_congestion(self) -> bool:
+        """Returns True if the limit was lowered."""
+        now = self._clock()
+        if now - self._last_decrease_at < self.cooldown_s:
+            return False
+        self._last_decrease_at = now
+        self._slow_start = False
+        self._limit = max(self.minimum, self._limit * self.decrease_factor)
+        return True
@@ -1,12 +1,15 @@
 # src/services/service_product.py
 from typing import Optional, List
 from src.services.base_service import BaseService
+from src.services.service_search import SearchService
+from src.database.db_product import RE_PRODUCT_FTS_COLUMNS, MISC_PRODUCT_FTS_COLUMNS
 from src.models.model_product import MiscProductModel, REProductModel, RETemplateModel
 from src.my_types import MiscProductType, REProductType, RETemplateType
 
 
 class REProductService(BaseService):
     DATA_TYPE = REProductType
+    IMPORT_CONFLICT_KEY = "pid"
 
     def __init__(self, model: REProductModel):
         if not isinstance(model, REProductModel):
@@ -14,6 +17,9 @@ class REProductService(BaseService):
                 "model must be an instance of REProductModel or its subclass."
             )
         super().__init__(model)
+        self.search_service = SearchService(
+            self._db.connectionName(), self.model.tableName(), RE_PRODUCT_FTS_COLUMNS
+        )
 
     def create(self, payload: REProductType) -> bool:
         return super().create(payload)
@@ -33,11 +39,13 @@ class REProductService(BaseService):
     def delete_multiple(self, record_ids: List[int]):
         return super().delete_multiple(record_ids)
 
-    def import_data(self, payload: List[REProductType]):
-        return super().import_data(payload)
+    def import_data(self, payload: List[REProductType], on_conflict: str = "abort"):
+        return super().import_data(payload, on_conflict)
 
     def find_by_pid(self, pid: str) -> Optional[REProductType]:
-        return self._find_by_model_index(find_method_name="find_row_by_pid", value=pid)
+        return self._find_by_model_index(
+            find_method_name="find_row_by_pid", value=pid, field_name="pid"
+        )
 
     def toggle_status(self, product_id: str) -> bool:
         """
@@ -84,6 +92,7 @@ class REProductService(BaseService):
 
 class MiscProductService(BaseService):
     DATA_TYPE = MiscProductType
+    IMPORT_CONFLICT_KEY = "pid"
 
     def __init__(self, model: MiscProductModel):
         if not isinstance(model, MiscProductModel):
@@ -91,6 +100,9 @@ class MiscProductService(BaseService):
                 "model must be an instance of MiscProductModel or its subclass."
             )
         super().__init__(model)
+        self.search_service = SearchService(
+            self._db.connectionName(), self.model.tableName(), MISC_PRODUCT_FTS_COLUMNS
+        )
 
     def create(self, payload: MiscProductModel) -> bool:
         return super().create(payload)
@@ -110,11 +122,13 @@ class MiscProductService(BaseService):
     def delete_multiple(self, record_ids: List[int]):
         return super().delete_multiple(record_ids)
 
-    def import_data(self, payload: List[MiscProductModel]):
-        return super().import_data(payload)
+    def import_data(self, payload: List[MiscProductModel], on_conflict: str = "abort"):
+        return super().import_data(payload, on_conflict)
 
     def find_by_pid(self, pid: str) -> Optional[MiscProductModel]:
-        return self._find_by_model_index(find_method_name="find_row_by_pid", value=pid)
+        return self._find_by_model_index(
+            find_method_name="find_row_by_pid", value=pid, field_name="pid"
+        )
 
     def toggle_status(self, product_id: str) -> bool:
         """
@@ -161,6 +175,7 @@ class MiscProductService(BaseService):
 
 class RETemplateService(BaseService):
     DATA_TYPE = RETemplateType
+    IMPORT_CONFLICT_KEY = "tid"
 
     def __init__(self, model: RETemplateModel):
         if not isinstance(model, RETemplateModel):
@@ -187,5 +202,5 @@ class RETemplateService(BaseService):
     def delete_multiple(self, record_ids: List[int]):
         return super().delete_multiple(record_ids)
 
-    def import_data(self, payload: List[RETemplateType]):
-        return super().import_data(payload)
+    def import_data(self, payload: List[RETemplateType], on_conflict: str = "abort"):
+        return super().import_data(payload, on_conflict)
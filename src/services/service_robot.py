@@ -1,8 +1,13 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from collections import deque
-from PyQt6.QtCore import QThreadPool, QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
 
+from src import constants
+from src.robot.browser_process import ProcessBrowserBackend
+from src.robot.browser_runtime import BrowserRuntimePool
 from src.robot.browser_worker import BrowserWorker
+from src.services.proxy_lease import ProxyLeaseManager
+from src.services.timer_wheel import TimerWheel
 from src.my_types import RobotTaskType
 
 
@@ -11,20 +16,67 @@ class RobotService(QObject):
     task_failed_signal = pyqtSignal(RobotTaskType)
     all_task_finished = pyqtSignal()
 
+    # Browser tasks run on warm Playwright drivers, one per runtime thread. A
+    # driver is replaced after RUNTIME_RECYCLE_AFTER_TASKS tasks or once it uses
+    # more than RUNTIME_MAX_DRIVER_RSS_MB, and stops after RUNTIME_IDLE_TIMEOUT_S.
+    RUNTIME_RECYCLE_AFTER_TASKS = 50
+    RUNTIME_MAX_DRIVER_RSS_MB = 512
+    RUNTIME_IDLE_TIMEOUT_S = 300.0
+    # With the "process" backend: runtime threads in each of the
+    # idealThreadCount() worker processes.
+    RUNTIME_THREADS_PER_PROCESS = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.max_worker_num = 0
         self._pending_tasks: deque[RobotTaskType] = deque()
         self._pending_proxies: deque[str] = deque()
+        # (task, proxy) pairs whose proxy became ready; started before new pairs.
+        self._ready_pairs: deque[Tuple[RobotTaskType, str]] = deque()
+        # (task, proxy) pairs waiting for a rotating proxy to become ready, and
+        # uid -> proxy of those pairs.
+        self._proxy_wait_wheel = TimerWheel(parent=self)
+        self._proxy_wait_wheel.expired.connect(self.on_proxies_ready)
+        self._waiting_proxies: Dict[str, str] = {}
+        # Credentials of _pending_proxies, resolved in the background.
+        self.proxy_leases = ProxyLeaseManager(self)
+        self.proxy_leases.lease_ready.connect(self.on_proxy_lease_ready)
+        self.proxy_leases.proxy_unavailable.connect(self.on_proxy_unavailable)
         self._in_progress: Dict[str, dict] = {}
         self._total_tasks = 0
 
-        self.threadpool = QThreadPool.globalInstance()
+        self.backend = self._create_backend(constants.ROBOT_BACKEND)
+
+    def _create_backend(self, backend: str):
+        if backend == "process":
+            return ProcessBrowserBackend(
+                max_processes=QThread.idealThreadCount(),
+                threads_per_process=self.RUNTIME_THREADS_PER_PROCESS,
+                recycle_after_tasks=self.RUNTIME_RECYCLE_AFTER_TASKS,
+                max_driver_rss_mb=self.RUNTIME_MAX_DRIVER_RSS_MB,
+                idle_timeout_s=self.RUNTIME_IDLE_TIMEOUT_S,
+            )
+        if backend == "thread":
+            return BrowserRuntimePool(
+                max_runtimes=QThread.idealThreadCount(),
+                recycle_after_tasks=self.RUNTIME_RECYCLE_AFTER_TASKS,
+                max_driver_rss_mb=self.RUNTIME_MAX_DRIVER_RSS_MB,
+                idle_timeout_s=self.RUNTIME_IDLE_TIMEOUT_S,
+            )
+        raise ValueError(
+            f"[{self.__class__.__name__}._create_backend] Unknown robot backend: {backend}"
+        )
 
     @pyqtSlot(list, list)
     def add_tasks(self, list_task: List[RobotTaskType], list_proxy: List[str]):
-        existing_uid = set(task.user_info.uid for task in self._pending_tasks) | set(
-            key for key in self._in_progress.keys()
+        existing_uid = (
+            set(task.user_info.uid for task in self._pending_tasks)
+            | set(key for key in self._in_progress.keys())
+            | set(task.user_info.uid for task, _ in self._ready_pairs)
+            | set(self._waiting_proxies.keys())
+        )
+        parked_proxies = set(self._waiting_proxies.values()) | set(
+            proxy for _, proxy in self._ready_pairs
         )
         add_uid_in_current_call = set()
 
@@ -37,8 +89,9 @@ class RobotService(QObject):
                 self._total_tasks += 1
                 add_uid_in_current_call.add(task.user_info.uid)
         for proxy in list_proxy:
-            if proxy not in self._pending_proxies:
+            if proxy not in self._pending_proxies and proxy not in parked_proxies:
                 self._pending_proxies.append(proxy)
+                self.proxy_leases.prefetch(proxy)
 
         self._try_start_tasks()
 
@@ -47,40 +100,58 @@ class RobotService(QObject):
 
     def _try_start_tasks(self):
         available = min(
-            self.threadpool.maxThreadCount() - self.threadpool.activeThreadCount(),
+            self.backend.max_runtimes - len(self._in_progress),
             self.max_worker_num,
-            len(self._pending_proxies),
         )
-        while available > 0 and self._pending_tasks and self._pending_proxies:
-            task = self._pending_tasks.popleft()
-            proxy = self._pending_proxies.popleft()
+        while available > 0:
+            if self._ready_pairs:
+                task, proxy = self._ready_pairs.popleft()
+                # The worker fetches the proxy itself unless a lease is ready.
+                lease = self.proxy_leases.take(proxy)
+            else:
+                leased_proxy = self._pop_leased_proxy() if self._pending_tasks else None
+                if leased_proxy is None:
+                    break
+                task = self._pending_tasks.popleft()
+                proxy, lease = leased_proxy
+            self._start_worker(task, proxy, lease)
+            available -= 1
+        if self.check_if_done():
+            self.handle_all_task_finished()
 
-            worker = BrowserWorker(
-                task=task,
-                proxy=proxy,
-            )
+    def _pop_leased_proxy(self) -> Optional[Tuple[str, dict]]:
+        """The first pending proxy whose credentials are resolved, with them."""
+        for proxy in self._pending_proxies:
+            if self.proxy_leases.has_lease(proxy):
+                self._pending_proxies.remove(proxy)
+                return proxy, self.proxy_leases.take(proxy)
+        return None
 
-            available -= 1
-            self._in_progress[task.user_info.uid] = {
-                "task": task,
-                "proxy": proxy,
-                "worker": worker,
-            }
-
-            worker.signals.error_signal.connect(self.on_worker_error)
-            worker.signals.succeeded_signal.connect(self.on_worker_succeeded)
-            worker.signals.failed_signal.connect(self.on_worker_failed)
-            worker.signals.proxy_unavailable_signal.connect(
-                self.on_worker_proxy_unavailable
-            )
-            worker.signals.proxy_not_ready_signal.connect(
-                self.on_worker_proxy_not_ready
-            )
-            worker.signals.progress_signal.connect(self.on_worker_progress)
+    def _start_worker(
+        self, task: RobotTaskType, proxy: str, lease: Optional[dict] = None
+    ):
+        worker = BrowserWorker(
+            task=task,
+            proxy=proxy,
+            lease=lease,
+        )
 
-            self.threadpool.start(worker)
-        if not self._pending_tasks and not self._in_progress:
-            self.handle_all_task_finished()
+        self._in_progress[task.user_info.uid] = {
+            "task": task,
+            "proxy": proxy,
+            "worker": worker,
+        }
+
+        worker.signals.error_signal.connect(self.on_worker_error)
+        worker.signals.succeeded_signal.connect(self.on_worker_succeeded)
+        worker.signals.failed_signal.connect(self.on_worker_failed)
+        worker.signals.proxy_unavailable_signal.connect(
+            self.on_worker_proxy_unavailable
+        )
+        worker.signals.proxy_not_ready_signal.connect(self.on_worker_proxy_not_ready)
+        worker.signals.progress_signal.connect(self.on_worker_progress)
+
+        self.backend.submit(worker)
 
     def set_max_worker(self, max_worker_num: int):
         self.max_worker_num = max_worker_num
@@ -88,34 +159,79 @@ class RobotService(QObject):
     def handle_all_task_finished(self):
         print("Finished!")
 
+    def shutdown(self):
+        """Stops the Playwright drivers once the running tasks are done."""
+        self.backend.shutdown()
+
     def check_if_done(self) -> bool:
-        return not self._pending_tasks and not self._in_progress
+        return (
+            not self._pending_tasks
+            and not self._in_progress
+            and not self._ready_pairs
+            and not self._waiting_proxies
+        )
+
+    def _release_task(self, task: RobotTaskType) -> bool:
+        """Frees the slot of a finished task and puts its proxy back in the pool.
+        Returns False if the task was already released (an action that reported
+        an error still ends with succeeded_signal)."""
+        entry = self._in_progress.pop(task.user_info.uid, None)
+        if entry is None:
+            return False
+        self._pending_proxies.append(entry["proxy"])
+        self.proxy_leases.prefetch(entry["proxy"])
+        return True
 
     @pyqtSlot(RobotTaskType, str, str)
     def on_worker_succeeded(self, task: RobotTaskType, proxy: str, message: str):
         print(f"[{task.user_info.uid}] {message}.")
-        self._pending_proxies.append(proxy)
-        if task.user_info.uid in self._in_progress.keys():
-            del self._in_progress[task.user_info.uid]
-        self._try_start_tasks()
+        if self._release_task(task):
+            self._try_start_tasks()
 
     @pyqtSlot(RobotTaskType, str)
     def on_worker_proxy_unavailable(self, task: RobotTaskType, proxy_url: str):
         print(
             f"[{task.user_info.uid}] Unavailable proxy ({proxy_url})",
         )
+        self._in_progress.pop(task.user_info.uid, None)
         self._pending_tasks.append(task)
         self._try_start_tasks()
 
-    @pyqtSlot(RobotTaskType, str)
-    def on_worker_proxy_not_ready(self, task: RobotTaskType, proxy_url: str):
-        self._pending_tasks.append(task)
-        self._pending_proxies.append(proxy_url)
+    @pyqtSlot(RobotTaskType, str, int)
+    def on_worker_proxy_not_ready(
+        self, task: RobotTaskType, proxy_url: str, ready_in_s: int
+    ):
+        # Park the pair until the provider says the proxy is ready; the worker's
+        # thread is already free for other tasks.
+        print(f"[{task.user_info.uid}] Waiting {ready_in_s}s for proxy ({proxy_url})")
+        self._in_progress.pop(task.user_info.uid, None)
+        self._waiting_proxies[task.user_info.uid] = proxy_url
+        self._proxy_wait_wheel.schedule(ready_in_s, (task, proxy_url))
+        self._try_start_tasks()
+
+    @pyqtSlot(list)
+    def on_proxies_ready(self, pairs: List[Tuple[RobotTaskType, str]]):
+        for task, proxy_url in pairs:
+            self._waiting_proxies.pop(task.user_info.uid, None)
+            self._ready_pairs.append((task, proxy_url))
         self._try_start_tasks()
 
+    @pyqtSlot(str)
+    def on_proxy_lease_ready(self, proxy_url: str):
+        self._try_start_tasks()
+
+    @pyqtSlot(str)
+    def on_proxy_unavailable(self, proxy_url: str):
+        print(f"Unavailable proxy ({proxy_url})")
+        if proxy_url in self._pending_proxies:
+            self._pending_proxies.remove(proxy_url)
+        self.proxy_leases.forget(proxy_url)
+
     @pyqtSlot(RobotTaskType, str)
     def on_worker_error(self, task: RobotTaskType, message: str):
         print(f"[{task.user_info.uid}] Error message: {message}")
+        if self._release_task(task):
+            self._try_start_tasks()
 
     @pyqtSlot(RobotTaskType, str)
     def on_worker_failed(self, task: RobotTaskType, message: str):
@@ -0,0 +1,103 @@
+# src/services/service_search.py
+from typing import Dict, List, Optional, Sequence
+
+from PyQt6.QtSql import QSqlQuery
+
+from src.database.connection_manager import thread_database
+from src.database.fts import fts_table_name
+
+# The trigram tokenizer can only MATCH terms of at least three characters.
+FTS_MIN_TERM_LENGTH = 3
+
+
+class SearchService:
+    """
+    Full-text search over a table's FTS5 index (see `src.database.fts`).
+
+    Results are record ids, best matches first. Every term is a case-insensitive
+    substring search, like the page filters it backs.
+    """
+
+    def __init__(self, connection_name: str, table_name: str, columns: Sequence[str]):
+        self.connection_name = connection_name
+        self.table_name = table_name
+        self.fts_table = fts_table_name(table_name)
+        self.columns = tuple(columns)
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[int]:
+        """Ids of the records whose indexed columns contain `text`."""
+        if not text:
+            return []
+        if len(text) < FTS_MIN_TERM_LENGTH:
+            return self._run(
+                " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in self.columns),
+                [_like_pattern(text)] * len(self.columns),
+                has_match=False,
+                limit=limit,
+            )
+        return self._run(
+            f"{self.fts_table} MATCH ?", [_phrase(text)], has_match=True, limit=limit
+        )
+
+    def search_fields(
+        self, field_filters: Dict[str, str], limit: Optional[int] = None
+    ) -> List[int]:
+        """Ids of the records where every field contains its text.
+
+        Raises:
+            ValueError: If a field is not part of the index.
+        """
+        unknown_fields = set(field_filters) - set(self.columns)
+        if unknown_fields:
+            raise ValueError(
+                f"[{self.__class__.__name__}.search_fields] Fields not indexed: {sorted(unknown_fields)}"
+            )
+        match_terms = []
+        conditions = []
+        params = []
+        for field_name, text in field_filters.items():
+            if not text:
+                continue
+            if len(text) >= FTS_MIN_TERM_LENGTH:
+                match_terms.append(f"{field_name} : {_phrase(text)}")
+            else:
+                conditions.append(f"{field_name} LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(text))
+        if not match_terms and not conditions:
+            return []
+        if match_terms:
+            conditions.insert(0, f"{self.fts_table} MATCH ?")
+            params.insert(0, " AND ".join(match_terms))
+        return self._run(
+            " AND ".join(conditions), params, has_match=bool(match_terms), limit=limit
+        )
+
+    def _run(
+        self, where: str, params: List[str], has_match: bool, limit: Optional[int]
+    ) -> List[int]:
+        sql = f"SELECT rowid FROM {self.fts_table} WHERE {where}"
+        sql += " ORDER BY rank" if has_match else " ORDER BY rowid"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        query = QSqlQuery(thread_database(self.connection_name))
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for param in params:
+            query.addBindValue(param)
+        if not query.exec():
+            error_msg = f"[{self.__class__.__name__}._run] Search failed. Error: {query.lastError().text()}. => return []"
+            print(error_msg)
+            return []
+        ids = []
+        while query.next():
+            ids.append(int(query.value(0)))
+        return ids
+
+
+def _phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
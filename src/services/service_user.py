@@ -1,9 +1,15 @@
 # src/services/service_user.py
 import os
 import shutil
+from datetime import datetime
 from fake_useragent import UserAgent
-from typing import Optional, List
-from src.services.base_service import BaseService
+from typing import Optional, List, Dict
+from PyQt6.QtCore import QTimer
+from PyQt6.QtSql import QSqlQuery
+from src.services.base_service import BaseService, transaction
+from src.services.service_search import SearchService
+from src.services.check_live_cache import CheckLiveCache
+from src.database.db_user import USER_FTS_COLUMNS
 from src.models.model_user import (
     UserModel,
     ListedProductModel,
@@ -19,17 +25,37 @@ from src.my_types import (
     UserActionType,
 )
 
+_NOT_CACHED = object()
+
 
 class UserService(BaseService):
     DATA_TYPE = UserType
-
-    def __init__(self, model: UserModel):
+    IMPORT_CONFLICT_KEY = "uid"
+    STATUS_FLUSH_INTERVAL_MS = 500
+    STATUS_FLUSH_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        model: UserModel,
+        listed_product_service: Optional["ListedProductService"] = None,
+    ):
         if not isinstance(model, UserModel):
             raise TypeError("model must be an instance of UserModel or its subclass.")
         super().__init__(model)
-        self.listed_product_service = None
+        self.search_service = SearchService(
+            self._db.connectionName(), self.model.tableName(), USER_FTS_COLUMNS
+        )
+        self.check_live_cache = CheckLiveCache(self._db)
+        self.check_live_cache.load()
+        self.listed_product_service = listed_product_service
         self.udd_service = None
 
+        self._pending_status: Dict[int, int] = {}
+        self._status_flush_timer = QTimer()
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(self.STATUS_FLUSH_INTERVAL_MS)
+        self._status_flush_timer.timeout.connect(self.flush_status)
+
     def create(self, payload: UserType) -> bool:
         ua_desktop = UserAgent(os="Mac OS X")
         ua_mobile = UserAgent(os="iOS")
@@ -40,6 +66,9 @@ class UserService(BaseService):
     def read(self, record_id: int) -> Optional[UserType]:
         return super().read(record_id)
 
+    def read_many(self, record_ids: List[int]) -> List[UserType]:
+        return super().read_many(record_ids)
+
     def read_all(self) -> List[UserType]:
         return super().read_all()
 
@@ -59,14 +88,24 @@ class UserService(BaseService):
         return super().delete(record_id)
 
     def delete_multiple(self, record_ids):
-        self.listed_product_service.delete_multiple(record_ids)
+        # Listed products reference their user, so they go first.
+        if self.listed_product_service is None:
+            info_msg = f"[{self.__class__.__name__}.delete_multiple] No ListedProductService to delete the users' listed products with. => return False"
+            print(info_msg)
+            return False
+        if not self.listed_product_service.delete_by_user_ids(record_ids):
+            info_msg = f"[{self.__class__.__name__}.delete_multiple] Failed to delete the users' listed products. => return False"
+            print(info_msg)
+            return False
         return super().delete_multiple(record_ids)
 
-    def import_data(self, payload: List[UserType]):
-        return super().import_data(payload)
+    def import_data(self, payload: List[UserType], on_conflict: str = "abort"):
+        return super().import_data(payload, on_conflict)
 
     def find_by_uid(self, uid: str) -> Optional[UserType]:
-        return self._find_by_model_index(find_method_name="find_row_by_uid", value=uid)
+        return self._find_by_model_index(
+            find_method_name="find_row_by_uid", value=uid, field_name="uid"
+        )
 
     def update_status(self, record_id: int, new_status: int) -> bool:
         """
@@ -104,8 +143,78 @@ class UserService(BaseService):
             )
             return False
 
+    def queue_status(self, record_id: int, new_status: int):
+        """
+        Buffers a status change to be written by the next `flush_status`.
+
+        The buffer is flushed once STATUS_FLUSH_BATCH_SIZE changes are pending,
+        or STATUS_FLUSH_INTERVAL_MS after the first change was queued. A later
+        change for the same user replaces the pending one.
+
+        Raises:
+            ValueError: If `new_status` is not 0 or 1.
+        """
+        if new_status not in [0, 1]:
+            raise ValueError(
+                f"Invalid status value: {new_status}. Status must be 0 or 1."
+            )
+        self._pending_status[record_id] = new_status
+        if len(self._pending_status) >= self.STATUS_FLUSH_BATCH_SIZE:
+            self.flush_status()
+        elif not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def flush_status(self) -> bool:
+        """
+        Writes all buffered status changes in a single transaction with one
+        batched UPDATE, then refreshes only the affected rows in the model.
+
+        Returns:
+            bool: True if the buffer is empty or was written, False otherwise.
+                  On failure the changes are put back into the buffer.
+        """
+        self._status_flush_timer.stop()
+        if not self._pending_status:
+            return True
+        if not self._db.isOpen():
+            info_msg = f"[{self.__class__.__name__}.flush_status] Database is not open. => return False"
+            print(info_msg)
+            return False
+        pending = self._pending_status
+        self._pending_status = {}
+
+        record_ids = list(pending.keys())
+        updated_at = str(datetime.now())
+        query = QSqlQuery(self._db)
+        query.prepare(
+            f"UPDATE {self.model.tableName()} SET status = ?, updated_at = ? WHERE id = ?"
+        )
+        query.addBindValue([pending[record_id] for record_id in record_ids])
+        query.addBindValue([updated_at] * len(record_ids))
+        query.addBindValue(record_ids)
+
+        flushed = False
+        with transaction(self._db):
+            if not query.execBatch():
+                error_msg = f"[{self.__class__.__name__}.flush_status] Failed to write statuses. Error: {query.lastError().text()}"
+                raise RuntimeError(error_msg)
+            flushed = True
+        if not flushed:
+            for record_id, status in pending.items():
+                self._pending_status.setdefault(record_id, status)
+            return False
+
+        for record_id in record_ids:
+            row = self.model.get_row_by_id(record_id)
+            if row != -1:
+                self.model.selectRow(row)
+        print(
+            f"[{self.__class__.__name__}.flush_status] Wrote status for {len(record_ids)} user(s)."
+        )
+        return True
+
     def get_uids_by_record_ids(self, record_ids: List[int]) -> List[str]:
-        return self.model.get_uids_by_record_ids(record_ids)
+        return [user.uid for user in self.read_many(record_ids)]
 
     def handle_new_desktop_ua(self) -> str:
         ua_desktop = UserAgent(os="Mac OS X")
@@ -142,6 +251,30 @@ class ListedProductService(BaseService):
     def delete_multiple(self, record_ids):
         return super().delete_multiple(record_ids)
 
+    def delete_by_user_ids(self, user_ids: List[int]) -> bool:
+        """
+        Deletes every listed product that belongs to one of the given users.
+
+        Args:
+            user_ids (List[int]): IDs of the users whose products are removed.
+
+        Returns:
+            bool: True if the statement succeeded (even if nothing matched),
+            False if the database is not open or the deletion was rolled back.
+        """
+        if not self._db.isOpen():
+            info_msg = f"[{self.__class__.__name__}.delete_by_user_ids] Database is not open. => return False"
+            print(info_msg)
+            return False
+        if not user_ids:
+            return True
+        deleted_count = self._delete_where_in("user_id", user_ids)
+        if deleted_count == -1:
+            return False
+        if deleted_count > 0:
+            self.model.select()
+        return True
+
     def read_by_user_id(self, user_id: int) -> List[ListedProductType]:
         """
         Retrieves a list of products associated with a specific user ID.
@@ -172,8 +305,7 @@ class ListedProductService(BaseService):
         rows = self.model.get_rows_by_user_id(user_id)
         results = []
         for row in rows:
-            record = self.model.record(row)
-            results.append(self._map_record_to_datatype(record))
+            results.append(self._map_row_to_datatype(row))
         return results
 
     def shift_record_by_user_id(self, user_id: int) -> Optional[ListedProductType]:
@@ -220,8 +352,7 @@ class ListedProductService(BaseService):
             return None
         row_index_to_remove = rows_to_remove[0]
         try:
-            record_to_return = self.model.record(row_index_to_remove)
-            removed_data_instance = self._map_record_to_datatype(record_to_return)
+            removed_data_instance = self._map_row_to_datatype(row_index_to_remove)
             if removed_data_instance is None:
                 error_msg = f"[{self.__class__.__name__}.shift_record_by_user_id] Failed to map record to DATA_TYPE for row {row_index_to_remove}."
                 print(error_msg)
@@ -256,6 +387,15 @@ class UserSettingUDDService(BaseService):
                 "model must be an instance of UserSettingUDDType or its subclass."
             )
         super().__init__(model)
+        # Cached value of the selected UDD; _NOT_CACHED until the next lookup.
+        self._selected_value = _NOT_CACHED
+        self.model.modelReset.connect(self._invalidate_selected)
+        self.model.dataChanged.connect(self._invalidate_selected)
+        self.model.rowsInserted.connect(self._invalidate_selected)
+        self.model.rowsRemoved.connect(self._invalidate_selected)
+
+    def _invalidate_selected(self, *args):
+        self._selected_value = _NOT_CACHED
 
     def read(self, record_id: int) -> UserSettingUDDType:
         return super().read(record_id)
@@ -266,38 +406,66 @@ class UserSettingUDDService(BaseService):
     def read_all(self) -> List[UserSettingUDDType]:
         return super().read_all()
 
+    def update(self, record_id: int, payload: UserSettingUDDType) -> bool:
+        self._invalidate_selected()
+        return super().update(record_id, payload)
+
     def delete(self, record_id: int) -> bool:
+        self._invalidate_selected()
         return super().delete(record_id)
 
     def delete_multiple(self, record_ids):
+        self._invalidate_selected()
         return super().delete_multiple(record_ids)
 
     def set_selected(self, record_id: int) -> bool:
-        udds = self.read_all()
-        for udd in udds:
-            udd.is_selected = 0
-            self.update(udd.id, udd)
-
+        """Marks one UDD as selected and clears every other one with a single UPDATE."""
         current_udd = self.read(record_id)
-        current_udd.is_selected = 1
-        update_success = self.update(record_id, current_udd)
-        if update_success:
+        if current_udd is None:
             print(
-                f"[{self.__class__.__name__}.set_selected] Successfully toggled status for udd ID '{record_id}' to 1."
+                f"[{self.__class__.__name__}.set_selected] UDD ID '{record_id}' not found."
             )
-            return True
-        else:
+            return False
+
+        query = QSqlQuery(self._db)
+        query.prepare(
+            f"UPDATE {self.model.tableName()} SET is_selected = (id = ?), updated_at = ? "
+            f"WHERE is_selected IS NOT (id = ?)"
+        )
+        query.addBindValue(record_id)
+        query.addBindValue(str(datetime.now()))
+        query.addBindValue(record_id)
+        if not query.exec():
             print(
-                f"[{self.__class__.__name__}.set_selected] Failed to update status for udd ID '{record_id}'."
+                f"[{self.__class__.__name__}.set_selected] Failed to update status for udd ID '{record_id}'. Error: {query.lastError().text()}"
             )
             return False
+        if query.numRowsAffected() > 0:
+            self.model.select()
+        self._selected_value = current_udd.value
+        print(
+            f"[{self.__class__.__name__}.set_selected] Successfully toggled status for udd ID '{record_id}' to 1."
+        )
+        return True
 
     def get_selected(self) -> Optional[str]:
-        udds = self.read_all()
-        for udd in udds:
-            if udd.is_selected == 1:
-                return udd.value
-        return None
+        if self._selected_value is _NOT_CACHED:
+            self._selected_value = self._read_selected()
+        return self._selected_value
+
+    def _read_selected(self) -> Optional[str]:
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        if not query.exec(
+            f"SELECT value FROM {self.model.tableName()} WHERE is_selected = 1 LIMIT 1"
+        ):
+            print(
+                f"[{self.__class__.__name__}.get_selected] Query failed. Error: {query.lastError().text()}"
+            )
+            return None
+        value = query.value(0) if query.next() else None
+        query.finish()
+        return value
 
 
 class UserSettingProxyService(BaseService):
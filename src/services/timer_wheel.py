@@ -0,0 +1,82 @@
+# src/services/timer_wheel.py
+import math
+import time
+from typing import Any, List, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class TimerWheel(QObject):
+    """
+    Hashed timer wheel on the Qt event loop: items are parked in one of
+    `slot_count` slots, `tick_s` apart, and `expired` emits the items that came
+    due on each tick. Scheduling is O(1) however many items are parked, and one
+    QTimer drives the wheel, only while it holds items.
+
+    Delays longer than a turn of the wheel wait extra rounds in their slot.
+    """
+
+    expired = pyqtSignal(list)
+
+    def __init__(self, tick_s: float = 1.0, slot_count: int = 512, parent=None):
+        super().__init__(parent)
+        self.tick_s = tick_s
+        self._slots: List[List[Tuple[int, Any]]] = [[] for _ in range(slot_count)]
+        self._current = 0
+        self._count = 0
+        self._last_tick_at = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(tick_s * 1000))
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay_s: float, item: Any):
+        """Emits `item` through `expired` after about `delay_s` (rounded up to a
+        tick)."""
+        if not self._timer.isActive():
+            self._last_tick_at = time.monotonic()
+            self._timer.start()
+        ticks = max(1, math.ceil(delay_s / self.tick_s))
+        rounds, offset = divmod(ticks, len(self._slots))
+        if offset == 0:
+            rounds, offset = rounds - 1, len(self._slots)
+        slot = (self._current + offset) % len(self._slots)
+        self._slots[slot].append((rounds, item))
+        self._count += 1
+
+    def clear(self) -> List[Any]:
+        """Removes and returns every parked item."""
+        items = [item for slot in self._slots for _, item in slot]
+        for slot in self._slots:
+            slot.clear()
+        self._count = 0
+        self._timer.stop()
+        return items
+
+    def _on_timeout(self):
+        # Catch up on ticks the event loop was too busy to deliver.
+        now = time.monotonic()
+        ticks = max(1, int((now - self._last_tick_at) / self.tick_s))
+        self._last_tick_at += ticks * self.tick_s
+        due = []
+        for _ in range(min(ticks, len(self._slots))):
+            self._current = (self._current + 1) % len(self._slots)
+            due.extend(self._advance_slot(self._current))
+        if self._count == 0:
+            self._timer.stop()
+        if due:
+            self.expired.emit(due)
+
+    def _advance_slot(self, index: int) -> List[Any]:
+        due = []
+        waiting = []
+        for rounds, item in self._slots[index]:
+            if rounds == 0:
+                due.append(item)
+            else:
+                waiting.append((rounds - 1, item))
+        self._slots[index] = waiting
+        self._count -= len(due)
+        return due
@@ -0,0 +1,130 @@
+# src/test/bench_check_live.py
+# Usage: python -m src.test.bench_check_live [uids] [latency_ms] [max_in_flight]
+# Runs the check-live engines against a local stub of the picture endpoint.
+# With max_in_flight, the stub answers 429 while more requests are in progress,
+# like a rate-limiting upstream.
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QThreadPool
+
+from src.services.check_live import CheckLive, CheckLiveWorker
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency_s = 0.05
+    max_in_flight = 0
+    in_flight = 0
+    throttled = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = StubHandler
+        with cls.lock:
+            cls.in_flight += 1
+            is_throttled = 0 < cls.max_in_flight < cls.in_flight
+            cls.throttled += is_throttled
+        try:
+            time.sleep(self.latency_s)
+            if is_throttled:
+                self._reply(429, {"error": "rate limited"})
+                return
+            uid = self.path.strip("/").split("/")[0]
+            # Every uid ending in an even digit is live.
+            height = 50 if uid[-1:] in "02468" else 0
+            self._reply(200, {"data": {"height": height}})
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _reply(self, status_code: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for every concurrent connect of the multi engine.
+    request_queue_size = 1024
+
+
+def start_stub_server() -> StubServer:
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_legacy(uids, url_template: str) -> float:
+    """One pycurl handle and connection per uid on 5 pool threads (the old CheckLive)."""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(5)
+    remaining = {"count": len(uids)}
+    loop = QEventLoop()
+
+    def on_finished(uid):
+        remaining["count"] -= 1
+        if remaining["count"] == 0:
+            loop.quit()
+
+    # Keep the workers referenced until their queued signals are delivered.
+    workers = [CheckLiveWorker(uid, url_template) for uid in uids]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.signals.finished.connect(on_finished)
+        pool.start(worker)
+    loop.exec()
+    elapsed = time.perf_counter() - started
+    pool.waitForDone()
+    return elapsed
+
+
+def run_engine(uids, url_template: str, engine: str) -> float:
+    check_live = CheckLive(url_template=url_template, engine=engine)
+    loop = QEventLoop()
+    check_live.all_tasks_finished.connect(loop.quit)
+    started = time.perf_counter()
+    check_live.add_tasks(list(enumerate(uids)))
+    loop.exec()
+    elapsed = time.perf_counter() - started
+    results = check_live.get_results()
+    assert len(results) == len(uids), f"{len(results)} of {len(uids)} checked"
+    print(
+        f"  concurrency limit settled at {check_live.concurrency.limit}, "
+        f"{len(check_live.get_failed())} failed check(s)"
+    )
+    return elapsed
+
+
+if __name__ == "__main__":
+    app = QCoreApplication([])
+    uid_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    StubHandler.latency_s = (int(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+    StubHandler.max_in_flight = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    server = start_stub_server()
+    url_template = f"http://127.0.0.1:{server.server_port}/{{uid}}/picture"
+    uids = [str(100000 + i) for i in range(uid_count)]
+
+    legacy_s = run_legacy(uids, url_template)
+    legacy_throttled = StubHandler.throttled
+    multi_s = run_engine(uids, url_template, "curl")
+    multi_throttled = StubHandler.throttled - legacy_throttled
+    async_s = run_engine(uids, url_template, "asyncio")
+    async_throttled = StubHandler.throttled - legacy_throttled - multi_throttled
+    print(
+        f"{uid_count} uids, {StubHandler.latency_s * 1000:.0f} ms upstream latency:\n"
+        f"  per-uid handles, 5 threads: {legacy_s:.2f}s ({uid_count / legacy_s:.0f} checks/s, {legacy_throttled} throttled)\n"
+        f"  CurlMulti, adaptive:        {multi_s:.2f}s ({uid_count / multi_s:.0f} checks/s, {multi_throttled} throttled)\n"
+        f"  asyncio, adaptive:          {async_s:.2f}s ({uid_count / async_s:.0f} checks/s, {async_throttled} throttled)"
+    )
+    server.shutdown()
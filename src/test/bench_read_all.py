@@ -0,0 +1,112 @@
+# src/test/bench_read_all.py
+# Usage: python -m src.test.bench_read_all [rows]
+import os
+import sys
+import tempfile
+import time
+from dataclasses import fields
+from typing import Any, Dict
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtSql import QSqlRecord
+
+from src import constants
+from src.my_types import UserType
+
+
+def legacy_map_record_to_datatype(service, record: QSqlRecord):
+    """The per-row mapping BaseService used before the cached record plan
+    (called on model.record(row) for every row)."""
+    data: Dict[str, Any] = {}
+    for i in range(record.count()):
+        data[record.fieldName(i)] = record.value(i)
+    dataclass_field_names = {f.name for f in fields(service.DATA_TYPE)}
+    valid_data = {field: data.get(field) for field in dataclass_field_names}
+    return service.DATA_TYPE(**valid_data)
+
+
+def make_user(i: int) -> UserType:
+    return UserType(
+        id=None,
+        uid=f"bench_{i}",
+        username=f"bench_{i}",
+        password="password",
+        two_fa=None,
+        email=f"bench_{i}@example.com",
+        email_password=None,
+        phone_number=None,
+        note=f"note {i}",
+        type="bench",
+        user_group=1,
+        mobile_ua=None,
+        desktop_ua=None,
+        status=1,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+def read_model_rows_legacy(service):
+    """read_all before the cached record plan: every model row via model.record()."""
+    return [
+        legacy_map_record_to_datatype(service, service.model.record(row))
+        for row in range(service.model.rowCount())
+    ]
+
+
+def read_model_rows(service):
+    """read_all before it streamed from the database: every model row through
+    the cached record plan (needs the whole table fetched into the model)."""
+    return [
+        service._map_row_to_datatype(row) for row in range(service.model.rowCount())
+    ]
+
+
+def best_time(read, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        read()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    app = QApplication([])
+    constants.PATH_DB_USER = os.path.join(tempfile.mkdtemp(), "bench_user.db")
+
+    from src.database.db_user import initialize_db_user
+    from src.models.model_user import UserModel
+    from src.services.service_user import UserService
+
+    if not initialize_db_user():
+        raise Exception("Initialize user database failed!")
+    user_service = UserService(UserModel())
+    user_service.import_data([make_user(i) for i in range(rows)])
+    # The iter_all path reads the database, so it does not need the model loaded.
+    streamed = best_time(lambda: list(user_service.iter_all()))
+    assert len(user_service.read_all()) == rows
+
+    fetch_started = time.perf_counter()
+    while user_service.model.canFetchMore():
+        user_service.model.fetchMore()
+    fetch_s = time.perf_counter() - fetch_started
+    print(
+        f"Loaded {user_service.model.rowCount()} rows into the model in {fetch_s:.3f}s."
+    )
+    legacy = best_time(lambda: read_model_rows_legacy(user_service))
+    per_row = best_time(lambda: read_model_rows(user_service))
+
+    print(f"model rows, record() mapping:   {legacy:.3f}s ({rows / legacy:.0f} rows/s)")
+    print(
+        f"model rows, cached plan:        {per_row:.3f}s ({rows / per_row:.0f} rows/s)"
+    )
+    print(
+        f"iter_all (streamed from the db): {streamed:.3f}s ({rows / streamed:.0f} rows/s)"
+    )
+    print(
+        f"speed-up of iter_all: {legacy / streamed:.2f}x vs record() mapping, "
+        f"{per_row / streamed:.2f}x vs cached plan "
+        f"({(per_row + fetch_s) / streamed:.2f}x counting the model fetch)"
+    )
@@ -0,0 +1,59 @@
+# src/test/check_check_live_stop.py
+# Usage: python -m src.test.check_check_live_stop
+# Stops a CheckLive batch on the asyncio engine against the offline StubTransport,
+# then adds another batch to the same CheckLive. Exits with status 1 if a
+# stopped check is not reported, or if the next batch does not run.
+import sys
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from src.services.check_live import CheckLive
+from src.test.load_check_live import StubTransport
+
+
+def run_until_finished(check_live: CheckLive, timeout_s: float = 10.0):
+    loop = QEventLoop()
+    check_live.all_tasks_finished.connect(loop.quit)
+    QTimer.singleShot(int(timeout_s * 1000), loop.quit)
+    loop.exec()
+    check_live.all_tasks_finished.disconnect(loop.quit)
+
+
+def check(ok: bool, name: str, detail) -> int:
+    print(f"[{'OK' if ok else 'FAIL'}] {name}")
+    if not ok:
+        print(f"    {detail}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    app = QCoreApplication([])
+    transport = StubTransport(latency_s=0.05)
+    check_live = CheckLive(engine="asyncio", transport=transport)
+    failures = 0
+
+    first = [(record_id, str(100000 + record_id)) for record_id in range(200)]
+    check_live.add_tasks(first)
+    QTimer.singleShot(20, check_live.stop)
+    run_until_finished(check_live)
+    reported = len(check_live.get_results()) + len(check_live.get_failed())
+    failures += check(
+        reported == len(first) and check_live._check_if_done(),
+        "every check of a stopped batch is reported",
+        f"{reported} of {len(first)} reported",
+    )
+
+    second = [(record_id, str(100000 + record_id)) for record_id in range(200, 300)]
+    check_live.add_tasks(second)
+    run_until_finished(check_live)
+    checked = [
+        record_id for record_id, _ in second if record_id in check_live.get_results()
+    ]
+    failures += check(
+        len(checked) == len(second) and check_live._check_if_done(),
+        "a batch added after stop() runs",
+        f"{len(checked)} of {len(second)} checked",
+    )
+
+    print(f"{failures} check(s) failed.")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,110 @@
+# src/test/check_model_writes.py
+# Usage: python -m src.test.check_model_writes [rows]
+# Writes single users through UserService on a windowed UserModel that has not
+# loaded the whole table, then scrolls to the end with fetchMore(). Exits with
+# status 1 if the model ends up with duplicated or missing rows, if
+# get_row_by_id stops finding loaded rows, or if is_fully_loaded() disagrees.
+import os
+import sys
+import tempfile
+from collections import Counter
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtSql import QSqlQuery, QSqlTableModel
+
+from src import constants
+from src.test.bench_read_all import make_user
+
+
+def table_ids(service) -> list:
+    query = QSqlQuery(service._db)
+    query.exec(f"SELECT id FROM {service.model.tableName()}")
+    ids = []
+    while query.next():
+        ids.append(query.value(0))
+    return ids
+
+
+def model_ids(service) -> list:
+    id_col = service.model.fieldIndex("id")
+    return [
+        service.model.data(service.model.index(row, id_col))
+        for row in range(service.model.rowCount())
+    ]
+
+
+def fetch_all(service):
+    while service.model.canFetchMore():
+        service.model.fetchMore()
+
+
+def check_after(service, name: str) -> int:
+    """Scrolls to the end, then compares the model with the table."""
+    fetch_all(service)
+    ids = model_ids(service)
+    duplicates = [record_id for record_id, count in Counter(ids).items() if count > 1]
+    missing = set(table_ids(service)) - set(ids)
+    wrong_rows = [
+        record_id
+        for row, record_id in enumerate(ids)
+        if service.model.get_row_by_id(record_id) != row
+    ]
+    fully_loaded = service.model.is_fully_loaded()
+    ok = not duplicates and not missing and not wrong_rows and fully_loaded
+    print(f"[{'OK' if ok else 'FAIL'}] {name}")
+    if not ok:
+        print(
+            f"    {len(ids)} model row(s), {len(duplicates)} duplicated id(s), "
+            f"{len(missing)} missing, {len(wrong_rows)} not found by get_row_by_id, "
+            f"is_fully_loaded() {fully_loaded}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1501
+    app = QApplication([])
+    constants.PATH_DB_USER = os.path.join(tempfile.mkdtemp(), "check_user.db")
+
+    from src.database.db_user import initialize_db_user
+    from src.models.model_user import UserModel
+    from src.services.service_user import UserService
+
+    if not initialize_db_user():
+        raise Exception("Initialize user database failed!")
+    user_service = UserService(UserModel())
+    user_service.import_data([make_user(i) for i in range(rows)])
+    failures = 0
+
+    user_service.refresh()
+    created = user_service.create(make_user(rows))
+    failures += (not created) + check_after(user_service, "create() then fetchMore()")
+
+    user_service.refresh()
+    loaded_id = model_ids(user_service)[0]
+    edited = make_user(0)
+    edited.note = "edited"
+    updated = user_service.update(loaded_id, edited)
+    failures += (not updated) + check_after(
+        user_service, "update() of a loaded row then fetchMore()"
+    )
+    row = user_service.model.get_row_by_id(loaded_id)
+    note = user_service.model.data(
+        user_service.model.index(row, user_service.model.fieldIndex("note"))
+    )
+    ok = note == "edited"
+    print(f"[{'OK' if ok else 'FAIL'}] the model shows the updated row")
+    failures += 0 if ok else 1
+
+    # A row patched through the model buffer makes Qt load rows twice; the
+    # windowed model must notice at the end of the table and reselect.
+    user_service.refresh()
+    model = user_service.model
+    model.setEditStrategy(QSqlTableModel.EditStrategy.OnRowChange)
+    model.setData(model.index(0, model.fieldIndex("note")), "patched in the buffer")
+    model.submit()
+    model.setEditStrategy(QSqlTableModel.EditStrategy.OnManualSubmit)
+    failures += check_after(user_service, "a model that loaded rows twice reselects")
+
+    print(f"{failures} check(s) failed.")
+    sys.exit(1 if failures else 0)
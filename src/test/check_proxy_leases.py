@@ -0,0 +1,126 @@
+# src/test/check_proxy_leases.py
+# Usage: python -m src.test.check_proxy_leases
+# Runs RobotService offline against a stub proxy API and a stub browser backend,
+# and exits with status 1 if a task stalls on an expired lease or a proxy is
+# fetched twice for one launch.
+import sys
+from typing import List, Tuple
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from src.my_types import RobotTaskType, UserType
+from src.services import proxy_lease
+from src.services.service_robot import RobotService
+
+LEASE_TTL_S = 0.5
+
+
+class StubProxyApi:
+    """Stands in for get_proxy: every proxy is ready at once."""
+
+    def __init__(self):
+        self.fetches: List[str] = []
+
+    def __call__(self, proxy_url: str) -> dict:
+        self.fetches.append(proxy_url)
+        return {
+            "status": 100,
+            "data": {"server": proxy_url, "username": "user", "password": "pass"},
+        }
+
+
+class StubBackend:
+    """Finishes every task TASK_S after it is submitted, noting how many proxy
+    fetches were made by then. A task whose uid starts with "parked" is first
+    told its proxy is not ready for a second, as if the worker had fetched the
+    proxy itself."""
+
+    max_runtimes = 4
+    TASK_S = 0.2
+
+    def __init__(self, proxy_api: StubProxyApi):
+        self.proxy_api = proxy_api
+        self.submitted: List[Tuple[str, str, bool]] = []
+        self.fetches_at_finish: List[int] = []
+
+    def submit(self, worker):
+        uid = worker.task.user_info.uid
+        parked_before = any(submitted[0] == uid for submitted in self.submitted)
+        self.submitted.append((uid, worker.raw_proxy, worker.lease is not None))
+        if uid.startswith("parked") and not parked_before:
+            signal, args = worker.signals.proxy_not_ready_signal, (worker.raw_proxy, 1)
+        else:
+            signal, args = worker.signals.succeeded_signal, (worker.raw_proxy, "ok")
+
+        def finish():
+            self.fetches_at_finish.append(len(self.proxy_api.fetches))
+            signal.emit(worker.task, *args)
+
+        QTimer.singleShot(int(self.TASK_S * 1000), finish)
+
+    def shutdown(self):
+        pass
+
+
+def make_task(uid: str) -> RobotTaskType:
+    user = UserType(*([None, uid] + [None] * 14))
+    return RobotTaskType(user, "", True, False, "launch_browser", {})
+
+
+def wait(seconds: float):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def check(ok: bool, name: str, detail) -> int:
+    print(f"[{'OK' if ok else 'FAIL'}] {name}")
+    if not ok:
+        print(f"    {detail}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    app = QCoreApplication([])
+    proxy_api = StubProxyApi()
+    proxy_lease.get_proxy = proxy_api
+    proxy_lease.ProxyLeaseManager.LEASE_TTL_S = LEASE_TTL_S
+    service = RobotService()
+    service.backend = backend = StubBackend(proxy_api)
+    service.set_max_worker(1)
+    failures = 0
+
+    service.add_tasks([make_task("first")], ["proxy"])
+    wait(0.5)
+    # The lease prefetched once "first" returned its proxy expires unused.
+    wait(LEASE_TTL_S * 2)
+    service.add_tasks([make_task("after_expiry")], ["proxy"])
+    wait(0.5)
+    started = [submitted[0] for submitted in backend.submitted]
+    failures += check(
+        started == ["first", "after_expiry"] and backend.submitted[-1][2],
+        "a task starts on a fresh lease after the last one expired",
+        backend.submitted,
+    )
+
+    proxy_api.fetches.clear()
+    backend.submitted.clear()
+    backend.fetches_at_finish.clear()
+    service.add_tasks([make_task("parked")], ["proxy"])
+    wait(3.0)
+    failures += check(
+        [submitted[0] for submitted in backend.submitted] == ["parked", "parked"]
+        and not backend.submitted[-1][2],
+        "a parked task is started again without a lease",
+        backend.submitted,
+    )
+    # The proxy is fetched again once the task released it, not while the
+    # worker fetches it itself.
+    failures += check(
+        backend.fetches_at_finish == [0, 0] and service.check_if_done(),
+        "the proxy is not prefetched while the worker fetches it",
+        backend.fetches_at_finish,
+    )
+
+    print(f"{failures} check(s) failed.")
+    sys.exit(1 if failures else 0)
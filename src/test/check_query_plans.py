@@ -0,0 +1,74 @@
+# src/test/check_query_plans.py
+# Usage: python -m src.test.check_query_plans
+# Exits with status 1 if a hot query is not served by an index.
+import os
+import sys
+import tempfile
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtSql import QSqlDatabase
+
+from src import constants
+from src.database.migrations import explain_query_plan, is_index_backed
+
+HOT_USER_QUERIES = [
+    (f"SELECT * FROM {constants.TABLE_USER} WHERE id IN (?, ?)", (1, 2)),
+    (f"SELECT * FROM {constants.TABLE_USER} WHERE uid = ?", ("uid",)),
+    (f"SELECT id FROM {constants.TABLE_USER} WHERE status = ?", (0,)),
+    (f"SELECT id FROM {constants.TABLE_USER} WHERE user_group = ?", (1,)),
+    (f"SELECT id FROM {constants.TABLE_USER} WHERE type = ?", ("type",)),
+    (f"UPDATE {constants.TABLE_USER} SET status = ? WHERE id = ?", (1, 1)),
+    (f"DELETE FROM {constants.TABLE_USER} WHERE id IN (?, ?)", (1, 2)),
+    (f"SELECT * FROM {constants.TABLE_LISTED_PRODUCT} WHERE user_id = ?", (1,)),
+    (f"DELETE FROM {constants.TABLE_LISTED_PRODUCT} WHERE user_id IN (?, ?)", (1, 2)),
+    (f"SELECT * FROM {constants.TABLE_ROBOT_ACTION} WHERE uid = ?", ("uid",)),
+]
+HOT_PRODUCT_QUERIES = [
+    (f"SELECT * FROM {constants.TABLE_RE_PRODUCT} WHERE pid = ?", ("pid",)),
+    (f"SELECT id FROM {constants.TABLE_RE_PRODUCT} WHERE province = ?", (1,)),
+    (
+        f"SELECT id FROM {constants.TABLE_RE_PRODUCT} WHERE province = ? AND district = ?",
+        (1, 1),
+    ),
+    (f"SELECT id FROM {constants.TABLE_RE_PRODUCT} WHERE ward = ?", (1,)),
+    (f"SELECT id FROM {constants.TABLE_RE_PRODUCT} WHERE category = ?", (1,)),
+    (
+        f"SELECT id FROM {constants.TABLE_RE_PRODUCT} WHERE price BETWEEN ? AND ?",
+        (1.0, 2.0),
+    ),
+    (f"SELECT * FROM {constants.TABLE_MISC_PRODUCT} WHERE pid = ?", ("pid",)),
+    (f"SELECT * FROM {constants.TABLE_RE_TEMPLATE} WHERE tid = ?", ("tid",)),
+]
+
+
+def check_queries(db: QSqlDatabase, queries) -> int:
+    failures = 0
+    for sql, params in queries:
+        plan = explain_query_plan(db, sql, params)
+        ok = is_index_backed(plan)
+        failures += 0 if ok else 1
+        print(f"[{'OK' if ok else 'FULL SCAN'}] {sql}")
+        for detail in plan:
+            print(f"    {detail}")
+    return failures
+
+
+if __name__ == "__main__":
+    app = QApplication([])
+    db_dir = tempfile.mkdtemp()
+    constants.PATH_DB_USER = os.path.join(db_dir, "db_user.db")
+    constants.PATH_DB_PRODUCT = os.path.join(db_dir, "db_product.db")
+
+    from src.database.db_user import initialize_db_user
+    from src.database.db_product import initialize_db_product
+
+    if not initialize_db_user() or not initialize_db_product():
+        raise Exception("Initialize database failed!")
+    failures = check_queries(
+        QSqlDatabase.database(constants.CONNECTION_DB_USER), HOT_USER_QUERIES
+    )
+    failures += check_queries(
+        QSqlDatabase.database(constants.CONNECTION_DB_PRODUCT), HOT_PRODUCT_QUERIES
+    )
+    print(f"{failures} hot query(ies) without an index.")
+    sys.exit(1 if failures else 0)
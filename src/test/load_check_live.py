@@ -0,0 +1,81 @@
+# src/test/load_check_live.py
+# Usage: python -m src.test.load_check_live [uids] [latency_ms] [max_in_flight]
+# Load-tests the asyncio check-live engine offline: a StubTransport answers like
+# the picture endpoint from inside the event loop, so no socket is opened and the
+# run measures CheckLive, the worker and the Qt signal bridge on one core.
+import asyncio
+import json
+import sys
+import time
+from typing import Tuple
+from urllib.parse import urlsplit
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop
+
+from src.services.check_live import CheckLive
+
+
+class StubTransport:
+    """Answers after `latency_s`; with max_in_flight, answers 429 while more
+    requests are in progress, like a rate-limiting upstream."""
+
+    def __init__(self, latency_s: float = 0.05, max_in_flight: int = 0):
+        self.latency_s = latency_s
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+
+    async def fetch(self, url: str) -> Tuple[int, str]:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_s)
+            if 0 < self.max_in_flight < self.in_flight:
+                self.throttled += 1
+                return 429, json.dumps({"error": "rate limited"})
+            uid = urlsplit(url).path.strip("/").split("/")[0]
+            # Every uid ending in an even digit is live.
+            height = 50 if uid[-1:] in "02468" else 0
+            return 200, json.dumps({"data": {"height": height}})
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self):
+        pass
+
+
+if __name__ == "__main__":
+    app = QCoreApplication([])
+    uid_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    latency_s = (int(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+    max_in_flight = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    transport = StubTransport(latency_s, max_in_flight)
+    uids = [str(100000 + i) for i in range(uid_count)]
+
+    check_live = CheckLive(engine="asyncio", transport=transport)
+    check_live.MAX_CONCURRENCY = 1000
+    check_live.concurrency.maximum = check_live.MAX_CONCURRENCY
+    # Rate limiting is not what this run measures.
+    check_live.worker.host_rate_per_s = float("inf")
+    loop = QEventLoop()
+    check_live.all_tasks_finished.connect(loop.quit)
+    started_cpu = time.process_time()
+    started = time.perf_counter()
+    check_live.add_tasks(list(enumerate(uids)))
+    loop.exec()
+    elapsed = time.perf_counter() - started
+    cpu_s = time.process_time() - started_cpu
+
+    results = check_live.get_results()
+    live = sum(results.values())
+    print(
+        f"{uid_count} uids, {latency_s * 1000:.0f} ms stub latency: {elapsed:.2f}s wall, {cpu_s:.2f}s CPU "
+        f"({uid_count / elapsed:.0f} checks/s)\n"
+        f"  {len(results)} checked ({live} live), {len(check_live.get_failed())} failed, "
+        f"{transport.requests} requests, {transport.throttled} throttled, "
+        f"peak {transport.peak_in_flight} in flight, limit settled at {check_live.concurrency.limit}"
+    )
+    assert len(results) + len(check_live.get_failed()) == uid_count
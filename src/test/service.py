@@ -219,7 +219,7 @@ if __name__ == "__main__":
             )
         ]
         user_service.create(payload=payload[0])
-        for u in user_service.read_all():
+        for u in user_service.iter_all():
             print(u)
             print()
 
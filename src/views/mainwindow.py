@@ -1,6 +1,6 @@
 # src/views/mainwindow.py
 from typing import List, Optional
-from PyQt6.QtGui import QAction, QPixmap
+from PyQt6.QtGui import QAction, QCloseEvent, QPixmap
 from PyQt6.QtCore import Qt, QPoint, QSortFilterProxyModel, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QMessageBox, QMainWindow, QMenu, QDialog
 
@@ -63,7 +63,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.setMinimumSize(960, 540)
 
         self.page_re_product = PageREProduct(self)
-        self.page_user = PageUser(self.user_controller.service.model, self)
+        self.page_user = PageUser(
+            self.user_controller.service.model,
+            self,
+            search_service=self.user_controller.service.search_service,
+        )
         self.page_robot = PageRobot(
             self.user_controller.service.model,
             self.user_action_controller.service.model,
@@ -201,6 +205,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             selected_ids, headless=False, is_mobile=is_mobile
         )
 
-    @pyqtSlot(list)
-    def on_check_users(self, selected_ids: List[int]):
-        self.user_controller.handle_check_users(selected_ids)
+    @pyqtSlot(list, bool)
+    def on_check_users(self, selected_ids: List[int], force: bool):
+        self.user_controller.handle_check_users(selected_ids, force)
+
+    def closeEvent(self, event: QCloseEvent):
+        self.user_controller.shutdown()
+        self.robot_controller.shutdown()
+        super().closeEvent(event)
@@ -1,5 +1,5 @@
 # src/views/user/page_user.py
-from typing import List, Any
+from typing import List, Any, Dict, Optional, Set, Tuple
 from PyQt6.QtWidgets import QWidget, QMenu
 from PyQt6.QtCore import (
     Qt,
@@ -8,20 +8,58 @@ from PyQt6.QtCore import (
     QSortFilterProxyModel,
     QModelIndex,
     QVariant,
+    QTimer,
 )
 from PyQt6.QtGui import QAction
 
 from src.models.model_user import UserModel
+from src.services.service_search import SearchService
 
 from src.ui.page_user_ui import Ui_PageUser
 
 
 class MultiFieldFilterProxyModel(QSortFilterProxyModel):
     SERIAL_NUMBER_COLUMN_INDEX = 0
+    FILTER_DEBOUNCE_MS = 250
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.filters = {}
+        # Active filters: source column -> lowercase text.
+        self.filters: Dict[int, str] = {}
+        self._pending_filters: Dict[int, str] = {}
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        # When set, filters on indexed columns are answered by the FTS index.
+        self.search_service: Optional[SearchService] = None
+
+        # Lowercase display text per source column, built on first use after a reset.
+        self._column_cache: Dict[int, List[str]] = {}
+        # Source rows below _matched_until that pass self.filters, except
+        # _recheck_rows whose data changed since they were matched.
+        self._matched_rows: Set[int] = set()
+        self._matched_until = 0
+        self._recheck_rows: Set[int] = set()
+
+    def setSourceModel(self, source_model):
+        old_model = self.sourceModel()
+        if old_model is not None:
+            old_model.modelReset.disconnect(self._clear_filter_cache)
+            old_model.layoutChanged.disconnect(self._clear_filter_cache)
+            old_model.rowsRemoved.disconnect(self._clear_filter_cache)
+            old_model.rowsInserted.disconnect(self._on_source_rows_inserted)
+            old_model.dataChanged.disconnect(self._on_source_data_changed)
+        if source_model is not None:
+            # Connected before the base class so the cache is current by the time
+            # it re-runs filterAcceptsRow for the changed rows.
+            source_model.modelReset.connect(self._clear_filter_cache)
+            source_model.layoutChanged.connect(self._clear_filter_cache)
+            source_model.rowsRemoved.connect(self._clear_filter_cache)
+            source_model.rowsInserted.connect(self._on_source_rows_inserted)
+            source_model.dataChanged.connect(self._on_source_data_changed)
+        self._clear_filter_cache()
+        super().setSourceModel(source_model)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return super().columnCount(parent) + 1
@@ -62,19 +100,142 @@ class MultiFieldFilterProxyModel(QSortFilterProxyModel):
             return
         super().sort(column - 1, order)
 
+    def set_search_service(self, search_service: Optional[SearchService]):
+        self.search_service = search_service
+        self.filters = {}
+        self.apply_filters()
+
     def set_filter(self, column, text):
-        self.filters[column] = text.lower()
+        """Queues a filter change; filters are applied FILTER_DEBOUNCE_MS after the
+        last keystroke."""
+        self._pending_filters[column] = text.lower()
+        self._filter_timer.start()
+
+    def apply_filters(self):
+        """Applies the queued filters now. When every active filter only got longer,
+        only the rows matching the previous filters are tested again."""
+        self._filter_timer.stop()
+        new_filters = {
+            column: text
+            for column, text in {**self.filters, **self._pending_filters}.items()
+            if text and column != -1
+        }
+        self._pending_filters = {}
+        if new_filters == self.filters:
+            return
+
+        row_count = self.sourceModel().rowCount() if self.sourceModel() else 0
+        is_narrowing = bool(self.filters) and all(
+            text in new_filters.get(column, "") for column, text in self.filters.items()
+        )
+        if is_narrowing:
+            candidates = self._matched_rows | self._recheck_rows
+            candidates.update(range(self._matched_until, row_count))
+        else:
+            candidates = range(row_count)
+
+        self.filters = new_filters
+        self._matched_rows = set()
+        if new_filters:
+            search_ids, searched_columns = self._search(new_filters)
+            if search_ids is not None:
+                id_values = self._column_values(self.sourceModel().fieldIndex("id"))
+            columns = [
+                (self._column_values(column), text)
+                for column, text in new_filters.items()
+                if column not in searched_columns
+            ]
+            self._matched_rows = {
+                row
+                for row in candidates
+                if (search_ids is None or id_values[row] in search_ids)
+                and all(text in values[row] for values, text in columns)
+            }
+        self._matched_until = row_count
+        self._recheck_rows = set()
         self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row, source_parent):
+        if not self.filters:
+            return True
+        if source_row < self._matched_until and source_row not in self._recheck_rows:
+            return source_row in self._matched_rows
+        accepted = all(
+            text in self._column_values(column)[source_row]
+            for column, text in self.filters.items()
+        )
+        self._recheck_rows.discard(source_row)
+        if accepted:
+            self._matched_rows.add(source_row)
+        else:
+            self._matched_rows.discard(source_row)
+        return accepted
+
+    def _search(self, filters: Dict[int, str]) -> Tuple[Optional[Set[str]], Set[int]]:
+        """Runs the filters on indexed columns through the search service.
+        Returns the matching ids (as cached id text, None when nothing was searched)
+        and the columns that were handled."""
+        model = self.sourceModel()
+        if self.search_service is None or model.fieldIndex("id") == -1:
+            return None, set()
+        field_filters = {}
+        searched_columns = set()
+        for column, text in filters.items():
+            field_name = model.record().fieldName(column)
+            if field_name in self.search_service.columns:
+                field_filters[field_name] = text
+                searched_columns.add(column)
+        if not field_filters:
+            return None, set()
+        ids = self.search_service.search_fields(field_filters)
+        return {str(record_id) for record_id in ids}, searched_columns
+
+    # ========================================================================
+    # Filter cache maintenance
+    # ========================================================================
+    def _column_values(self, column: int) -> List[str]:
+        values = self._column_cache.get(column)
+        if values is None:
+            model = self.sourceModel()
+            values = [
+                self._normalized(model, row, column) for row in range(model.rowCount())
+            ]
+            self._column_cache[column] = values
+        return values
+
+    @staticmethod
+    def _normalized(model, row: int, column: int) -> str:
+        return str(
+            model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+        ).lower()
+
+    def _clear_filter_cache(self, *args):
+        self._column_cache = {}
+        self._matched_rows = set()
+        self._matched_until = 0
+        self._recheck_rows = set()
+
+    def _on_source_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        model = self.sourceModel()
+        if last != model.rowCount() - 1:
+            self._clear_filter_cache()
+            return
+        # Appended rows (e.g. fetchMore) leave the existing rows in place.
+        for column, values in self._column_cache.items():
+            values.extend(
+                self._normalized(model, row, column) for row in range(first, last + 1)
+            )
+
+    def _on_source_data_changed(
+        self, top_left: QModelIndex, bottom_right: QModelIndex, roles=None
+    ):
         model = self.sourceModel()
-        for column, text in self.filters.items():
-            if text:
-                index = model.index(source_row, column, source_parent)
-                data = str(model.data(index, Qt.ItemDataRole.DisplayRole)).lower()
-                if text not in data:
-                    return False
-        return True
+        rows = range(top_left.row(), bottom_right.row() + 1)
+        for column, values in self._column_cache.items():
+            if top_left.column() <= column <= bottom_right.column():
+                for row in rows:
+                    values[row] = self._normalized(model, row, column)
+        self._recheck_rows.update(rows)
 
 
 class PageUser(QWidget, Ui_PageUser):
@@ -84,13 +245,19 @@ class PageUser(QWidget, Ui_PageUser):
     updated_users_signal = pyqtSignal(list)
     deleted_users_signal = pyqtSignal(list)
     launch_users_signal = pyqtSignal(list, bool)
-    check_users_signal = pyqtSignal(list)
+    check_users_signal = pyqtSignal(list, bool)
 
-    def __init__(self, user_model: UserModel, parent=None):
+    def __init__(
+        self,
+        user_model: UserModel,
+        parent=None,
+        search_service: Optional[SearchService] = None,
+    ):
         super(PageUser, self).__init__(parent)
         self.user_model = user_model
         self.proxy_model = MultiFieldFilterProxyModel()
         self.proxy_model.setSourceModel(self.user_model)
+        self.proxy_model.set_search_service(search_service)
 
         self.setupUi(self)
         self.setWindowTitle("User")
@@ -126,6 +293,7 @@ class PageUser(QWidget, Ui_PageUser):
             launch_as_desktop_action = QAction("Launch as desktop", self)
             launch_as_mobile_action = QAction("Launch as mobile", self)
             check_action = QAction("Check live", self)
+            force_check_action = QAction("Check live (ignore cache)", self)
             edit_action = QAction("Edit", self)
             delete_action = QAction("Delete", self)
 
@@ -138,6 +306,9 @@ class PageUser(QWidget, Ui_PageUser):
             check_action.triggered.connect(
                 lambda: self.on_item_context_clicked("check")
             )
+            force_check_action.triggered.connect(
+                lambda: self.on_item_context_clicked("force-check")
+            )
             edit_action.triggered.connect(lambda: self.on_item_context_clicked("edit"))
             delete_action.triggered.connect(
                 lambda: self.on_item_context_clicked("delete")
@@ -145,6 +316,7 @@ class PageUser(QWidget, Ui_PageUser):
             menu.addAction(launch_as_desktop_action)
             menu.addAction(launch_as_mobile_action)
             menu.addAction(check_action)
+            menu.addAction(force_check_action)
             menu.addAction(edit_action)
             menu.addAction(delete_action)
 
@@ -156,6 +328,7 @@ class PageUser(QWidget, Ui_PageUser):
             "launch-desktop": self.launch_users_signal,
             "launch-mobile": self.launch_users_signal,
             "check": self.check_users_signal,
+            "force-check": self.check_users_signal,
             "edit": self.updated_users_signal,
             "delete": self.deleted_users_signal,
         }
@@ -164,6 +337,10 @@ class PageUser(QWidget, Ui_PageUser):
                 action_method[action_name].emit(selected_ids, False)
             elif action_name == "launch-mobile":
                 action_method[action_name].emit(selected_ids, True)
+            elif action_name == "check":
+                action_method[action_name].emit(selected_ids, False)
+            elif action_name == "force-check":
+                action_method[action_name].emit(selected_ids, True)
             else:
                 action_method[action_name].emit(selected_ids)
 